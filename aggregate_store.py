@@ -0,0 +1,295 @@
+"""Penyimpanan agregat inkremental untuk tab Beranda.
+
+Setiap bulan menyimpan jumlah dan total berjalan (jumlah respon, jumlah puas,
+durasi, rating, kelompok usia, frekuensi login), sehingga dashboard dapat
+dirender dalam waktu konstan berapa pun ukuran data respon. Respon baru yang
+ditambahkan ke file CSV cukup diproses sekali; posisi byte terakhir setiap file
+dicatat agar baris lama tidak dihitung ulang, beserta fingerprint isi file
+sampai posisi tersebut. Jika file menyusut atau ditulis ulang, ingest gagal
+alih-alih menghitung ulang baris lama; bangun ulang store dengan --rebuild.
+
+Contoh:
+    python aggregate_store.py ingest dataset_kepuasan_pengguna_elearning.csv
+    python aggregate_store.py ingest --rebuild dataset_kepuasan_pengguna_elearning.csv
+    python aggregate_store.py show
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from artifacts import TARGET
+
+# numpy/pandas diimpor di dalam fungsi yang memprosesnya, sehingga dashboard
+# dapat membaca store dan merender Beranda tanpa memuat pandas
+STORE_FILE = 'aggregate_store.json'
+DATASET_FILE = 'dataset_kepuasan_pengguna_elearning.csv'
+
+# Kolom tanggal opsional; jika tidak ada, respon dicatat pada bulan saat diproses
+DATE_COLS = ['tanggal', 'timestamp', 'waktu_respon']
+
+# Fingerprint sumber: awal file dan bagian tepat sebelum posisi byte tersimpan
+HEAD_BYTES = 64 * 1024
+TAIL_BYTES = 4096
+
+RATING_COLS = ['kualitas_materi', 'kemudahan_penggunaan', 'stabilitas_aplikasi', 'interaksi_pengajar']
+RATING_LABELS = ['Kualitas Materi', 'Kemudahan Penggunaan', 'Stabilitas Sistem', 'Dukungan Pengajar']
+
+AGE_BINS = [25, 30, 35]
+AGE_LABELS = ['18-24', '25-29', '30-34', '35+']
+
+# Indeks = frekuensi login per minggu (1-7) dikurangi 1
+FREQ_GROUPS = {
+    'Setiap hari': [6],
+    '4-6x/minggu': [3, 4, 5],
+    '2-3x/minggu': [1, 2],
+    '< 2x/minggu': [0],
+}
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+
+# Durasi (jam/hari) yang dianggap penggunaan tinggi
+HEAVY_USAGE_HOURS = 4
+
+
+def empty_month():
+    """Agregat kosong untuk satu bulan"""
+    return {
+        'count': 0,
+        'labeled': 0,
+        'satisfied': 0,
+        'durasi_sum': 0.0,
+        'durasi_n': 0,
+        'rating_sum': [0.0] * len(RATING_COLS),
+        'rating_n': [0] * len(RATING_COLS),
+        'age': [0] * len(AGE_LABELS),
+        'login': [0] * 7,
+        'heavy_labeled': 0,
+        'heavy_satisfied': 0,
+    }
+
+
+def month_keys(df, default_month):
+    """Kunci bulan 'YYYY-MM' untuk setiap baris"""
+    import pandas as pd
+    for col in DATE_COLS:
+        if col in df.columns:
+            dates = pd.to_datetime(df[col], errors='coerce')
+            return dates.dt.strftime('%Y-%m').fillna(default_month)
+    return pd.Series(default_month, index=df.index)
+
+
+def aggregate_frame(df):
+    """Agregat satu kelompok baris (satu bulan) secara vektor"""
+    import numpy as np
+    import pandas as pd
+    agg = empty_month()
+    agg['count'] = int(len(df))
+
+    if TARGET in df.columns:
+        label = df[TARGET]
+        agg['labeled'] = int(label.notnull().sum())
+        agg['satisfied'] = int((label == 1).sum())
+    else:
+        label = pd.Series(np.nan, index=df.index)
+
+    durasi = df['durasi_penggunaan']
+    agg['durasi_sum'] = float(durasi.sum())
+    agg['durasi_n'] = int(durasi.notnull().sum())
+
+    heavy = durasi >= HEAVY_USAGE_HOURS
+    agg['heavy_labeled'] = int((heavy & label.notnull()).sum())
+    agg['heavy_satisfied'] = int((heavy & (label == 1)).sum())
+
+    for i, col in enumerate(RATING_COLS):
+        agg['rating_sum'][i] = float(df[col].sum())
+        agg['rating_n'][i] = int(df[col].notnull().sum())
+
+    usia = df['usia'].dropna().to_numpy()
+    agg['age'] = np.bincount(np.searchsorted(AGE_BINS, usia, side='right'),
+                             minlength=len(AGE_LABELS)).tolist()
+
+    login = df['frekuensi_login'].dropna().to_numpy().astype(np.int64)
+    agg['login'] = np.bincount(np.clip(login, 1, 7) - 1, minlength=7).tolist()
+    return agg
+
+
+def merge_month(target, agg):
+    """Menambahkan agregat ke agregat bulan yang sudah ada"""
+    for key, value in agg.items():
+        if isinstance(value, list):
+            target[key] = [a + b for a, b in zip(target[key], value)]
+        else:
+            target[key] += value
+
+
+def fingerprint(file, offset):
+    """Hash SHA-256 awal file dan TAIL_BYTES sebelum offset (file biner yang terbuka)
+
+    Tetap sama selama file hanya ditambah di akhir; berubah jika isi sebelum
+    offset ditulis ulang.
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    digest.update(file.read(min(offset, HEAD_BYTES)))
+    start = max(offset - TAIL_BYTES, 0)
+    file.seek(start)
+    digest.update(file.read(offset - start))
+    return digest.hexdigest()
+
+
+class AggregateStore:
+    """Agregat per bulan yang diperbarui secara inkremental"""
+
+    def __init__(self, months=None, sources=None):
+        self.months = months or {}
+        self.sources = sources or {}
+
+    @classmethod
+    def load(cls, path=STORE_FILE):
+        with open(path) as file:
+            state = json.load(file)
+        return cls(state['months'], state.get('sources', {}))
+
+    def save(self, path=STORE_FILE):
+        """Menulis store secara atomik (tulis ke file sementara lalu rename)"""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'months': self.months, 'sources': self.sources}, file)
+        os.replace(tmp_path, path)
+
+    def update(self, df, month=None):
+        """Menambahkan respon baru; baris tanpa tanggal dicatat pada bulan ini"""
+        default_month = month or datetime.now().strftime('%Y-%m')
+        for key, group in df.groupby(month_keys(df, default_month), sort=False):
+            merge_month(self.months.setdefault(key, empty_month()), aggregate_frame(group))
+
+    def ingest_csv(self, path, chunksize=500_000):
+        """Memproses baris CSV yang belum pernah dibaca (mulai dari posisi byte terakhir)
+
+        ValueError jika file lebih pendek dari posisi tersimpan atau isinya
+        sebelum posisi itu berubah: baris yang sudah dihitung tidak dapat
+        dipisahkan lagi dari agregat bulanan, jadi store harus dibangun ulang.
+        """
+        import pandas as pd
+        key = os.path.abspath(path)
+        source = self.sources.get(key, {'offset': 0, 'fingerprint': None})
+        if isinstance(source, int):
+            # Store lama hanya menyimpan posisi byte
+            source = {'offset': source, 'fingerprint': None}
+        offset = source['offset']
+        header = pd.read_csv(path, nrows=0).columns.tolist()
+        rows = 0
+
+        with open(path, 'rb') as file:
+            end = file.seek(0, os.SEEK_END)
+            if end < offset or (offset and source['fingerprint'] is not None
+                                and fingerprint(file, offset) != source['fingerprint']):
+                raise ValueError(f"{path} berubah sejak ingest terakhir (bukan hanya ditambah "
+                                 f"baris baru); bangun ulang store dengan --rebuild")
+            if end > offset:
+                file.seek(offset)
+                if offset:
+                    reader = pd.read_csv(file, names=header, header=None, chunksize=chunksize)
+                else:
+                    reader = pd.read_csv(file, chunksize=chunksize)
+                for chunk in reader:
+                    self.update(chunk)
+                    rows += len(chunk)
+                end = file.tell()
+            self.sources[key] = {'offset': end, 'fingerprint': fingerprint(file, end)}
+        return rows
+
+    def summary(self, n_months=6):
+        """Semua angka yang dibutuhkan tab Beranda (waktu konstan terhadap jumlah respon)"""
+        total = empty_month()
+        for agg in self.months.values():
+            merge_month(total, agg)
+
+        keys = sorted(self.months)[-n_months:]
+        trend_satisfied, trend_unsatisfied = [], []
+        for k in keys:
+            month = self.months[k]
+            rate = 100 * month['satisfied'] / month['labeled'] if month['labeled'] else 0.0
+            trend_satisfied.append(rate)
+            trend_unsatisfied.append(100 - rate if month['labeled'] else 0.0)
+        ratings = [s / n if n else 0.0 for s, n in zip(total['rating_sum'], total['rating_n'])]
+
+        summary = {
+            'total': total['count'],
+            'satisfaction_rate': 100 * total['satisfied'] / total['labeled'] if total['labeled'] else 0.0,
+            'avg_durasi': total['durasi_sum'] / total['durasi_n'] if total['durasi_n'] else 0.0,
+            'heavy_satisfaction_rate': (100 * total['heavy_satisfied'] / total['heavy_labeled']
+                                        if total['heavy_labeled'] else 0.0),
+            'months': [MONTH_NAMES[int(k[5:]) - 1] for k in keys],
+            'trend_satisfied': trend_satisfied,
+            'trend_unsatisfied': trend_unsatisfied,
+            'rating_labels': RATING_LABELS,
+            'ratings': ratings,
+            'age_labels': AGE_LABELS,
+            'age_counts': total['age'],
+            'freq_labels': list(FREQ_GROUPS),
+            'freq_counts': [sum(total['login'][i] for i in idx) for idx in FREQ_GROUPS.values()],
+            'current_month_count': self.months[keys[-1]]['count'] if keys else 0,
+            'count_growth': None,
+            'satisfaction_change': None,
+        }
+
+        if len(keys) >= 2:
+            previous, current = self.months[keys[-2]], self.months[keys[-1]]
+            if previous['count']:
+                summary['count_growth'] = 100 * (current['count'] - previous['count']) / previous['count']
+            if previous['labeled'] and current['labeled']:
+                summary['satisfaction_change'] = trend_satisfied[-1] - trend_satisfied[-2]
+        return summary
+
+
+def load_or_build(path=STORE_FILE, csv_path=DATASET_FILE):
+    """Membuka store; jika belum ada, dibangun dari dataset bawaan"""
+    if os.path.exists(path):
+        return AggregateStore.load(path)
+    store = AggregateStore()
+    if os.path.exists(csv_path):
+        store.ingest_csv(csv_path)
+        store.save(path)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Agregat inkremental untuk dashboard Beranda")
+    sub = parser.add_subparsers(dest='command', required=True)
+    ingest = sub.add_parser('ingest', help="Proses respon baru dari file CSV")
+    ingest.add_argument('csv', nargs='+')
+    ingest.add_argument('--rebuild', action='store_true',
+                        help="Mulai dari store kosong dan proses ulang semua file yang diberikan")
+    ingest.add_argument('--chunksize', type=int, default=500_000)
+    sub.add_parser('show', help="Tampilkan ringkasan agregat")
+    parser.add_argument('--store', default=STORE_FILE)
+    args = parser.parse_args(argv)
+
+    rebuild = args.command == 'ingest' and args.rebuild
+    store = (AggregateStore.load(args.store) if os.path.exists(args.store) and not rebuild
+             else AggregateStore())
+
+    if args.command == 'ingest':
+        for path in args.csv:
+            start = time.perf_counter()
+            try:
+                rows = store.ingest_csv(path, chunksize=args.chunksize)
+            except ValueError as e:
+                print(f"✗ {e}")
+                return 1
+            seconds = time.perf_counter() - start
+            print(f"✓ {path}: {rows} respon baru diproses dalam {seconds:.2f} detik")
+        store.save(args.store)
+        print(f"✓ Agregat disimpan ke {args.store}")
+    else:
+        print(json.dumps(store.summary(), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,17 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import pickle
+import io
+import os
+import time
 from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
+
+# Modul ringan saja: Beranda dirender tanpa pandas. pandas diimpor setelah
+# Beranda, engine inferensi dan artefak dimuat di latar oleh warmup.py
+from aggregate_store import HEAVY_USAGE_HOURS, STORE_FILE, load_or_build
+from artifacts import MODEL_FILES
+from charts import create_distribution_pie, create_ratings_chart, create_trend_chart
+from figure_cache import feature_comparison, gauge_chart, static_figure, whatif_chart
+from instrumentation import observe, registry, span
+from warmup import Warmup
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -199,131 +206,89 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Fungsi untuk memuat model
+# Pemanasan modul dan artefak di thread latar belakang
+def load_initial_models():
+    """Set model awal untuk registry (dijalankan oleh thread warm-up)"""
+    from model_registry import load_model_set
+    return load_model_set()
+
 @st.cache_resource
-def load_model(model_name):
-    """Memuat model yang sudah dilatih"""
-    try:
-        with open(f'{model_name}.pkl', 'rb') as file:
-            model = pickle.load(file)
-        return model
-    except FileNotFoundError:
-        st.error(f"Model {model_name} tidak ditemukan. Silakan jalankan train_model.py terlebih dahulu.")
-        return None
+def start_warmup():
+    """Memulai pemuatan artefak satu kali per proses"""
+    return Warmup(load_initial_models).start()
 
-# Fungsi untuk memuat scaler dan encoder
+# Registry model dengan hot-reload setelah training ulang
 @st.cache_resource
-def load_preprocessors():
-    """Memuat scaler dan encoder"""
-    try:
-        with open('scaler.pkl', 'rb') as file:
-            scaler = pickle.load(file)
-        with open('label_encoder.pkl', 'rb') as file:
-            label_encoder = pickle.load(file)
-        return scaler, label_encoder
-    except FileNotFoundError:
+def load_registry():
+    """Registry model satu kali per proses; set awal berasal dari warm-up"""
+    from model_registry import ModelRegistry
+    return ModelRegistry(start_warmup().result()).watch()
+
+# Fungsi untuk memuat model, scaler, encoder, dan engine NumPy
+def load_models():
+    """Set artefak aktif (dari bundle jika tersedia, tanpa sklearn)
+
+    Diambil sekali per prediksi: model, scaler, encoder, engine, dan
+    fingerprint selalu berasal dari set yang sama meskipun set baru dipasang
+    di tengah prediksi. Jika prediction cube tersedia, engine menjawab input
+    di dalam grid slider dengan lookup.
+    """
+    models = load_registry().current()
+    if models.scaler is None or models.label_encoder is None:
         st.warning("File preprocessor tidak ditemukan. Menggunakan preprocessing default.")
-        return None, None
+    return models
+
+# Histogram drift input dan prediksi yang dipakai bersama oleh semua sesi
+@st.cache_resource
+def load_drift_monitor():
+    """Monitor drift satu kali per proses dengan referensi dari train_model.py"""
+    from drift_monitor import DriftMonitor
+    return DriftMonitor.load()
+
+# Log prediksi biner dengan flusher di latar (satu per proses)
+@st.cache_resource
+def load_prediction_log():
+    """Membuka log prediksi dan memulai thread flusher-nya"""
+    from prediction_log import PredictionLog
+    return PredictionLog.open()
+
+# Cache prediksi yang dipakai bersama oleh semua sesi
+@st.cache_resource
+def load_prediction_cache():
+    """Membuat cache prediksi LRU satu kali per proses"""
+    from prediction_cache import PredictionCache
+    return PredictionCache(maxsize=10_000)
+
+# Fungsi untuk memuat ringkasan dashboard dari aggregate store
+@st.cache_data
+def load_dashboard_summary(version):
+    """Ringkasan Beranda; dihitung ulang hanya jika file store berubah"""
+    return load_or_build().summary()
+
+def store_version():
+    """Versi aggregate store berdasarkan waktu modifikasi file"""
+    try:
+        return os.path.getmtime(STORE_FILE)
+    except OSError:
+        return None
+
+# Format angka gaya Indonesia (2.547 dan 3,2)
+def format_number(value):
+    return f"{value:,}".replace(",", ".")
+
+def format_decimal(value, digits=1):
+    return f"{value:.{digits}f}".replace(".", ",")
 
 # Fungsi untuk preprocessing input
 def preprocess_input(data, scaler=None, label_encoder=None):
     """Preprocessing data input sebelum prediksi"""
-    df = pd.DataFrame([data])
-    
-    # Encode jenis kelamin SEBELUM scaling
-    if label_encoder:
-        df['jenis_kelamin'] = label_encoder.transform(df['jenis_kelamin'])
-    else:
-        df['jenis_kelamin'] = df['jenis_kelamin'].map({'L': 0, 'P': 1})
-    
-    # Pastikan urutan kolom sesuai dengan training
-    # Urutan: usia, jenis_kelamin, durasi_penggunaan, frekuensi_login, 
-    #         kualitas_materi, kemudahan_penggunaan, stabilitas_aplikasi, interaksi_pengajar
-    expected_cols = ['usia', 'jenis_kelamin', 'durasi_penggunaan', 'frekuensi_login', 
-                     'kualitas_materi', 'kemudahan_penggunaan', 'stabilitas_aplikasi', 
-                     'interaksi_pengajar']
-    
-    df = df[expected_cols]
-    
-    # Scale semua fitur jika scaler tersedia
-    if scaler:
-        df_scaled = pd.DataFrame(
-            scaler.transform(df),
-            columns=expected_cols
-        )
-        return df_scaled
-    
-    return df
-
-# Fungsi untuk membuat gauge chart
-def create_gauge_chart(probability, title="Tingkat Kepercayaan"):
-    """Membuat gauge chart untuk menampilkan probabilitas"""
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=probability * 100,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': title, 'font': {'size': 24}},
-        delta={'reference': 50, 'increasing': {'color': "green"}},
-        gauge={
-            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-            'bar': {'color': "darkblue"},
-            'bgcolor': "white",
-            'borderwidth': 2,
-            'bordercolor': "gray",
-            'steps': [
-                {'range': [0, 33], 'color': '#ffebee'},
-                {'range': [33, 66], 'color': '#fff9c4'},
-                {'range': [66, 100], 'color': '#e8f5e9'}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 50
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=20)
-    )
-    
-    return fig
-
-# Fungsi untuk membuat bar chart perbandingan fitur
-def create_feature_comparison(data):
-    """Membuat bar chart untuk perbandingan fitur input"""
-    features = ['kualitas_materi', 'kemudahan_penggunaan', 
-                'stabilitas_aplikasi', 'interaksi_pengajar']
-    values = [data[f] for f in features]
-    labels = ['Kualitas Materi', 'Kemudahan Penggunaan', 
-              'Stabilitas Aplikasi', 'Interaksi Pengajar']
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=labels,
-            y=values,
-            marker_color=['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6'],
-            text=values,
-            textposition='auto',
-        )
-    ])
-    
-    fig.update_layout(
-        title="Penilaian Platform (Skala 1-5)",
-        xaxis_title="Kategori Penilaian",
-        yaxis_title="Rating",
-        yaxis=dict(range=[0, 5.5]),
-        height=350,
-        showlegend=False,
-        font=dict(family="Inter, sans-serif")
-    )
-    
-    return fig
+    # Satu baris input diproses dengan jalur yang sama seperti prediksi batch
+    from batch_predict import preprocess_batch
+    return preprocess_batch(pd.DataFrame([data]), scaler, label_encoder)
 
 # Fungsi interpretasi hasil
-def interpret_prediction(prediction, probability, data):
-    """Memberikan interpretasi hasil prediksi"""
+def interpret_prediction(prediction, probability, explanation=None):
+    """Memberikan interpretasi hasil prediksi beserta kontribusi fitur terurut"""
     interpretation = []
     
     if prediction == 1:
@@ -333,40 +298,282 @@ def interpret_prediction(prediction, probability, data):
         interpretation.append("**Prediksi: PENGGUNA TIDAK PUAS**")
         interpretation.append(f"Tingkat keyakinan: **{(1-probability)*100:.1f}%**")
     
-    # Analisis faktor
-    interpretation.append("\n**Faktor-faktor Penting:**")
+    if explanation is None:
+        return "\n".join(interpretation)
     
-    if data['kualitas_materi'] >= 4:
-        interpretation.append("- Kualitas materi dinilai baik oleh pengguna")
-    elif data['kualitas_materi'] <= 2:
-        interpretation.append("- Kualitas materi perlu ditingkatkan")
-    
-    if data['kemudahan_penggunaan'] >= 4:
-        interpretation.append("- Platform mudah digunakan")
-    elif data['kemudahan_penggunaan'] <= 2:
-        interpretation.append("- Kemudahan penggunaan masih kurang optimal")
+    # Kontribusi dari model: log-odds (logreg) atau poin probabilitas (tree)
+    from explanations import FEATURE_LABELS
+    if explanation['unit'] == 'log-odds':
+        def fmt(value):
+            return f"{value:+.2f}"
+        base_text = f"log-odds dasar {explanation['base']:+.2f} (input rata-rata data training)"
+    else:
+        def fmt(value):
+            return f"{value*100:+.1f} poin"
+        base_text = f"probabilitas puas dasar {explanation['base']*100:.1f}% (seluruh data training)"
     
-    if data['stabilitas_aplikasi'] >= 4:
-        interpretation.append("- Stabilitas sistem berjalan dengan baik")
-    elif data['stabilitas_aplikasi'] <= 2:
-        interpretation.append("- Ditemukan masalah pada stabilitas sistem")
+    interpretation.append("\n**Kontribusi Fitur:**")
+    for rank, (col, value, contribution) in enumerate(explanation['factors'], start=1):
+        direction = "menuju Puas" if contribution > 0 else "menuju Tidak Puas"
+        interpretation.append(f"{rank}. {FEATURE_LABELS[col]} ({value}): **{fmt(contribution)}** {direction}")
+    interpretation.append(f"\n_Dihitung dari {base_text}._")
     
-    if data['interaksi_pengajar'] >= 4:
-        interpretation.append("- Interaksi dengan pengajar berlangsung baik")
-    elif data['interaksi_pengajar'] <= 2:
-        interpretation.append("- Perlu peningkatan dalam interaksi pengajar")
+    return "\n".join(interpretation)
+
+# Panel prediksi: form input, ringkasan, dan hasil. Sebagai st.fragment
+# (Streamlit >= 1.37) submit form hanya menjalankan ulang panel ini, bukan
+# CSS, Beranda, atau prediksi batch.
+@st.fragment
+def prediction_panel(model_choice, ensemble_weights=None):
+    """Form input dan hasil prediksi untuk satu model, dibandingkan dengan model lain"""
+    col1, col2 = st.columns([1, 1])
+    whatif = None
     
-    if data['frekuensi_login'] >= 5:
-        interpretation.append("- Pengguna aktif dengan frekuensi login tinggi")
-    elif data['frekuensi_login'] <= 2:
-        interpretation.append("- Frekuensi login relatif rendah")
+    with col1:
+        # Semua input dikirim sekaligus saat tombol Prediksi ditekan
+        with st.form("prediction_form"):
+            st.markdown("### Parameter Input")
+            
+            # Input demografis
+            usia = st.slider("Usia:", 18, 50, 25)
+            jenis_kelamin = st.selectbox(
+                "Jenis Kelamin:",
+                ["L", "P"],
+                format_func=lambda x: "Laki-laki" if x == "L" else "Perempuan"
+            )
+            
+            # Pola penggunaan
+            durasi_penggunaan = st.slider("Penggunaan Harian (jam):", 0.0, 8.0, 3.0, 0.5)
+            frekuensi_login = st.slider("Login per Minggu:", 1, 7, 4)
+            
+            # Penilaian
+            kualitas_materi = st.slider("Kualitas Materi:", 1, 5, 3)
+            kemudahan_penggunaan = st.slider("Kemudahan Penggunaan:", 1, 5, 3)
+            stabilitas_aplikasi = st.slider("Stabilitas Aplikasi:", 1, 5, 3)
+            interaksi_pengajar = st.slider("Interaksi Pengajar:", 1, 5, 3)
+            
+            # Tombol prediksi
+            predict_button = st.form_submit_button("Prediksi", type="primary",
+                                                   use_container_width=True)
+        
+        st.markdown("### Ringkasan Input")
+        
+        input_data = {
+            'usia': usia,
+            'jenis_kelamin': jenis_kelamin,
+            'durasi_penggunaan': durasi_penggunaan,
+            'frekuensi_login': frekuensi_login,
+            'kualitas_materi': kualitas_materi,
+            'kemudahan_penggunaan': kemudahan_penggunaan,
+            'stabilitas_aplikasi': stabilitas_aplikasi,
+            'interaksi_pengajar': interaksi_pengajar
+        }
+        
+        display_data = {
+            'Parameter': [
+                'Usia', 'Jenis Kelamin', 'Penggunaan Harian', 'Frekuensi Login',
+                'Kualitas Materi', 'Kemudahan Penggunaan', 'Stabilitas', 'Interaksi Pengajar'
+            ],
+            'Nilai': [
+                f"{usia} tahun",
+                "Laki-laki" if jenis_kelamin == "L" else "Perempuan",
+                f"{durasi_penggunaan} jam/hari",
+                f"{frekuensi_login}x/minggu",
+                f"{kualitas_materi}/5",
+                f"{kemudahan_penggunaan}/5",
+                f"{stabilitas_aplikasi}/5",
+                f"{interaksi_pengajar}/5"
+            ]
+        }
+        
+        st.dataframe(
+            pd.DataFrame(display_data),
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Visualisasi fitur penilaian
+        st.plotly_chart(feature_comparison(input_data), use_container_width=True)
     
-    if data['durasi_penggunaan'] >= 4:
-        interpretation.append("- Durasi penggunaan harian cukup tinggi")
-    elif data['durasi_penggunaan'] <= 2:
-        interpretation.append("- Durasi penggunaan masih terbatas")
+    with col2:
+        st.markdown("### Hasil Prediksi")
+        
+        if predict_button:
+            model_file = MODEL_FILES[model_choice]
+            with span('predict.load'):
+                models = load_models()
+                model = models.models.get(model_file)
+                scaler, label_encoder = models.scaler, models.label_encoder
+                engine = models.engines.get(model_file)
+            
+            if model is not None:
+                def run_prediction():
+                    if engine is not None:
+                        # Kelas dan probabilitas dari satu kali scoring (preprocessing menyatu)
+                        with span('predict.predict'):
+                            return engine.predict_one(input_data)
+                    with span('predict.preprocess'):
+                        X = preprocess_input(input_data, scaler, label_encoder)
+                    with span('predict.predict'):
+                        from inference_engine import sklearn_predict_proba
+                        return model.predict(X)[0], sklearn_predict_proba(model, X)[0]
+                
+                try:
+                    prediction_cache = load_prediction_cache()
+                    prediction, probability = prediction_cache.get_or_compute(
+                        models.fingerprint, model_file, input_data, run_prediction
+                    )
+                    drift = load_drift_monitor()
+                    if engine is not None:
+                        x = engine.encode(input_data)
+                        drift.observe_one(x, model_file, prediction)
+                        # Hanya masuk antrean; penulisan ke disk oleh thread flusher
+                        load_prediction_log().log(x, model_file, prediction, probability[1])
+                    
+                    # Result box
+                    render_start = time.perf_counter()
+                    if prediction == 1:
+                        st.markdown(
+                            '<div class="prediction-box satisfied">PUAS</div>',
+                            unsafe_allow_html=True
+                        )
+                    else:
+                        st.markdown(
+                            '<div class="prediction-box not-satisfied">TIDAK PUAS</div>',
+                            unsafe_allow_html=True
+                        )
+                    
+                    # Gauge chart
+                    prob_satisfied = probability[1]
+                    st.plotly_chart(
+                        gauge_chart(prob_satisfied, "Tingkat Keyakinan"),
+                        use_container_width=True
+                    )
+                    
+                    # Analysis
+                    st.markdown("**Analisis Faktor:**")
+                    explanation = None
+                    if engine is not None:
+                        from explanations import explain_one
+                        explanation = explain_one(engine, input_data, scaler)
+                    interpretation = interpret_prediction(prediction, prob_satisfied, explanation)
+                    st.markdown(interpretation)
+                    
+                    # Metrics
+                    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        st.metric("Model", model_choice.split()[0])
+                    with col_b:
+                        st.metric("Waktu", datetime.now().strftime("%H:%M"))
+                    
+                    # Details
+                    with st.expander("Detail Probabilitas"):
+                        prob_df = pd.DataFrame({
+                            'Kategori': ['Tidak Puas', 'Puas'],
+                            'Probabilitas': [f"{probability[0]*100:.1f}%", f"{probability[1]*100:.1f}%"]
+                        })
+                        st.dataframe(prob_df, hide_index=True, use_container_width=True)
+                        cache_stats = prediction_cache.stats()
+                        st.caption(
+                            f"Cache prediksi: {cache_stats['hits']} hit / {cache_stats['misses']} miss "
+                            f"({cache_stats['hit_rate']*100:.0f}%), {cache_stats['size']} entri"
+                        )
+                    
+                    # Semua model + ensemble soft voting dari satu kali encode
+                    if len(models.engines) > 1:
+                        from ensemble import ENSEMBLE_NAME, compare_one
+                        labels = {name: label for label, name in MODEL_FILES.items()}
+                        labels[ENSEMBLE_NAME] = "Ensemble (Soft Voting)"
+                        comparison = compare_one(models.engines, input_data, ensemble_weights)
+                        with st.expander("Perbandingan Model", expanded=True):
+                            st.dataframe(pd.DataFrame({
+                                'Model': [labels[name] for name, _, _ in comparison],
+                                'Prediksi': ["Puas" if c == 1 else "Tidak Puas" for _, c, _ in comparison],
+                                'Prob. Puas': [f"{p*100:.1f}%" for _, _, p in comparison]
+                            }), hide_index=True, use_container_width=True)
+                    
+                    # Kurva what-if semua slider dalam satu kali scoring
+                    if engine is not None:
+                        from whatif import sensitivity_curves
+                        whatif = sensitivity_curves(engine, input_data)
+                    observe('predict.render', time.perf_counter() - render_start)
+                    registry.export_if_due('app')
+                    if registry.enabled:
+                        drift.export_if_due()
+                    
+                except Exception as e:
+                    st.error(f"Terjadi kesalahan: {str(e)}")
+            else:
+                st.warning("Model belum tersedia. Jalankan train_model.py terlebih dahulu.")
+        else:
+            st.info("Atur parameter lalu klik tombol Prediksi.")
+            st.image("https://via.placeholder.com/500x300/2c3e50/ffffff?text=Hasil+Prediksi", 
+                    use_container_width=True)
     
-    return "\n".join(interpretation)
+    if whatif is not None:
+        from explanations import FEATURE_LABELS
+        st.markdown("### Analisis What-If")
+        st.caption("Probabilitas puas jika satu parameter digeser sepanjang rentang slider "
+                   "sementara parameter lain tetap. Titik menandai input saat ini.")
+        features = list(whatif['curves'])
+        st.plotly_chart(
+            whatif_chart(
+                [FEATURE_LABELS[col] for col in features],
+                [(x, y * 100) for x, y in whatif['curves'].values()],
+                [([input_data[col]], [whatif['current'] * 100]) for col in features]
+            ),
+            use_container_width=True
+        )
+
+@st.fragment
+def drift_panel():
+    """PSI/KL setiap fitur dan kelas prediksi terhadap referensi training"""
+    import json
+    from charts import create_drift_chart
+    from explanations import FEATURE_LABELS
+    
+    drift = load_drift_monitor()
+    drift.refresh()
+    report = drift.report()
+    if report['reference_rows'] == 0:
+        st.info("Referensi drift belum tersedia. Jalankan train_model.py terlebih dahulu.")
+        return
+    
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        st.metric("Baris Dipantau", f"{report['rows']:,}")
+    with col_b:
+        st.metric("PSI Maksimum", f"{report['max_psi']:.3f}")
+    with col_c:
+        st.metric("Status", report['status'].title())
+    st.caption(f"Referensi: {report['reference_rows']:,} baris training "
+               f"({report['reference_created_at']}). PSI < 0.1 stabil, 0.1-0.25 bergeser, "
+               f">= 0.25 drift.")
+    
+    labels = {name: f"Prediksi {label}" for label, name in MODEL_FILES.items()}
+    entries = [(FEATURE_LABELS[col], entry) for col, entry in report['features'].items()]
+    entries += [(labels.get(name, name), entry) for name, entry in report['predictions'].items()]
+    st.dataframe(pd.DataFrame({
+        'Fitur': [label for label, _ in entries],
+        'PSI': [entry.get('psi') for _, entry in entries],
+        'KL': [entry.get('kl') for _, entry in entries],
+        'Status': [entry.get('status', '-') for _, entry in entries],
+    }).round(4), hide_index=True, use_container_width=True)
+    
+    options = dict(entries)
+    selected = st.selectbox("Distribusi:", list(options))
+    entry = options[selected]
+    if 'reference' in entry:
+        st.plotly_chart(create_drift_chart(entry['bins'], entry['reference'], entry['live']),
+                        use_container_width=True)
+    st.download_button(
+        "Unduh Laporan Drift (JSON)",
+        data=json.dumps(report, indent=2),
+        file_name="drift_report.json",
+        mime="application/json",
+        use_container_width=True
+    )
 
 # Header
 st.markdown('<div class="main-header">Sistem Analisis Kepuasan Pengguna E-Learning</div>', 
@@ -379,42 +586,62 @@ tab1, tab2 = st.tabs(["Beranda", "Prediksi"])
 with tab1:
     st.markdown("## Ringkasan Kinerja Platform")
     
+    version = store_version()
+    summary = load_dashboard_summary(version)
+    
+    if summary['total'] == 0:
+        st.info("Belum ada data respon. Jalankan: python aggregate_store.py ingest <file.csv>")
+    
+    ratings = summary['ratings']
+    lowest = ratings.index(min(ratings))
+    highest = ratings.index(max(ratings))
+    
+    if summary['count_growth'] is None:
+        growth_text = "Belum ada data bulan lalu"
+    else:
+        growth_text = f"{'Naik' if summary['count_growth'] >= 0 else 'Turun'} {format_decimal(abs(summary['count_growth']), 0)}% dari bulan lalu"
+    
+    if summary['satisfaction_change'] is None:
+        satisfaction_text = "Dari seluruh respon"
+    else:
+        satisfaction_text = f"{'Meningkat' if summary['satisfaction_change'] >= 0 else 'Menurun'} {format_decimal(abs(summary['satisfaction_change']), 0)}%"
+    
     # Top metrics row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         <div class="stat-card">
             <div class="stat-label">Total Pengguna</div>
-            <div class="stat-number">2.547</div>
-            <div style="font-size: 0.85rem; margin-top: 0.5rem;">Naik 12% dari bulan lalu</div>
+            <div class="stat-number">{format_number(summary['total'])}</div>
+            <div style="font-size: 0.85rem; margin-top: 0.5rem;">{growth_text}</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
+        st.markdown(f"""
         <div class="stat-card">
             <div class="stat-label">Tingkat Kepuasan</div>
-            <div class="stat-number">73%</div>
-            <div style="font-size: 0.85rem; margin-top: 0.5rem;">Meningkat 5%</div>
+            <div class="stat-number">{format_decimal(summary['satisfaction_rate'], 0)}%</div>
+            <div style="font-size: 0.85rem; margin-top: 0.5rem;">{satisfaction_text}</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
+        st.markdown(f"""
         <div class="stat-card">
             <div class="stat-label">Rata-rata Penggunaan</div>
-            <div class="stat-number">3,2 jam</div>
+            <div class="stat-number">{format_decimal(summary['avg_durasi'], 1)} jam</div>
             <div style="font-size: 0.85rem; margin-top: 0.5rem;">Per hari</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col4:
-        st.markdown("""
+        st.markdown(f"""
         <div class="stat-card">
-            <div class="stat-label">Sesi Aktif</div>
-            <div class="stat-number">1.893</div>
-            <div style="font-size: 0.85rem; margin-top: 0.5rem;">Saat ini online</div>
+            <div class="stat-label">Respon Bulan Ini</div>
+            <div class="stat-number">{format_number(summary['current_month_count'])}</div>
+            <div style="font-size: 0.85rem; margin-top: 0.5rem;">{summary['months'][-1] if summary['months'] else '-'}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -427,92 +654,67 @@ with tab1:
         st.markdown("### Tren Kepuasan Pengguna")
         
         # Create trend chart
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun']
-        satisfied = [65, 68, 71, 69, 72, 73]
-        unsatisfied = [35, 32, 29, 31, 28, 27]
+        months = summary['months']
+        satisfied = summary['trend_satisfied']
+        unsatisfied = summary['trend_unsatisfied']
         
-        fig_trend = go.Figure()
-        fig_trend.add_trace(go.Scatter(
-            x=months, y=satisfied,
-            mode='lines+markers',
-            name='Puas',
-            line=dict(color='#2c3e50', width=3),
-            marker=dict(size=8)
-        ))
-        fig_trend.add_trace(go.Scatter(
-            x=months, y=unsatisfied,
-            mode='lines+markers',
-            name='Tidak Puas',
-            line=dict(color='#95a5a6', width=3),
-            marker=dict(size=8)
-        ))
-        
-        fig_trend.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=20, b=20),
-            hovermode='x unified',
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            yaxis=dict(title="Persentase", range=[0, 100])
-        )
+        fig_trend = static_figure('trend', version, create_trend_chart,
+                                  months, satisfied, unsatisfied)
         
         st.plotly_chart(fig_trend, use_container_width=True)
         
         # Platform ratings
         st.markdown("### Penilaian Platform")
         
-        categories = ['Kualitas Materi', 'Kemudahan Penggunaan', 'Stabilitas Sistem', 'Dukungan Pengajar']
-        ratings = [4.2, 4.0, 3.8, 4.1]
+        categories = summary['rating_labels']
         
-        fig_ratings = go.Figure(go.Bar(
-            x=categories,
-            y=ratings,
-            marker_color=['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6'],
-            text=[f"{r}/5" for r in ratings],
-            textposition='auto',
-        ))
-        
-        fig_ratings.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=20, b=20),
-            yaxis=dict(range=[0, 5], title="Rating Rata-rata"),
-            showlegend=False
-        )
+        fig_ratings = static_figure('ratings', version, create_ratings_chart, categories, ratings,
+                                    [f"{format_decimal(r, 1)}/5" for r in ratings])
         
         st.plotly_chart(fig_ratings, use_container_width=True)
     
     with col_right:
         st.markdown("### Temuan Penting")
         
-        st.markdown("""
+        if summary['satisfaction_change'] is None:
+            trend_title = "Tingkat Kepuasan"
+            trend_text = f"""Sebanyak {format_decimal(summary['satisfaction_rate'], 0)}% dari {format_number(summary['total'])} responden 
+                menyatakan puas terhadap platform. Tren bulanan akan tampil setelah data respon 
+                dari beberapa bulan tersedia."""
+        else:
+            change = summary['satisfaction_change']
+            trend_title = "Tren Positif" if change >= 0 else "Tren Menurun"
+            trend_text = f"""Tingkat kepuasan pengguna {'mengalami kenaikan' if change >= 0 else 'mengalami penurunan'} sebesar 
+                {format_decimal(abs(change), 1)}% dibanding bulan lalu, menjadi {format_decimal(summary['trend_satisfied'][-1], 0)}% 
+                pada bulan {summary['months'][-1]}."""
+        
+        st.markdown(f"""
         <div class="insight-card">
-            <div class="insight-title">Tren Positif</div>
+            <div class="insight-title">{trend_title}</div>
             <div class="insight-text">
-                Tingkat kepuasan pengguna mengalami kenaikan sebesar 5% dalam tiga bulan terakhir. 
-                Hal ini menunjukkan bahwa perbaikan yang dilakukan platform mulai memberikan dampak positif 
-                pada pengalaman pengguna secara keseluruhan.
+                {trend_text}
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("""
+        st.markdown(f"""
         <div class="insight-card">
             <div class="insight-title">Area yang Perlu Perhatian</div>
             <div class="insight-text">
-                Stabilitas sistem mendapat penilaian 3,8 dari 5, sedikit lebih rendah dibanding aspek lainnya. 
-                Perlu dilakukan investigasi lebih lanjut terkait masalah teknis yang mungkin mempengaruhi 
+                {categories[lowest]} mendapat penilaian {format_decimal(ratings[lowest], 1)} dari 5, lebih rendah dibanding aspek lainnya. 
+                Perlu dilakukan investigasi lebih lanjut terkait faktor yang mungkin mempengaruhi 
                 kenyamanan pengguna saat mengakses platform.
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("""
+        st.markdown(f"""
         <div class="insight-card">
             <div class="insight-title">Tingkat Engagement</div>
             <div class="insight-text">
-                Rata-rata penggunaan harian mencapai 3,2 jam, menandakan keterlibatan yang cukup baik. 
-                Data menunjukkan bahwa pengguna yang menghabiskan waktu 4 jam atau lebih per hari 
-                cenderung memiliki tingkat kepuasan hingga 90%.
+                Rata-rata penggunaan harian mencapai {format_decimal(summary['avg_durasi'], 1)} jam. 
+                Pengguna yang menghabiskan waktu {HEAVY_USAGE_HOURS} jam atau lebih per hari 
+                memiliki tingkat kepuasan {format_decimal(summary['heavy_satisfaction_rate'], 0)}%.
             </div>
         </div>
         """, unsafe_allow_html=True)
@@ -524,197 +726,135 @@ with tab1:
     
     with col_dist1:
         # Age distribution
-        age_groups = ['18-24', '25-29', '30-34', '35+']
-        age_counts = [35, 42, 18, 5]
+        age_groups = summary['age_labels']
+        age_counts = summary['age_counts']
         
-        fig_age = go.Figure(data=[go.Pie(
-            labels=age_groups,
-            values=age_counts,
-            hole=.4,
-            marker_colors=['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6']
-        )])
-        
-        fig_age.update_layout(
-            title="Pengguna Berdasarkan Usia",
-            height=300,
-            margin=dict(l=20, r=20, t=40, b=20),
-            showlegend=True
-        )
+        fig_age = static_figure('age', version, create_distribution_pie,
+                                age_groups, age_counts, "Pengguna Berdasarkan Usia")
         
         st.plotly_chart(fig_age, use_container_width=True)
     
     with col_dist2:
         # Usage frequency
-        freq_labels = ['Setiap hari', '4-6x/minggu', '2-3x/minggu', '< 2x/minggu']
-        freq_counts = [45, 30, 18, 7]
-        
-        fig_freq = go.Figure(data=[go.Pie(
-            labels=freq_labels,
-            values=freq_counts,
-            hole=.4,
-            marker_colors=['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6']
-        )])
+        freq_labels = summary['freq_labels']
+        freq_counts = summary['freq_counts']
         
-        fig_freq.update_layout(
-            title="Distribusi Frekuensi Login",
-            height=300,
-            margin=dict(l=20, r=20, t=40, b=20),
-            showlegend=True
-        )
+        fig_freq = static_figure('freq', version, create_distribution_pie,
+                                 freq_labels, freq_counts, "Distribusi Frekuensi Login")
         
         st.plotly_chart(fig_freq, use_container_width=True)
     
     # Summary box
-    st.markdown("""
+    frequent_share = 100 * sum(freq_counts[:2]) / max(sum(freq_counts), 1)
+    st.markdown(f"""
     <div class="info-box">
-        <strong>Ringkasan:</strong> Platform menunjukkan pertumbuhan yang sehat dengan 2.547 pengguna aktif 
-        dan tingkat kepuasan 73%. Kualitas materi dan dukungan pengajar mendapat penilaian baik, 
-        sementara stabilitas sistem masih perlu ditingkatkan. Sebagian besar pengguna (75%) mengakses 
-        platform minimal 4 kali per minggu, menunjukkan tingkat retensi yang kuat.
+        <strong>Ringkasan:</strong> Platform memiliki {format_number(summary['total'])} responden 
+        dengan tingkat kepuasan {format_decimal(summary['satisfaction_rate'], 0)}%. {categories[highest]} mendapat penilaian tertinggi 
+        ({format_decimal(ratings[highest], 1)}/5), sementara {categories[lowest].lower()} masih perlu ditingkatkan 
+        ({format_decimal(ratings[lowest], 1)}/5). Sebanyak {format_decimal(frequent_share, 0)}% pengguna mengakses 
+        platform minimal 4 kali per minggu.
     </div>
     """, unsafe_allow_html=True)
 
+# pandas dan warm-up dimulai setelah elemen Beranda dibuat. Tab Streamlit tidak
+# lazy: kedua baris ini berjalan di setiap run script, bukan saat tab Prediksi
+# dibuka, tetapi setelah run pertama keduanya no-op (sys.modules dan
+# cache_resource). Efeknya hanya pada run pertama setiap proses: Beranda dikirim
+# ke browser sebelum pandas diimpor, dan artefak dimuat di latar sementara sisa
+# halaman dirender.
+import pandas as pd
+warmup = start_warmup()
+
 # ==================== PREDICTION TOOL ====================
 with tab2:
-    
-    # Sidebar untuk input
-    st.sidebar.markdown("### Parameter Input")
-    
-    # Pilihan model
+    # Pilihan model (dipakai prediksi tunggal dan batch)
+    st.sidebar.markdown("### Model")
     model_choice = st.sidebar.selectbox(
         "Model:",
         ["Logistic Regression", "Decision Tree"]
     )
     
-    st.sidebar.markdown("---")
-    
-    # Input demografis
-    usia = st.sidebar.slider("Usia:", 18, 50, 25)
-    jenis_kelamin = st.sidebar.selectbox(
-        "Jenis Kelamin:",
-        ["L", "P"],
-        format_func=lambda x: "Laki-laki" if x == "L" else "Perempuan"
-    )
-    
-    # Pola penggunaan
-    durasi_penggunaan = st.sidebar.slider("Penggunaan Harian (jam):", 0.0, 8.0, 3.0, 0.5)
-    frekuensi_login = st.sidebar.slider("Login per Minggu:", 1, 7, 4)
-    
-    # Penilaian
-    kualitas_materi = st.sidebar.slider("Kualitas Materi:", 1, 5, 3)
-    kemudahan_penggunaan = st.sidebar.slider("Kemudahan Penggunaan:", 1, 5, 3)
-    stabilitas_aplikasi = st.sidebar.slider("Stabilitas Aplikasi:", 1, 5, 3)
-    interaksi_pengajar = st.sidebar.slider("Interaksi Pengajar:", 1, 5, 3)
-    
-    # Tombol prediksi
-    predict_button = st.sidebar.button("Prediksi", type="primary", use_container_width=True)
-    
-    # Main content
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("### Ringkasan Input")
+    # Bobot ensemble soft voting (Decision Tree mendapat sisanya)
+    logreg_weight = st.sidebar.slider("Bobot Logistic Regression (ensemble):", 0.0, 1.0, 0.5, 0.1)
+    ensemble_weights = {MODEL_FILES['Logistic Regression']: logreg_weight,
+                        MODEL_FILES['Decision Tree']: 1.0 - logreg_weight}
+    
+    # Status hot-reload (tanpa menunggu warm-up selesai)
+    if warmup.done():
+        reload_stats = load_registry().stats()
+        st.sidebar.caption(f"Model dimuat {reload_stats['loaded_at']:%d-%m-%Y %H:%M:%S}")
+        if reload_stats['last_error']:
+            st.sidebar.warning(f"Model baru ditolak, model lama tetap dipakai: "
+                               f"{reload_stats['last_error']}")
+    
+    prediction_panel(model_choice, ensemble_weights)
+    
+    # Prediksi batch dari file CSV
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    st.markdown("### Prediksi Batch (CSV)")
+    st.caption("Unggah file CSV dengan kolom yang sama seperti dataset_kepuasan_pengguna_elearning.csv")
+    
+    compare_all = st.checkbox("Bandingkan semua model + ensemble")
+    uploaded_file = st.file_uploader("File CSV:", type=["csv"])
+    
+    if uploaded_file is not None:
+        from batch_predict import score_csv
+        models = load_models()
+        model = models.models.get(MODEL_FILES[model_choice])
+        scaler, label_encoder = models.scaler, models.label_encoder
         
-        input_data = {
-            'usia': usia,
-            'jenis_kelamin': jenis_kelamin,
-            'durasi_penggunaan': durasi_penggunaan,
-            'frekuensi_login': frekuensi_login,
-            'kualitas_materi': kualitas_materi,
-            'kemudahan_penggunaan': kemudahan_penggunaan,
-            'stabilitas_aplikasi': stabilitas_aplikasi,
-            'interaksi_pengajar': interaksi_pengajar
-        }
-        
-        display_data = {
-            'Parameter': [
-                'Usia', 'Jenis Kelamin', 'Penggunaan Harian', 'Frekuensi Login',
-                'Kualitas Materi', 'Kemudahan Penggunaan', 'Stabilitas', 'Interaksi Pengajar'
-            ],
-            'Nilai': [
-                f"{usia} tahun",
-                "Laki-laki" if jenis_kelamin == "L" else "Perempuan",
-                f"{durasi_penggunaan} jam/hari",
-                f"{frekuensi_login}x/minggu",
-                f"{kualitas_materi}/5",
-                f"{kemudahan_penggunaan}/5",
-                f"{stabilitas_aplikasi}/5",
-                f"{interaksi_pengajar}/5"
-            ]
-        }
-        
-        st.dataframe(
-            pd.DataFrame(display_data),
-            hide_index=True,
-            use_container_width=True
-        )
-        
-        # Visualisasi fitur penilaian
-        st.plotly_chart(create_feature_comparison(input_data), use_container_width=True)
-    
-    with col2:
-        st.markdown("### Hasil Prediksi")
-        
-        if predict_button:
-            model_file = 'logreg_model' if model_choice == "Logistic Regression" else 'dt_model'
-            model = load_model(model_file)
-            scaler, label_encoder = load_preprocessors()
-            
-            if model is not None:
-                X = preprocess_input(input_data, scaler, label_encoder)
+        if model is not None:
+            output = io.StringIO()
+            # Setiap unggahan dicatat ke histogram drift sekali saja; rerun berikutnya
+            # (ganti model/bobot, checkbox) menskor ulang tanpa menghitung baris yang sama lagi.
+            # Baris dikumpulkan di monitor lokal dan digabung hanya jika seluruh file berhasil
+            # diskor, sehingga file yang gagal di tengah tidak tercatat sebagian.
+            observed = st.session_state.setdefault('drift_observed_uploads', set())
+            upload_key = (getattr(uploaded_file, 'file_id', None)
+                          or (uploaded_file.name, uploaded_file.size))
+            drift_monitor = None if upload_key in observed else load_drift_monitor()
+            monitor = None
+            if drift_monitor is not None and drift_monitor.enabled:
+                from drift_monitor import DriftMonitor
+                monitor = DriftMonitor(drift_monitor.reference)
+            try:
+                with st.spinner("Memproses file..."):
+                    stats = score_csv(uploaded_file, output, model, scaler, label_encoder,
+                                      engine=models.engines.get(MODEL_FILES[model_choice]),
+                                      engines=models.engines if compare_all else None,
+                                      weights=ensemble_weights, monitor=monitor,
+                                      model_name=MODEL_FILES[model_choice])
+                if monitor is not None:
+                    drift_monitor.merge(monitor)
+                observed.add(upload_key)
                 
-                try:
-                    prediction = model.predict(X)[0]
-                    probability = model.predict_proba(X)[0]
-                    
-                    # Result box
-                    if prediction == 1:
-                        st.markdown(
-                            '<div class="prediction-box satisfied">PUAS</div>',
-                            unsafe_allow_html=True
-                        )
-                    else:
-                        st.markdown(
-                            '<div class="prediction-box not-satisfied">TIDAK PUAS</div>',
-                            unsafe_allow_html=True
-                        )
-                    
-                    # Gauge chart
-                    prob_satisfied = probability[1]
-                    st.plotly_chart(
-                        create_gauge_chart(prob_satisfied, "Tingkat Keyakinan"),
-                        use_container_width=True
-                    )
-                    
-                    # Analysis
-                    st.markdown("**Analisis Faktor:**")
-                    interpretation = interpret_prediction(prediction, prob_satisfied, input_data)
-                    st.markdown(interpretation)
-                    
-                    # Metrics
-                    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        st.metric("Model", model_choice.split()[0])
-                    with col_b:
-                        st.metric("Waktu", datetime.now().strftime("%H:%M"))
-                    
-                    # Details
-                    with st.expander("Detail Probabilitas"):
-                        prob_df = pd.DataFrame({
-                            'Kategori': ['Tidak Puas', 'Puas'],
-                            'Probabilitas': [f"{probability[0]*100:.1f}%", f"{probability[1]*100:.1f}%"]
-                        })
-                        st.dataframe(prob_df, hide_index=True, use_container_width=True)
-                    
-                except Exception as e:
-                    st.error(f"Terjadi kesalahan: {str(e)}")
-            else:
-                st.warning("Model belum tersedia. Jalankan train_model.py terlebih dahulu.")
+                col_a, col_b, col_c = st.columns(3)
+                with col_a:
+                    st.metric("Jumlah Baris", f"{stats['rows']:,}")
+                with col_b:
+                    st.metric("Waktu", f"{stats['seconds']:.2f} detik")
+                with col_c:
+                    st.metric("Throughput", f"{stats['rows_per_sec']:,.0f} rows/sec")
+                
+                result_csv = output.getvalue()
+                st.dataframe(pd.read_csv(io.StringIO(result_csv), nrows=20),
+                             hide_index=True, use_container_width=True)
+                st.download_button(
+                    "Unduh Hasil Prediksi",
+                    data=result_csv,
+                    file_name="hasil_prediksi.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+            except Exception as e:
+                st.error(f"Terjadi kesalahan: {str(e)}")
         else:
-            st.info("Atur parameter di sidebar lalu klik tombol Prediksi.")
-            st.image("https://via.placeholder.com/500x300/2c3e50/ffffff?text=Hasil+Prediksi", 
-                    use_container_width=True)
+            st.warning("Model belum tersedia. Jalankan train_model.py terlebih dahulu.")
+    
+    # Distribusi input dan prediksi dibandingkan dengan data training
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    st.markdown("### Pemantauan Drift")
+    drift_panel()
 
 # Footer
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
@@ -0,0 +1,76 @@
+import hashlib
+import pickle
+
+# Urutan fitur sesuai dengan training (lihat train_model.py)
+expected_cols = ['usia', 'jenis_kelamin', 'durasi_penggunaan', 'frekuensi_login',
+                 'kualitas_materi', 'kemudahan_penggunaan', 'stabilitas_aplikasi',
+                 'interaksi_pengajar']
+
+# Skema dataset training: kolom numerik yang boleh kosong (diisi median),
+# target, dan kolom id yang tidak dipakai sebagai fitur
+numeric_cols = ['durasi_penggunaan', 'kualitas_materi', 'stabilitas_aplikasi']
+TARGET = 'kepuasan_pengguna'
+ID_COLUMN = 'id_responden'
+
+# Nama file model untuk setiap pilihan di dashboard
+MODEL_FILES = {
+    'Logistic Regression': 'logreg_model',
+    'Decision Tree': 'dt_model',
+}
+
+SCALER_FILE = 'scaler.pkl'
+LABEL_ENCODER_FILE = 'label_encoder.pkl'
+
+
+def load_pickle(path):
+    """Memuat satu objek pickle dari disk"""
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+def load_artifacts(model_name):
+    """Memuat model beserta scaler dan label encoder tanpa Streamlit"""
+    model = load_pickle(f'{model_name}.pkl')
+    scaler = load_pickle(SCALER_FILE)
+    label_encoder = load_pickle(LABEL_ENCODER_FILE)
+    return model, scaler, label_encoder
+
+
+def artifact_fingerprint(model_names=None):
+    """Hash SHA-256 dari file model dan preprocessor (berubah setiap training ulang)"""
+    if model_names is None:
+        model_names = sorted(MODEL_FILES.values())
+    paths = [f'{name}.pkl' for name in model_names] + [SCALER_FILE, LABEL_ENCODER_FILE]
+
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def load_runtime_artifacts():
+    """Model, scaler, dan encoder untuk dashboard
+
+    Memakai model_bundle.bin jika tersedia (tanpa sklearn); jika tidak, file
+    pickle. Artefak yang tidak ditemukan bernilai None, begitu juga sampel
+    hold-out jika bundle tidak menyimpannya.
+    """
+    from model_bundle import BUNDLE_FILE, ModelBundle
+    try:
+        bundle = ModelBundle.load(BUNDLE_FILE)
+        return {'models': dict(bundle.engines), 'scaler': bundle.scaler,
+                'label_encoder': bundle.label_encoder, 'holdout': bundle.holdout}
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    def optional(path):
+        try:
+            return load_pickle(path)
+        except FileNotFoundError:
+            return None
+
+    return {'models': {name: optional(f'{name}.pkl') for name in MODEL_FILES.values()},
+            'scaler': optional(SCALER_FILE),
+            'label_encoder': optional(LABEL_ENCODER_FILE),
+            'holdout': None}
@@ -0,0 +1,224 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from artifacts import MODEL_FILES, expected_cols, load_artifacts, numeric_cols
+from drift_monitor import REFERENCE_FILE, DriftMonitor, load_reference, print_report
+from ensemble import score_models
+from explanations import contributions
+from inference_engine import build_engine, gender_mapping, sklearn_predict_proba
+from prediction_cube import PredictionCube, with_cube
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def encode_gender(series, label_encoder=None):
+    """Encode kolom jenis_kelamin secara vektor (setara LabelEncoder.transform)"""
+    encoded = series.map(gender_mapping(label_encoder))
+    unknown = encoded.isnull()
+    if unknown.any():
+        labels = sorted(series[unknown].astype(str).unique())
+        raise ValueError(f"Nilai jenis_kelamin tidak dikenal: {labels}")
+    return encoded.astype(np.int64)
+
+
+def fill_missing(df, scaler=None):
+    """Mengisi nilai kosong dengan median imputasi training (scaler.medians_)
+
+    Artefak dari training lama yang belum menyimpan median memakai rata-rata
+    training (nilai 0 setelah scaling).
+    """
+    if scaler is None:
+        return df
+    values = getattr(scaler, 'medians_', None) or dict(zip(expected_cols, scaler.mean_))
+    for col in numeric_cols:
+        if df[col].isnull().any():
+            df[col] = df[col].fillna(values[col])
+    return df
+
+
+def preprocess_batch(df, scaler=None, label_encoder=None):
+    """Versi vektor dari preprocess_input untuk banyak baris sekaligus"""
+    missing = [col for col in expected_cols if col not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {missing}")
+
+    df = df[expected_cols].copy()
+    df['jenis_kelamin'] = encode_gender(df['jenis_kelamin'], label_encoder)
+    df = fill_missing(df, scaler)
+
+    if scaler is not None:
+        return pd.DataFrame(scaler.transform(df), columns=expected_cols, index=df.index)
+
+    return df
+
+
+def score_frame(df, model, scaler=None, label_encoder=None, engine=None, explain=False,
+                monitor=None, model_name=None):
+    """Menghitung prediksi dan probabilitas untuk satu DataFrame
+
+    Jika engine NumPy tersedia, scoring dilakukan langsung pada fitur mentah
+    tanpa DataFrame hasil scaling. Dengan explain=True ditambahkan kolom
+    kontribusi setiap fitur (lihat explanations.py) dan fitur paling berpengaruh.
+    Jika monitor (DriftMonitor) diberikan, fitur mentah dan kelas prediksi
+    model_name dicatat ke histogram drift.
+    """
+    if (explain or monitor is not None) and engine is None:
+        engine = build_engine(model, scaler, label_encoder)
+    if engine is not None:
+        missing = [col for col in expected_cols if col not in df.columns]
+        if missing:
+            raise ValueError(f"Kolom tidak ditemukan: {missing}")
+        X = engine.encode_frame(fill_missing(df[expected_cols].copy(), scaler))
+        prediction, probability = engine.predict_with_proba(X)
+    else:
+        X = preprocess_batch(df, scaler, label_encoder)
+        probability = sklearn_predict_proba(model, X.to_numpy())
+        prediction = model.classes_.take(probability.argmax(axis=1))
+
+    result = df.copy()
+    result['prediksi'] = prediction
+    result['prob_tidak_puas'] = probability[:, 0]
+    result['prob_puas'] = probability[:, 1]
+    if explain:
+        _, contribution, _ = contributions(engine, X, scaler)
+        for j, col in enumerate(expected_cols):
+            result[f'kontribusi_{col}'] = contribution[:, j]
+        result['faktor_utama'] = np.asarray(expected_cols).take(np.abs(contribution).argmax(axis=1))
+    if monitor is not None:
+        monitor.observe(X, {model_name: prediction} if model_name is not None else None)
+    return result
+
+
+def compare_frame(df, engines, scaler=None, weights=None, monitor=None):
+    """Prediksi setiap engine dan ensemble soft voting berdampingan untuk satu DataFrame
+
+    Fitur di-encode sekali lalu diskor oleh semua engine (lihat ensemble.py).
+    Menambahkan kolom prediksi_<model> dan prob_puas_<model>, termasuk 'ensemble'.
+    """
+    missing = [col for col in expected_cols if col not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {missing}")
+    first = next(iter(engines.values()))
+    X = first.encode_frame(fill_missing(df[expected_cols].copy(), scaler))
+    scores = score_models(engines, X, weights)
+
+    # Salinan dangkal: kolom baru tidak mengubah df asli, data input tidak disalin
+    result = df.copy(deep=False)
+    for name, probability in scores.items():
+        result[f'prediksi_{name}'] = first.classes.take((probability > 0.5).astype(np.intp))
+        result[f'prob_puas_{name}'] = probability
+    if monitor is not None:
+        # Ensemble tidak punya referensi (bobotnya dipilih saat scoring)
+        monitor.observe(X, {name: scores[name] > 0.5 for name in engines})
+    return result
+
+
+def score_csv(source, destination, model, scaler=None, label_encoder=None,
+              chunksize=DEFAULT_CHUNKSIZE, progress=None, engine=None, explain=False,
+              engines=None, weights=None, monitor=None, model_name=None):
+    """Memproses file CSV per chunk dan menulis hasil prediksi ke destination
+
+    Jika engines (dict nama -> engine) diberikan, setiap baris diskor oleh
+    semua model dan ensemble-nya (compare_frame); model dan engine diabaikan.
+    Setiap chunk dicatat ke monitor drift jika diberikan.
+    Mengembalikan ringkasan berisi jumlah baris, durasi, dan throughput (rows/sec).
+    """
+    rows = 0
+    start = time.perf_counter()
+    if engine is None and engines is None:
+        engine = build_engine(model, scaler, label_encoder)
+
+    for i, chunk in enumerate(pd.read_csv(source, chunksize=chunksize)):
+        if engines is not None:
+            result = compare_frame(chunk, engines, scaler, weights, monitor=monitor)
+        else:
+            result = score_frame(chunk, model, scaler, label_encoder, engine=engine, explain=explain,
+                                 monitor=monitor, model_name=model_name)
+        result.to_csv(destination, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        rows += len(result)
+        if progress is not None:
+            progress(rows)
+
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds > 0 else float('inf'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Prediksi kepuasan pengguna untuk seluruh baris file CSV"
+    )
+    parser.add_argument('input', help="File CSV dengan kolom seperti dataset_kepuasan_pengguna_elearning.csv")
+    parser.add_argument('-o', '--output', default='hasil_prediksi.csv', help="File CSV hasil prediksi")
+    parser.add_argument('-m', '--model', default='logreg_model',
+                        choices=sorted(MODEL_FILES.values()), help="Model yang digunakan")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Jumlah baris per chunk")
+    parser.add_argument('--no-cube', action='store_true',
+                        help="Selalu gunakan inferensi langsung, abaikan prediction cube")
+    parser.add_argument('--explain', action='store_true',
+                        help="Tambahkan kolom kontribusi per fitur dan faktor utama")
+    parser.add_argument('--compare', action='store_true',
+                        help="Skor dengan semua model dan ensemble soft voting (--model diabaikan)")
+    parser.add_argument('--weights', default=None,
+                        help="Bobot ensemble, misalnya logreg_model=2,dt_model=1 (default sama rata)")
+    parser.add_argument('--drift', action='store_true',
+                        help="Bandingkan distribusi input dan prediksi dengan referensi training "
+                             "(PSI/KL), ekspor ke folder metrics/")
+    args = parser.parse_args(argv)
+    if args.explain and args.compare:
+        parser.error("--explain tidak dapat digabung dengan --compare (kontribusi dihitung per model)")
+
+    weights = None
+    if args.weights:
+        try:
+            weights = {name: float(value) for name, value in
+                       (item.split('=') for item in args.weights.split(','))}
+        except ValueError:
+            print("✗ Format --weights: nama_model=bobot,nama_model=bobot")
+            return 1
+        unknown = sorted(set(weights) - set(MODEL_FILES.values()))
+        if unknown:
+            print(f"✗ Model tidak dikenal di --weights: {', '.join(unknown)}")
+            return 1
+
+    names = sorted(MODEL_FILES.values()) if args.compare else [args.model]
+    cube = None if args.no_cube else PredictionCube.load()
+    engines = {}
+    try:
+        for name in names:
+            model, scaler, label_encoder = load_artifacts(name)
+            engines[name] = with_cube(build_engine(model, scaler, label_encoder), name, cube)
+    except FileNotFoundError as e:
+        print(f"✗ Error: {e.filename} tidak ditemukan. Jalankan train_model.py terlebih dahulu.")
+        return 1
+
+    print(f"Memproses {args.input} dengan {', '.join(names)}"
+          f"{' + ensemble' if args.compare else ''} (chunk {args.chunksize} baris)...")
+    monitor = None
+    if args.drift:
+        monitor = DriftMonitor(load_reference())
+        if monitor.reference is None:
+            print(f"✗ {REFERENCE_FILE} tidak ditemukan; histogram dicatat tanpa PSI/KL")
+    stats = score_csv(args.input, args.output, model, scaler, label_encoder,
+                      chunksize=args.chunksize, engine=engines[names[-1]], explain=args.explain,
+                      engines=engines if args.compare else None, weights=weights,
+                      monitor=monitor, model_name=names[-1])
+    print(f"✓ {stats['rows']} baris diprediksi dalam {stats['seconds']:.2f} detik "
+          f"({stats['rows_per_sec']:,.0f} rows/sec)")
+    print(f"✓ Hasil disimpan ke {args.output}")
+    if monitor is not None:
+        print_report(monitor.report())
+        print(f"✓ Laporan drift disimpan: {', '.join(monitor.export())}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
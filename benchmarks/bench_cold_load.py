@@ -0,0 +1,76 @@
+"""Waktu cold-load artefak: empat file pickle vs satu model_bundle.bin.
+
+Setiap percobaan dijalankan di proses Python baru sehingga biaya import
+(termasuk sklearn untuk jalur pickle) ikut terukur.
+
+Jalankan dari root project:
+    python model_bundle.py build   # jika bundle belum ada
+    python benchmarks/bench_cold_load.py --repeat 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PICKLE_SCRIPT = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+start = time.perf_counter()
+from artifacts import load_artifacts
+from inference_engine import build_engine
+engines = {}
+for name in ['logreg_model', 'dt_model']:
+    model, scaler, label_encoder = load_artifacts(name)
+    engines[name] = build_engine(model, scaler, label_encoder)
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'sklearn': 'sklearn' in sys.modules}))
+"""
+
+BUNDLE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from model_bundle import ModelBundle
+engines = ModelBundle.load().engines
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'sklearn': 'sklearn' in sys.modules}))
+"""
+
+
+def run_once(script):
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-load pickle vs bundle")
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(ROOT, 'model_bundle.bin')):
+        print("✗ model_bundle.bin tidak ditemukan. Jalankan: python model_bundle.py build")
+        return 1
+
+    print(f"Cold-load ({args.repeat} proses baru per jalur)")
+    print("-" * 60)
+    results = {}
+    for label, script in [('pickle (4 file)', PICKLE_SCRIPT), ('bundle (mmap)', BUNDLE_SCRIPT)]:
+        runs = [run_once(script) for _ in range(args.repeat)]
+        seconds = np.array([r['seconds'] for r in runs]) * 1000
+        results[label] = np.median(seconds)
+        print(f"{label:18s}: median {np.median(seconds):8.1f} ms   "
+              f"min {seconds.min():8.1f} ms   sklearn diimpor: {runs[0]['sklearn']}")
+
+    print("-" * 60)
+    pickle_ms, bundle_ms = results.values()
+    print(f"Bundle {pickle_ms / bundle_ms:.1f}x lebih cepat")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
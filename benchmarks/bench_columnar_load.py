@@ -0,0 +1,99 @@
+"""Waktu muat dan memori dataset besar: CSV apa adanya (float64/int64/object)
+vs CSV dan Parquet dengan tipe ringkas (int8/float32/category, kolom id tidak dimuat).
+
+Dataset sintetis dibuat sekali dengan generate_dummy_data.py (seed sama untuk
+CSV dan Parquet). Setiap percobaan dijalankan di proses Python baru agar memori
+puncak tidak tercampur; tahap pembersihan, imputasi, encoding, dan split fitur ikut
+dijalankan untuk memastikan tipe ringkas bekerja di seluruh pipeline.
+
+Jalankan dari root project:
+    python benchmarks/bench_columnar_load.py --rows 5000000 --repeat 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_dummy_data import write_dataset  # noqa: E402
+
+LOAD_SCRIPT = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+from instrumentation import peak_rss_mb
+import training_stages as stages
+path, compact = sys.argv[1], sys.argv[2] == '1'
+rss_before = peak_rss_mb()
+start = time.perf_counter()
+df = stages.load_dataset(path, compact=compact)
+load_seconds = time.perf_counter() - start
+frame_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+start = time.perf_counter()
+df, _ = stages.clean_dataset(df)
+df, _ = stages.impute_missing(df)
+df, _ = stages.encode_categorical(df)
+X, y = stages.split_features(df)
+pipeline_seconds = time.perf_counter() - start
+print(json.dumps({'load': load_seconds, 'pipeline': pipeline_seconds, 'frame_mb': frame_mb,
+                  'rss_mb': peak_rss_mb() - rss_before, 'rows': len(X)}))
+"""
+
+
+def run_once(path, compact):
+    output = subprocess.run([sys.executable, '-c', LOAD_SCRIPT, path, '1' if compact else '0'],
+                            cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark muat dataset CSV vs Parquet bertipe ringkas")
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workdir', default=None,
+                        help="Folder untuk file sintetis (default: folder sementara, dihapus setelah selesai)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        parquet_path = os.path.join(workdir, 'dataset.parquet')
+        print(f"Membuat dataset sintetis {args.rows:,} baris...")
+        try:
+            sizes = {'csv': write_dataset(csv_path, args.rows),
+                     'parquet': write_dataset(parquet_path, args.rows)}
+        except ImportError:
+            print("✗ Benchmark Parquet membutuhkan pyarrow (pip install pyarrow)")
+            return 1
+        print(f"✓ CSV {sizes['csv'] / 1024 ** 2:.0f} MB, Parquet {sizes['parquet'] / 1024 ** 2:.0f} MB")
+
+        modes = [('CSV (float64/object)', csv_path, False),
+                 ('CSV + tipe ringkas', csv_path, True),
+                 ('Parquet + ringkas', parquet_path, True)]
+        print(f"\nMuat + pipeline ({args.repeat} proses baru per mode, nilai median)")
+        print("-" * 78)
+        print(f"{'mode':22s} {'muat':>9s} {'pipeline':>10s} {'DataFrame':>11s} {'RSS tambahan':>14s}")
+        results = {}
+        for label, path, compact in modes:
+            runs = [run_once(path, compact) for _ in range(args.repeat)]
+            median = {key: float(np.median([r[key] for r in runs])) for key in runs[0]}
+            results[label] = median
+            print(f"{label:22s} {median['load']:7.2f} s {median['pipeline']:8.2f} s "
+                  f"{median['frame_mb']:8.0f} MB {median['rss_mb']:11.0f} MB")
+        print("-" * 78)
+
+    base = results[modes[0][0]]
+    for label, _, _ in modes[1:]:
+        result = results[label]
+        print(f"{label}: muat {base['load'] / result['load']:.1f}x lebih cepat, "
+              f"DataFrame {base['frame_mb'] / result['frame_mb']:.1f}x lebih kecil, "
+              f"RSS {base['rss_mb'] / result['rss_mb']:.1f}x lebih kecil")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Biaya scoring semua model + ensemble vs scoring terpisah per model.
+
+Untuk satu DataFrame sintetis dibandingkan:
+- komponen: encode_frame (satu kali) dan predict_proba_puas setiap engine;
+- compare_frame: encode sekali, skor semua engine, ensemble soft voting;
+- cara lama: score_frame terpisah untuk setiap model (encode berulang).
+
+Engine dipakai tanpa prediction cube agar yang diukur adalah biaya model.
+
+Jalankan dari root project:
+    python benchmarks/bench_ensemble.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.filterwarnings('ignore')
+
+from artifacts import MODEL_FILES, expected_cols, load_artifacts  # noqa: E402
+from batch_predict import compare_frame, fill_missing, score_frame  # noqa: E402
+from ensemble import compare_one  # noqa: E402
+from generate_dummy_data import generate_chunk  # noqa: E402
+from inference_engine import build_engine  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+SAMPLE_INPUT = {'usia': 25, 'jenis_kelamin': 'L', 'durasi_penggunaan': 3.0, 'frekuensi_login': 4,
+                'kualitas_materi': 3, 'kemudahan_penggunaan': 3, 'stabilitas_aplikasi': 3,
+                'interaksi_pengajar': 3}
+
+
+def best_seconds(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scoring multi-model dan ensemble")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df, _ = generate_chunk(args.rows, 1, 8, np.random.default_rng(0), 0.0)
+    df['jenis_kelamin'] = df['jenis_kelamin'].astype(str)
+    models, engines = {}, {}
+    for name in sorted(MODEL_FILES.values()):
+        model, scaler, label_encoder = load_artifacts(name)
+        models[name] = model
+        engines[name] = build_engine(model, scaler, label_encoder)
+    first = next(iter(engines.values()))
+
+    def encode():
+        return first.encode_frame(fill_missing(df[expected_cols].copy(), scaler))
+
+    X = encode()
+    timings = {'encode_frame': best_seconds(encode, args.repeat)}
+    for name, engine in engines.items():
+        timings[f'{name}.predict_proba_puas'] = best_seconds(
+            lambda: engine.predict_proba_puas(X), args.repeat)
+    components = sum(timings.values())
+    compare = best_seconds(lambda: compare_frame(df, engines, scaler), args.repeat)
+    separate = best_seconds(lambda: [score_frame(df, models[name], scaler, label_encoder, engine=engine)
+                                     for name, engine in engines.items()], args.repeat)
+
+    print(f"Scoring {args.rows:,} baris (waktu terbaik dari {args.repeat})")
+    print("-" * 60)
+    for label, seconds in timings.items():
+        print(f"{label:34s} {seconds * 1000:9.1f} ms")
+    print(f"{'jumlah komponen':34s} {components * 1000:9.1f} ms")
+    print("-" * 60)
+    print(f"{'compare_frame (semua + ensemble)':34s} {compare * 1000:9.1f} ms   "
+          f"{compare / components:.2f}x komponen")
+    print(f"{'score_frame terpisah per model':34s} {separate * 1000:9.1f} ms   "
+          f"{separate / compare:.2f}x compare_frame")
+
+    single = best_seconds(lambda: compare_one(engines, SAMPLE_INPUT), 2000)
+    print(f"\ncompare_one (satu input, {len(engines)} model + ensemble): {single * 1e6:.1f} µs")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
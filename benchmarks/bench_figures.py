@@ -0,0 +1,136 @@
+"""Biaya grafik dashboard sebelum dan sesudah figure_cache.py.
+
+1. Per grafik (satu proses): membangun figure + serialisasi seperti
+   st.plotly_chart (to_dict lalu plotly.io.to_json), dibangun dari awal vs
+   lewat cache (Beranda dipakai ulang, gauge/bar di-clone dari template).
+2. Waktu rerun app.py lewat AppTest Streamlit di proses baru, dengan
+   ELEARNING_FIGURE_CACHE=0 (sebelum) dan 1 (sesudah). Setiap rerun
+   menampilkan Beranda dan hasil prediksi (enam grafik).
+
+Jalankan dari root project:
+    python benchmarks/bench_figures.py --reruns 30
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import plotly.io as pio  # noqa: E402
+import plotly.tools  # noqa: E402
+
+import figure_cache  # noqa: E402
+from aggregate_store import load_or_build  # noqa: E402
+from charts import (create_distribution_pie, create_feature_comparison,  # noqa: E402
+                    create_gauge_chart, create_ratings_chart, create_trend_chart)
+
+SAMPLE_INPUT = {'kualitas_materi': 3, 'kemudahan_penggunaan': 4,
+                'stabilitas_aplikasi': 2, 'interaksi_pengajar': 5}
+
+RERUN_DRIVER = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+sys.path.insert(0, '.')
+from streamlit.testing.v1 import AppTest
+reruns = int(sys.argv[1])
+at = AppTest.from_file('app.py', default_timeout=120).run()
+at.button[0].click().run()
+assert not at.exception, at.exception
+times = []
+for i in range(reruns):
+    start = time.perf_counter()
+    at.button[0].click().run()
+    times.append(time.perf_counter() - start)
+assert not at.exception, at.exception
+print(json.dumps(times))
+"""
+
+
+def serialize(figure):
+    """Pekerjaan yang dilakukan st.plotly_chart untuk setiap figure"""
+    figure = plotly.tools.return_figure_from_figure_or_data(figure, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def best_ms(fn, repeat=200):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def figure_builders(summary):
+    """Pasangan (nama, bangun dari awal, lewat cache) untuk setiap grafik"""
+    ratings_text = [f"{r:.1f}/5" for r in summary['ratings']]
+    fresh = {
+        'trend': lambda: create_trend_chart(summary['months'], summary['trend_satisfied'],
+                                            summary['trend_unsatisfied']),
+        'ratings': lambda: create_ratings_chart(summary['rating_labels'], summary['ratings'],
+                                                ratings_text),
+        'age': lambda: create_distribution_pie(summary['age_labels'], summary['age_counts'],
+                                               "Pengguna Berdasarkan Usia"),
+        'freq': lambda: create_distribution_pie(summary['freq_labels'], summary['freq_counts'],
+                                                "Distribusi Frekuensi Login"),
+    }
+    rows = [(name, build, lambda name=name, build=build: figure_cache.static_figure(name, 1, build))
+            for name, build in fresh.items()]
+    rows.append(('gauge', lambda: create_gauge_chart(0.73, "Tingkat Keyakinan"),
+                 lambda: figure_cache.gauge_chart(0.73, "Tingkat Keyakinan")))
+    rows.append(('feature_comparison', lambda: create_feature_comparison(SAMPLE_INPUT),
+                 lambda: figure_cache.feature_comparison(SAMPLE_INPUT)))
+    return rows
+
+
+def run_reruns(reruns, enabled):
+    env = dict(os.environ, ELEARNING_FIGURE_CACHE='1' if enabled else '0')
+    output = subprocess.run([sys.executable, '-c', RERUN_DRIVER, str(reruns)], cwd=ROOT, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return np.array(json.loads(output.strip().splitlines()[-1])) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark figure cache dashboard")
+    parser.add_argument('--reruns', type=int, default=30)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    summary = load_or_build().summary()
+
+    print("Per grafik: bangun + serialisasi (ms, waktu terbaik)")
+    print("-" * 78)
+    print(f"{'grafik':20s} {'bangun':>8s} {'serialisasi':>12s} {'total':>8s} {'cache':>8s} {'speedup':>8s}")
+    totals = [0.0, 0.0]
+    for name, build, cached in figure_builders(summary):
+        build_ms = best_ms(build)
+        total_ms = best_ms(lambda: serialize(build()))
+        cached_ms = best_ms(lambda: serialize(cached()))
+        totals[0] += total_ms
+        totals[1] += cached_ms
+        print(f"{name:20s} {build_ms:8.2f} {total_ms - build_ms:12.2f} {total_ms:8.2f} "
+              f"{cached_ms:8.2f} {total_ms / cached_ms:7.1f}x")
+    print(f"{'jumlah':20s} {'':8s} {'':12s} {totals[0]:8.2f} {totals[1]:8.2f} "
+          f"{totals[0] / totals[1]:7.1f}x")
+
+    print(f"\nRerun app.py via AppTest ({args.reruns} rerun per mode, Beranda + hasil prediksi)")
+    print("-" * 78)
+    medians = {}
+    for label, enabled in [('tanpa cache', False), ('figure cache', True)]:
+        times = run_reruns(args.reruns, enabled)
+        medians[label] = np.median(times)
+        print(f"{label:14s}: median {np.median(times):7.1f} ms   p95 {np.percentile(times, 95):7.1f} ms")
+    print("-" * 78)
+    before, after = medians.values()
+    print(f"Rerun {before - after:.1f} ms lebih cepat ({before / after:.2f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Microbenchmark latensi satu prediksi: jalur lama vs engine NumPy.
+
+Jalankan dari root project:
+    python benchmarks/bench_inference.py --repeat 2000
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.filterwarnings('ignore')
+
+import numpy as np
+import pandas as pd
+
+from artifacts import load_artifacts
+from batch_predict import preprocess_batch
+from inference_engine import build_engine
+
+SAMPLE_INPUT = {
+    'usia': 25,
+    'jenis_kelamin': 'L',
+    'durasi_penggunaan': 3.0,
+    'frekuensi_login': 4,
+    'kualitas_materi': 3,
+    'kemudahan_penggunaan': 3,
+    'stabilitas_aplikasi': 3,
+    'interaksi_pengajar': 3,
+}
+
+
+def measure(func, repeat, warmup=50):
+    """Menjalankan func berulang kali dan mengembalikan latensi (mikrodetik)"""
+    for _ in range(warmup):
+        func()
+    timings = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def report(name, timings):
+    p50, p99 = np.percentile(timings, [50, 99])
+    print(f"   {name:32s} p50: {p50:9.1f} µs   p99: {p99:9.1f} µs")
+    return p50, p99
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark latensi prediksi tunggal")
+    parser.add_argument('--model', default='logreg_model')
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=100_000,
+                        help="Jumlah baris untuk benchmark batch")
+    args = parser.parse_args(argv)
+
+    model, scaler, label_encoder = load_artifacts(args.model)
+    engine = build_engine(model, scaler, label_encoder)
+    if engine is None:
+        print(f"✗ Engine NumPy belum mendukung {args.model}")
+        return 1
+
+    def legacy_path():
+        X = preprocess_batch(pd.DataFrame([SAMPLE_INPUT]), scaler, label_encoder)
+        model.predict(X)[0]
+        model.predict_proba(X)[0]
+
+    def engine_path():
+        engine.predict_one(SAMPLE_INPUT)
+
+    print(f"Benchmark prediksi tunggal ({args.model}, {args.repeat} ulangan)")
+    legacy_p50, _ = report("preprocess_input + predict", measure(legacy_path, args.repeat))
+    engine_p50, _ = report("engine.predict_one", measure(engine_path, args.repeat))
+    print(f"   ✓ Speedup p50: {legacy_p50 / engine_p50:.0f}x")
+
+    # Batch: baris dataset diulang hingga ukuran batch
+    df = pd.read_csv('dataset_kepuasan_pengguna_elearning.csv').dropna()
+    df = df.sample(args.batch, replace=True, random_state=42).reset_index(drop=True)
+    X_raw = engine.encode_frame(df)
+
+    print(f"\nBenchmark batch ({args.batch} baris)")
+    start = time.perf_counter()
+    model.predict_proba(preprocess_batch(df, scaler, label_encoder).to_numpy())
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.predict_with_proba(X_raw)
+    engine_seconds = time.perf_counter() - start
+
+    print(f"   {'preprocess_batch + predict_proba':32s} {args.batch / legacy_seconds:12,.0f} rows/sec")
+    print(f"   {'engine.predict_with_proba':32s} {args.batch / engine_seconds:12,.0f} rows/sec")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""CPU server Streamlit per interaksi Prediksi dengan banyak sesi bersamaan.
+
+Script menjalankan `streamlit run <app>` lalu membuka N sesi websocket yang
+berperilaku seperti browser: setiap interaksi mengubah kedelapan input dan
+meminta prediksi. Pesan dikirim dengan protokol Streamlit (BackMsg/ForwardMsg):
+
+- layout sidebar lama: satu rerun penuh per input yang diubah, lalu klik Prediksi
+  (9 rerun per interaksi);
+- layout form: satu submit; jika panel adalah fragment, yang dijalankan ulang
+  hanya fragment tersebut.
+
+CPU proses server (utime + stime dari /proc, Linux) diukur selama fase
+interaksi dan dibagi jumlah interaksi.
+
+Jalankan dari root project:
+    python benchmarks/bench_interaction.py --sessions 20 --interactions 5
+    python benchmarks/bench_interaction.py --app app_lama.py
+Argumen setelah `--` diteruskan ke `streamlit run`.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INPUT_LABELS = ['Usia:', 'Jenis Kelamin:', 'Penggunaan Harian (jam):', 'Login per Minggu:',
+                'Kualitas Materi:', 'Kemudahan Penggunaan:', 'Stabilitas Aplikasi:',
+                'Interaksi Pengajar:']
+SUBMIT_LABEL = 'Prediksi'
+FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+class Session:
+    """Satu sesi browser tiruan"""
+
+    def __init__(self, url, seed):
+        self.url = url
+        self.rng = random.Random(seed)
+        self.widgets = {}       # label -> (jenis, proto widget)
+        self.values = {}        # id -> WidgetState terakhir
+        self.fragment_id = ''
+        self.reruns = 0
+        self.errors = []
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, subprotocols=['streamlit'])
+
+    async def rerun(self, changed=(), fragment_id=''):
+        """Mengirim rerun_script dengan semua nilai widget; menunggu script selesai"""
+        for state in changed:
+            self.values[state.id] = state
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(
+            state for state in self.values.values() if not state.HasField('trigger_value'))
+        msg.rerun_script.widget_states.widgets.extend(
+            state for state in changed if state.HasField('trigger_value'))
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        self.reruns += 1
+        while True:
+            payload = await self.ws.read_message()
+            if payload is None:
+                raise ConnectionError("Websocket ditutup server")
+            forward = ForwardMsg()
+            forward.ParseFromString(payload)
+            kind = forward.WhichOneof('type')
+            if kind == 'delta':
+                self._collect(forward.delta)
+            elif kind == 'script_finished':
+                if forward.script_finished in FINISHED:
+                    return
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    raise RuntimeError(f"Script gagal: {forward.script_finished}")
+
+    def _collect(self, delta):
+        if delta.WhichOneof('type') != 'new_element':
+            return
+        element = delta.new_element
+        kind = element.WhichOneof('type')
+        if kind == 'exception':
+            self.errors.append(element.exception.message)
+            return
+        widget = getattr(element, kind)
+        label = getattr(widget, 'label', None)
+        if label in INPUT_LABELS or label == SUBMIT_LABEL:
+            self.widgets[label] = (kind, widget)
+            if label == SUBMIT_LABEL and delta.fragment_id:
+                self.fragment_id = delta.fragment_id
+
+    def random_state(self, label):
+        kind, widget = self.widgets[label]
+        state = WidgetState(id=widget.id)
+        if kind == 'slider':
+            steps = int(round((widget.max - widget.min) / widget.step))
+            state.double_array_value.data.append(widget.min + self.rng.randint(0, steps) * widget.step)
+        else:
+            state.int_value = self.rng.randrange(len(widget.options))
+        return state
+
+    async def interact(self):
+        """Mengubah kedelapan input lalu meminta prediksi"""
+        kind, submit = self.widgets[SUBMIT_LABEL]
+        click = WidgetState(id=submit.id, trigger_value=True)
+        changes = [self.random_state(label) for label in INPUT_LABELS]
+        if submit.is_form_submitter:
+            await self.rerun(changes + [click], fragment_id=self.fragment_id)
+        else:
+            for state in changes:
+                await self.rerun([state])
+            await self.rerun([click])
+
+
+def server_cpu_seconds(pid):
+    with open(f'/proc/{pid}/stat') as file:
+        fields = file.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app, port, extra_args=()):
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', app, '--server.headless', 'true',
+         '--server.port', str(port), '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false', *extra_args],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("Server Streamlit tidak merespon")
+
+
+async def run_load(url, pid, n_sessions, n_interactions):
+    sessions = [Session(url, seed) for seed in range(n_sessions)]
+    for session in sessions:
+        await session.connect()
+        await session.rerun()
+
+    # Satu interaksi pemanasan per sesi (cache resource, engine, cube)
+    await asyncio.gather(*(session.interact() for session in sessions))
+
+    latencies = []
+
+    async def worker(session):
+        for _ in range(n_interactions):
+            start = time.perf_counter()
+            await session.interact()
+            latencies.append(time.perf_counter() - start)
+
+    for session in sessions:
+        session.reruns = 0
+    cpu_start, wall_start = server_cpu_seconds(pid), time.perf_counter()
+    await asyncio.gather(*(worker(session) for session in sessions))
+    cpu = server_cpu_seconds(pid) - cpu_start
+    wall = time.perf_counter() - wall_start
+    for session in sessions:
+        session.ws.close()
+    errors = [error for session in sessions for error in session.errors]
+    reruns = sum(session.reruns for session in sessions)
+    return cpu, wall, np.array(latencies) * 1000, reruns, errors, sessions[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CPU server per interaksi Prediksi")
+    parser.add_argument('--app', default='app.py')
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--interactions', type=int, default=5, help="Interaksi per sesi")
+    parser.add_argument('streamlit_args', nargs='*', help="Opsi tambahan untuk streamlit run")
+    args = parser.parse_args()
+
+    if not os.path.exists(f'/proc/{os.getpid()}/stat'):
+        print("✗ Pengukuran CPU server membutuhkan /proc (Linux)")
+        return 1
+
+    port = free_port()
+    process = start_server(args.app, port, args.streamlit_args)
+    try:
+        cpu, wall, latencies, reruns, errors, sample = asyncio.run(
+            run_load(f'ws://127.0.0.1:{port}/_stcore/stream', process.pid,
+                     args.sessions, args.interactions))
+    finally:
+        process.terminate()
+        process.wait()
+
+    _, submit = sample.widgets[SUBMIT_LABEL]
+    layout = ('form + fragment' if sample.fragment_id else 'form') if submit.is_form_submitter \
+        else 'sidebar (rerun per input)'
+    n = len(latencies)
+    print(f"{args.app}: {layout}")
+    print(f"{args.sessions} sesi x {args.interactions} interaksi = {n} interaksi, "
+          f"{reruns / n:.0f} rerun per interaksi")
+    print("-" * 60)
+    print(f"CPU server per interaksi : {cpu / n * 1000:8.1f} ms")
+    print(f"Latensi interaksi        : p50 {np.percentile(latencies, 50):7.1f} ms   "
+          f"p95 {np.percentile(latencies, 95):7.1f} ms")
+    print(f"Throughput               : {n / wall:8.1f} interaksi/detik")
+    if errors:
+        print(f"✗ {len(errors)} exception di app: {errors[0]}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
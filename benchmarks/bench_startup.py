@@ -0,0 +1,72 @@
+"""Waktu cold start dashboard: dari proses diluncurkan sampai halaman pertama
+selesai dirender, dan sampai prediksi pertama tampil.
+
+Setiap percobaan menjalankan app.py di proses Python baru lewat AppTest
+Streamlit. Jeda --think-ms meniru pengguna yang melihat Beranda sebelum
+menekan tombol Prediksi; selama jeda itu thread warm-up memuat artefak.
+
+Jalankan dari root project:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DRIVER = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+sys.path.insert(0, '.')
+launch, think = float(sys.argv[1]), float(sys.argv[2])
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file('app.py', default_timeout=120).run()
+first_page = time.time()
+assert not at.exception, at.exception
+time.sleep(think)
+click = time.time()
+at.button[0].click().run()
+assert not at.exception, at.exception
+assert any('prediction-box' in m.value for m in at.markdown)
+done = time.time()
+print(json.dumps({'first_page': first_page - launch,
+                  'first_prediction': done - launch,
+                  'click_to_result': done - click}))
+"""
+
+
+def run_once(think_seconds, warmup):
+    env = dict(os.environ, ELEARNING_WARMUP='1' if warmup else '0')
+    launch = time.time()
+    output = subprocess.run([sys.executable, '-c', DRIVER, str(launch), str(think_seconds)],
+                            cwd=ROOT, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start app.py")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--think-ms', type=float, default=500,
+                        help="Jeda antara halaman pertama dan klik Prediksi")
+    args = parser.parse_args()
+
+    print(f"Cold start app.py ({args.repeat} proses baru per mode, jeda {args.think_ms:.0f} ms)")
+    print("-" * 72)
+    print(f"{'mode':18s} {'halaman pertama':>16s} {'prediksi pertama':>17s} {'klik -> hasil':>15s}")
+    for label, warmup in [('tanpa warm-up', False), ('warm-up', True)]:
+        runs = [run_once(args.think_ms / 1000, warmup) for _ in range(args.repeat)]
+        median = {key: np.median([r[key] for r in runs]) * 1000 for key in runs[0]}
+        print(f"{label:18s} {median['first_page']:13.0f} ms {median['first_prediction']:14.0f} ms "
+              f"{median['click_to_result']:12.0f} ms")
+    print("-" * 72)
+    print("Nilai adalah median; waktu dihitung sejak proses diluncurkan.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
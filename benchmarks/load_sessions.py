@@ -0,0 +1,218 @@
+"""Kapasitas satu proses dashboard: latensi rerun, CPU, dan memori saat jumlah sesi naik.
+
+Script menjalankan `streamlit run app.py` secara lokal (tanpa jaringan luar),
+lalu untuk setiap nilai N di --sessions membuka N sesi websocket tiruan
+(klien headless dari bench_interaction.py). Setiap sesi berulang kali:
+menunggu think time acak, kadang mengganti model di sidebar (satu rerun
+penuh), lalu mengisi kedelapan input dengan nilai acak dan menekan Prediksi
+(satu rerun fragment). Setiap rerun diukur dari pesan dikirim sampai script
+selesai.
+
+Per langkah N dicatat p50/p95/p99 latensi rerun, CPU server (core terpakai
+dan ms per rerun, dari /proc), serta RSS server. Kapasitas adalah N terbesar
+dengan p95 di bawah --slo-ms; naikkan --sessions secara bertahap sampai
+latensi melewati batas tersebut. Load generator ikut memakai CPU mesin yang
+sama, jadi CPU klien juga dicatat; di mesin dengan sedikit core, hasilnya
+batas bawah kapasitas server.
+
+Jalankan dari root project:
+    python benchmarks/load_sessions.py --sessions 1,2,4,8,16,32 --duration 20
+    python benchmarks/load_sessions.py --think 0 --output kapasitas.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bench_interaction import Session, free_port, server_cpu_seconds, start_server
+
+MODEL_LABEL = 'Model:'
+
+
+def server_rss_mb(pid):
+    """RSS proses server saat ini (MB, dari /proc/<pid>/status)"""
+    with open(f'/proc/{pid}/status') as file:
+        for line in file:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+class LoadSession(Session):
+    """Sesi tiruan yang juga memilih model acak dan mencatat latensi setiap rerun"""
+
+    def __init__(self, url, seed, think, model_switch):
+        super().__init__(url, seed)
+        self.think = think
+        self.model_switch = model_switch
+        self.latencies = []
+        self.recording = False
+
+    async def rerun(self, changed=(), fragment_id=''):
+        start = time.perf_counter()
+        await super().rerun(changed, fragment_id)
+        if self.recording:
+            self.latencies.append(time.perf_counter() - start)
+
+    def _collect(self, delta):
+        super()._collect(delta)
+        if delta.WhichOneof('type') == 'new_element':
+            element = delta.new_element
+            kind = element.WhichOneof('type')
+            if kind == 'selectbox' and element.selectbox.label == MODEL_LABEL:
+                self.widgets[MODEL_LABEL] = (kind, element.selectbox)
+
+    async def interact(self):
+        """Ganti model (rerun penuh) dengan peluang model_switch, lalu prediksi dengan input acak"""
+        if MODEL_LABEL in self.widgets and self.rng.random() < self.model_switch:
+            await self.rerun([self.random_state(MODEL_LABEL)])
+        await super().interact()
+
+    async def run_until(self, deadline):
+        while time.perf_counter() < deadline:
+            if self.think > 0:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think))
+            await self.interact()
+
+
+async def run_step(url, pid, n_sessions, duration, think, model_switch, seed):
+    """Satu langkah beban dengan n_sessions sesi; mengembalikan ringkasan metrik"""
+    sessions = [LoadSession(url, seed * 1000 + i, think, model_switch) for i in range(n_sessions)]
+    try:
+        for session in sessions:
+            await session.connect()
+            await session.rerun()
+        # Satu interaksi pemanasan per sesi, tidak dicatat
+        await asyncio.gather(*(session.interact() for session in sessions))
+
+        for session in sessions:
+            session.recording = True
+        cpu_start, client_start = server_cpu_seconds(pid), time.process_time()
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(session.run_until(wall_start + duration) for session in sessions))
+        cpu = server_cpu_seconds(pid) - cpu_start
+        client_cpu = time.process_time() - client_start
+        wall = time.perf_counter() - wall_start
+        rss = server_rss_mb(pid)
+    finally:
+        for session in sessions:
+            if hasattr(session, 'ws'):
+                session.ws.close()
+
+    latencies = np.array([x for session in sessions for x in session.latencies]) * 1000
+    errors = [error for session in sessions for error in session.errors]
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+    return {
+        'sessions': n_sessions,
+        'reruns': len(latencies),
+        'reruns_per_sec': len(latencies) / wall,
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'cpu_cores': cpu / wall,
+        'cpu_ms_per_rerun': cpu / max(len(latencies), 1) * 1000,
+        'client_cores': client_cpu / wall,
+        'rss_mb': rss,
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+    }
+
+
+def capacity(steps, slo_ms):
+    """(langkah terbesar dengan p95 <= slo_ms, sesi per core) atau (None, None)
+
+    Script Streamlit berjalan di thread satu proses (GIL), jadi satu proses
+    memakai paling banyak sekitar satu core. Sesi per core = N / max(core
+    terpakai, 1), tanpa ekstrapolasi ke atas: latensi biasanya sudah naik
+    tajam sebelum server memakai satu core penuh.
+    """
+    passing = [step for step in steps if step['p95_ms'] <= slo_ms and not step['errors']]
+    if not passing:
+        return None, None
+    best = max(passing, key=lambda step: step['sessions'])
+    return best, best['sessions'] / max(best['cpu_cores'], 1.0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test dashboard dengan banyak sesi Streamlit")
+    parser.add_argument('--app', default='app.py')
+    parser.add_argument('--sessions', default='1,2,4,8,16',
+                        help="Daftar jumlah sesi per langkah, dipisah koma")
+    parser.add_argument('--duration', type=float, default=15.0, help="Detik pengukuran per langkah")
+    parser.add_argument('--think', type=float, default=1.0,
+                        help="Rata-rata think time antar interaksi (detik, eksponensial; 0 = tanpa jeda)")
+    parser.add_argument('--model-switch', type=float, default=0.3,
+                        help="Peluang sesi mengganti model sebelum prediksi")
+    parser.add_argument('--slo-ms', type=float, default=500.0, help="Batas p95 latensi rerun")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help="Tulis hasil ke file JSON")
+    parser.add_argument('streamlit_args', nargs='*', help="Opsi tambahan untuk streamlit run")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(f'/proc/{os.getpid()}/stat'):
+        print("✗ Pengukuran CPU dan memori server membutuhkan /proc (Linux)")
+        return 1
+    counts = [int(n) for n in args.sessions.split(',')]
+
+    # Prediksi dari load test tidak dicampur dengan log prediksi sungguhan
+    log_dir = tempfile.TemporaryDirectory(prefix='load_sessions_')
+    os.environ['ELEARNING_PREDICTION_LOG_DIR'] = log_dir.name
+
+    port = free_port()
+    process = start_server(args.app, port, args.streamlit_args)
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    print(f"Load test {args.app} (pid {process.pid}): {args.duration:.0f} detik per langkah, "
+          f"think time {args.think:.1f} detik, ganti model {args.model_switch:.0%}")
+    print(f"{'sesi':>5} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'CPU core':>9} {'CPU/rerun':>10} {'klien':>6} {'RSS MB':>7}")
+    print("-" * 79)
+    steps = []
+    try:
+        for n in counts:
+            step = asyncio.run(run_step(url, process.pid, n, args.duration, args.think,
+                                        args.model_switch, args.seed))
+            steps.append(step)
+            mark = "" if step['p95_ms'] <= args.slo_ms else "  ✗ p95 > SLO"
+            print(f"{n:>5} {step['reruns_per_sec']:>8.1f} {step['p50_ms']:>8.1f} {step['p95_ms']:>8.1f} "
+                  f"{step['p99_ms']:>8.1f} {step['cpu_cores']:>9.2f} "
+                  f"{step['cpu_ms_per_rerun']:>8.1f}ms {step['client_cores']:>6.2f} "
+                  f"{step['rss_mb']:>7.0f}{mark}")
+    finally:
+        process.terminate()
+        process.wait()
+        log_dir.cleanup()
+    print("-" * 79)
+
+    best, per_core = capacity(steps, args.slo_ms)
+    if best is None:
+        print(f"✗ Tidak ada langkah dengan p95 <= {args.slo_ms:.0f} ms")
+    else:
+        print(f"✓ Kapasitas: {best['sessions']} sesi dengan p95 {best['p95_ms']:.0f} ms "
+              f"(SLO {args.slo_ms:.0f} ms) memakai {best['cpu_cores']:.2f} core "
+              f"-> ~{per_core:.0f} sesi per core")
+    if steps and steps[-1]['cpu_cores'] + steps[-1]['client_cores'] > 0.9 * os.cpu_count():
+        print(f"  (CPU mesin jenuh: server {steps[-1]['cpu_cores']:.2f} + klien "
+              f"{steps[-1]['client_cores']:.2f} core dari {os.cpu_count()})")
+    errors = sum(step['errors'] for step in steps)
+    if errors:
+        first = next(step['first_error'] for step in steps if step['first_error'])
+        print(f"✗ {errors} exception di app: {first}")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'app': args.app, 'duration': args.duration, 'think': args.think,
+                       'model_switch': args.model_switch, 'slo_ms': args.slo_ms,
+                       'cpu_count': os.cpu_count(), 'steps': steps,
+                       'capacity_sessions': best['sessions'] if best else None,
+                       'sessions_per_core': per_core}, file, indent=2)
+        print(f"✓ Hasil disimpan ke {args.output}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Load test untuk prediction_service.py: throughput dan tail latency.
+
+Jalankan layanan terlebih dahulu, lalu dari root project:
+    python prediction_service.py --port 8000 &
+    python benchmarks/load_test_service.py --port 8000 --concurrency 64 --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+
+def random_input(rng, model):
+    """Satu input acak di rentang slider dashboard"""
+    return {
+        'model': model,
+        'usia': rng.randint(18, 50),
+        'jenis_kelamin': rng.choice(['L', 'P']),
+        'durasi_penggunaan': rng.randint(0, 16) / 2,
+        'frekuensi_login': rng.randint(1, 7),
+        'kualitas_materi': rng.randint(1, 5),
+        'kemudahan_penggunaan': rng.randint(1, 5),
+        'stabilitas_aplikasi': rng.randint(1, 5),
+        'interaksi_pengajar': rng.randint(1, 5),
+    }
+
+
+async def worker(host, port, payloads, latencies, errors):
+    """Satu koneksi keep-alive yang mengirim request secara berurutan"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in payloads:
+            request = (f"POST /predict HTTP/1.1\r\nHost: {host}\r\n"
+                       f"Content-Type: application/json\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode().partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if b' 200 ' not in status_line:
+                errors.append(status_line)
+    finally:
+        writer.close()
+
+
+async def run(args):
+    rng = random.Random(42)
+    payloads = []
+    for _ in range(args.requests):
+        if args.batch_size > 1:
+            body = {'model': args.model,
+                    'instances': [random_input(rng, args.model) for _ in range(args.batch_size)]}
+        else:
+            body = random_input(rng, args.model)
+        payloads.append(json.dumps(body).encode())
+
+    latencies, errors = [], []
+    per_worker = [payloads[i::args.concurrency] for i in range(args.concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(args.host, args.port, chunk, latencies, errors)
+                           for chunk in per_worker if chunk))
+    seconds = time.perf_counter() - start
+    return np.array(latencies) * 1000, errors, seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test layanan prediksi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--model', default='logreg_model')
+    parser.add_argument('--concurrency', type=int, default=64, help="Jumlah koneksi paralel")
+    parser.add_argument('--requests', type=int, default=10000, help="Total request")
+    parser.add_argument('--batch-size', type=int, default=1, help="Jumlah input per request")
+    args = parser.parse_args(argv)
+
+    latencies, errors, seconds = asyncio.run(run(args))
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    rows = len(latencies) * args.batch_size
+
+    print(f"Load test {args.host}:{args.port} ({args.concurrency} koneksi, "
+          f"{args.requests} request x {args.batch_size} baris)")
+    print(f"   Throughput : {len(latencies) / seconds:,.0f} req/sec ({rows / seconds:,.0f} rows/sec)")
+    print(f"   Latensi    : p50 {p50:.2f} ms | p95 {p95:.2f} ms | p99 {p99:.2f} ms | max {latencies.max():.2f} ms")
+    print(f"   Error      : {len(errors)}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,415 @@
+"""Suite benchmark: preprocessing, inferensi, grafik, what-if, drift, log prediksi, dan
+setiap tahap training.
+
+Hasil dibandingkan dengan baseline tersimpan (benchmarks/baseline.json); script
+keluar dengan kode 1 jika ada metrik yang lebih lambat dari baseline melebihi
+--threshold ditambah --min-delta (perlambatan absolut), sehingga dapat dipakai
+sebagai gate sebelum rilis. --min-delta menyaring fluktuasi metrik yang hanya
+beberapa milidetik, yang antar run bisa bergeser lebih dari 25%.
+
+Jalankan dari root project:
+    python benchmarks/run_benchmarks.py                     # profil quick
+    python benchmarks/run_benchmarks.py --profile full      # training 10k-10M baris
+    python benchmarks/run_benchmarks.py --only train --threshold 0.5
+    python benchmarks/run_benchmarks.py --update-baseline   # simpan hasil sebagai baseline
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.filterwarnings('ignore')
+
+import numpy as np
+import pandas as pd
+
+import training_stages as stages
+from artifacts import MODEL_FILES, expected_cols, load_artifacts
+from batch_predict import preprocess_batch
+from charts import create_feature_comparison, create_gauge_chart, create_whatif_chart
+from drift_monitor import DriftMonitor, load_reference
+from figure_cache import feature_comparison, gauge_chart, whatif_chart
+from inference_engine import build_engine
+from instrumentation import Metrics
+from prediction_cube import grid_values
+from prediction_log import PredictionLog, list_segments, read_segment
+from whatif import WHATIF_FEATURES, perturbation_matrix, sensitivity_curves
+
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+PROFILES = {
+    'quick': {'batch_sizes': [1, 1_000, 1_000_000], 'train_sizes': [10_000, 100_000]},
+    'full': {'batch_sizes': [1, 1_000, 1_000_000],
+             'train_sizes': [10_000, 100_000, 1_000_000, 10_000_000]},
+}
+
+SAMPLE_INPUT = {
+    'usia': 25,
+    'jenis_kelamin': 'L',
+    'durasi_penggunaan': 3.0,
+    'frekuensi_login': 4,
+    'kualitas_materi': 3,
+    'kemudahan_penggunaan': 3,
+    'stabilitas_aplikasi': 3,
+    'interaksi_pengajar': 3,
+}
+
+
+def synthetic_dataset(n_rows, seed=42, missing_rate=0.05, duplicate_rate=0.02):
+    """Dataset sintetis dengan skema dataset_kepuasan_pengguna_elearning.csv"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'id_responden': np.arange(1, n_rows + 1),
+        'usia': rng.integers(18, 51, n_rows),
+        'jenis_kelamin': np.where(rng.random(n_rows) < 0.5, 'L', 'P'),
+        'durasi_penggunaan': np.round(rng.uniform(0, 8, n_rows), 1),
+        'frekuensi_login': rng.integers(1, 8, n_rows),
+        'kualitas_materi': rng.integers(1, 6, n_rows).astype(np.float64),
+        'kemudahan_penggunaan': rng.integers(1, 6, n_rows),
+        'stabilitas_aplikasi': rng.integers(1, 6, n_rows).astype(np.float64),
+        'interaksi_pengajar': rng.integers(1, 6, n_rows),
+    })
+    score = (0.8 * (df['kualitas_materi'] - 3) + 0.6 * (df['stabilitas_aplikasi'] - 3)
+             + 0.4 * (df['kemudahan_penggunaan'] - 3) + 0.3 * (df['interaksi_pengajar'] - 3)
+             + rng.normal(0, 1, n_rows))
+    df['kepuasan_pengguna'] = (score > 0).astype(np.int64)
+
+    for col in stages.numeric_cols:
+        df.loc[rng.random(n_rows) < missing_rate, col] = np.nan
+
+    # Sebagian baris disalin dari baris lain (tanpa id) agar deduplikasi di tahap clean bekerja
+    n_duplicates = int(n_rows * duplicate_rate)
+    source = rng.integers(0, n_rows, n_duplicates)
+    target = rng.integers(0, n_rows, n_duplicates)
+    feature_cols = [c for c in df.columns if c != 'id_responden']
+    df.loc[target, feature_cols] = df.loc[source, feature_cols].to_numpy()
+    return df
+
+
+def measure(fn, setup=None, repeat=7, min_seconds=0.2):
+    """Median waktu per panggilan dari repeat pengukuran (detik); setup() tidak ikut diukur
+
+    Operasi yang sangat cepat diulang dalam satu loop sampai minimal min_seconds
+    agar resolusi timer tidak mendominasi. GC dimatikan selama pengukuran
+    (seperti timeit) karena jeda GC membuat hasil tidak stabil.
+    """
+    setup = setup or (lambda: ())
+    gc_enabled = gc.isenabled()
+    try:
+        gc.disable()
+        return _measure(fn, setup, repeat, min_seconds)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure(fn, setup, repeat, min_seconds):
+    number = 1
+    if repeat > 1:
+        while True:
+            args = [setup() for _ in range(number)]
+            start = time.perf_counter()
+            for a in args:
+                fn(*a)
+            if time.perf_counter() - start >= min_seconds or number >= 1 << 16:
+                break
+            number *= 4
+
+    timings = []
+    for _ in range(repeat):
+        args = [setup() for _ in range(number)]
+        start = time.perf_counter()
+        for a in args:
+            fn(*a)
+        timings.append((time.perf_counter() - start) / number)
+    return float(np.median(timings))
+
+
+def bench_preprocessing(batch_sizes, scaler, label_encoder):
+    results = {}
+    results['preprocess_input[1]'] = measure(
+        lambda: preprocess_batch(pd.DataFrame([SAMPLE_INPUT]), scaler, label_encoder))
+    for n in batch_sizes:
+        if n == 1:
+            continue
+        df = synthetic_dataset(n, seed=n)
+        repeat = 5 if n >= 1_000_000 else 7
+        results[f'preprocess_batch[{n}]'] = measure(
+            lambda: preprocess_batch(df, scaler, label_encoder), repeat=repeat)
+    return results
+
+
+def bench_inference(batch_sizes, scaler, label_encoder):
+    results = {}
+    for n in batch_sizes:
+        df = synthetic_dataset(n, seed=n) if n > 1 else pd.DataFrame([SAMPLE_INPUT])
+        X = preprocess_batch(df, scaler, label_encoder).to_numpy()
+        repeat = 5 if n >= 1_000_000 else 7
+        for model_name in sorted(MODEL_FILES.values()):
+            model, _, _ = load_artifacts(model_name)
+            results[f'{model_name}.predict[{n}]'] = measure(lambda: model.predict(X), repeat=repeat)
+            results[f'{model_name}.predict_proba[{n}]'] = measure(
+                lambda: model.predict_proba(X), repeat=repeat)
+    return results
+
+
+def bench_charts():
+    # Kurva what-if datar 50% untuk ketujuh slider
+    curves = [(grid_values(col), np.full(len(grid_values(col)), 50.0)) for col in WHATIF_FEATURES]
+    points = [([SAMPLE_INPUT[col]], [50.0]) for col in WHATIF_FEATURES]
+    return {
+        'create_gauge_chart': measure(lambda: create_gauge_chart(0.73, "Tingkat Keyakinan")),
+        'create_feature_comparison': measure(lambda: create_feature_comparison(SAMPLE_INPUT)),
+        'gauge_chart_cached': measure(lambda: gauge_chart(0.73, "Tingkat Keyakinan")),
+        'feature_comparison_cached': measure(lambda: feature_comparison(SAMPLE_INPUT)),
+        'create_whatif_chart': measure(lambda: create_whatif_chart(WHATIF_FEATURES, curves, points)),
+        'whatif_chart_cached': measure(lambda: whatif_chart(WHATIF_FEATURES, curves, points)),
+    }
+
+
+def bench_whatif():
+    """Kurva what-if: satu panggilan model per titik vs satu matriks untuk semua titik"""
+    results = {}
+    for model_name in sorted(MODEL_FILES.values()):
+        model, scaler, label_encoder = load_artifacts(model_name)
+        engine = build_engine(model, scaler, label_encoder)
+        X, _ = perturbation_matrix(engine.encode(SAMPLE_INPUT))
+        # Baris yang sama sebagai input dict (jenis_kelamin tidak diperturbasi)
+        rows = [{**dict(zip(expected_cols, x)), 'jenis_kelamin': SAMPLE_INPUT['jenis_kelamin']}
+                for x in X]
+
+        def per_point():
+            return [model.predict_proba(preprocess_batch(pd.DataFrame([row]), scaler,
+                                                         label_encoder))[0, 1] for row in rows]
+
+        results[f'whatif.per_point[{model_name}]'] = measure(per_point, repeat=5)
+        results[f'whatif.batched[{model_name}]'] = measure(
+            lambda: sensitivity_curves(engine, SAMPLE_INPUT))
+    return results
+
+
+def bench_drift(batch_sizes):
+    """Biaya pencatatan drift per baris (satu baris dan batch) dan satu laporan PSI/KL"""
+    engine = build_engine(*load_artifacts(MODEL_FILES['Logistic Regression']))
+    monitor = DriftMonitor(load_reference())
+    x = engine.encode(SAMPLE_INPUT)
+    results = {'drift.observe_one': measure(lambda: monitor.observe_one(x, 'logreg_model', 1))}
+    for n in batch_sizes:
+        if n == 1:
+            continue
+        X = engine.encode_frame(synthetic_dataset(n))
+        prediction = engine.predict_with_proba(X)[0]
+        results[f'drift.observe[{n}]'] = measure(
+            lambda: monitor.observe(X, {'logreg_model': prediction}))
+    results['drift.report'] = measure(monitor.report)
+    return results
+
+
+def bench_prediction_log(workdir, n=10_000):
+    """Log prediksi: antre satu record (jalur UI), flush ke segmen mmap, baca segmen zero-copy"""
+    x = build_engine(*load_artifacts(MODEL_FILES['Logistic Regression'])).encode(SAMPLE_INPUT)
+    directory = os.path.join(workdir, 'prediction_log')
+
+    # Antrean tanpa batas dan tidak pernah di-flush: yang diukur hanya jalur UI
+    queue_only = PredictionLog(directory, max_pending=float('inf'))
+    results = {'log.append': measure(lambda: queue_only.log(x, 'logreg_model', 1, 0.73))}
+
+    log = PredictionLog(directory)
+
+    def fill():
+        for _ in range(n):
+            log.log(x, 'logreg_model', 1, 0.73)
+        return ()
+
+    # Satu flush per pengukuran (tanpa loop kalibrasi) agar jumlah segmen tetap kecil
+    results[f'log.flush[{n}]'] = measure(log.flush, setup=fill, min_seconds=0)
+    log.close()
+
+    path = list_segments(directory)[0]
+    results['log.read_segment'] = measure(lambda: read_segment(path))
+    for path in list_segments(directory):
+        os.remove(path)
+    os.rmdir(directory)
+    return results
+
+
+def bench_instrumentation():
+    """Overhead satu span saat instrumentasi nonaktif dan aktif"""
+    def run_span(metrics):
+        with metrics.span('bench'):
+            pass
+
+    disabled, enabled = Metrics(enabled=False), Metrics(enabled=True)
+    return {
+        'span[disabled]': measure(lambda: run_span(disabled)),
+        'span[enabled]': measure(lambda: run_span(enabled)),
+    }
+
+
+def bench_training(n_rows, workdir):
+    """Setiap tahap bernomor train_model.py pada dataset sintetis n_rows baris"""
+    path = os.path.join(workdir, f'synthetic_{n_rows}.csv')
+    synthetic_dataset(n_rows).to_csv(path, index=False)
+    repeat = 1 if n_rows >= 1_000_000 else 5
+    prefix = f'train[{n_rows}]'
+    results = {}
+
+    results[f'{prefix}.load'] = measure(lambda: stages.load_dataset(path), repeat=repeat)
+    raw = stages.load_dataset(path)
+    os.remove(path)
+
+    results[f'{prefix}.clean'] = measure(stages.clean_dataset, lambda: (raw,), repeat=repeat)
+    cleaned, _ = stages.clean_dataset(raw)
+    del raw
+    results[f'{prefix}.impute'] = measure(stages.impute_missing, lambda: (cleaned.copy(),),
+                                          repeat=repeat)
+    imputed, _ = stages.impute_missing(cleaned.copy())
+    del cleaned
+    results[f'{prefix}.encode'] = measure(stages.encode_categorical, lambda: (imputed.copy(),),
+                                          repeat=repeat)
+    encoded, _ = stages.encode_categorical(imputed.copy())
+    del imputed
+
+    X, y = stages.split_features(encoded)
+    results[f'{prefix}.split'] = measure(stages.split_train_test, lambda: (X, y), repeat=repeat)
+    X_train, X_test, y_train, y_test = stages.split_train_test(X, y)
+    del encoded, X, y
+    results[f'{prefix}.scale'] = measure(stages.scale_features, lambda: (X_train, X_test),
+                                         repeat=repeat)
+    _, X_train_scaled, _ = stages.scale_features(X_train, X_test)
+
+    results[f'{prefix}.fit_logreg'] = measure(
+        stages.fit_logreg, lambda: (X_train_scaled, y_train), repeat=repeat)
+    results[f'{prefix}.fit_dt'] = measure(
+        stages.fit_decision_tree, lambda: (X_train_scaled, y_train), repeat=repeat)
+    return results
+
+
+def is_regression(seconds, base, threshold, min_delta):
+    """Lebih lambat dari baseline lebih dari threshold (relatif) dan min_delta (detik)"""
+    return seconds > base * (1 + threshold) and seconds - base > min_delta
+
+
+def compare(results, baseline, threshold, min_delta):
+    """Mencetak tabel perbandingan; mengembalikan daftar metrik yang regresi"""
+    regressions = []
+    print(f"\n{'metrik':45s} {'sekarang':>12s} {'baseline':>12s} {'rasio':>8s}")
+    print("-" * 80)
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:45s} {format_seconds(seconds):>12s} {'-':>12s} {'baru':>8s}")
+            continue
+        ratio = seconds / base
+        flag = ''
+        if is_regression(seconds, base, threshold, min_delta):
+            regressions.append(name)
+            flag = '  ✗ REGRESI'
+        print(f"{name:45s} {format_seconds(seconds):>12s} {format_seconds(base):>12s} "
+              f"{ratio:7.2f}x{flag}")
+    return regressions
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite benchmark dengan deteksi regresi")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument('--only', default=None,
+                        help="Hanya grup dengan awalan ini: preprocess, inference, charts, "
+                             "whatif, drift, log, instrumentation, train")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Batas perlambatan relatif terhadap baseline (0.25 = 25%%)")
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help="Perlambatan absolut minimum (detik) agar dihitung regresi")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Simpan hasil sebagai baseline baru (digabung dengan yang lama)")
+    parser.add_argument('--confirm', type=int, default=1,
+                        help="Berapa kali grup yang tampak regresi diukur ulang sebelum gagal")
+    parser.add_argument('--output', default=None, help="Tulis hasil ke file JSON")
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    _, scaler, label_encoder = load_artifacts(MODEL_FILES['Logistic Regression'])
+    workdir = tempfile.mkdtemp()
+    groups = {
+        'preprocess': lambda: bench_preprocessing(profile['batch_sizes'], scaler, label_encoder),
+        'inference': lambda: bench_inference(profile['batch_sizes'], scaler, label_encoder),
+        'charts': bench_charts,
+        'whatif': bench_whatif,
+        'drift': lambda: bench_drift(profile['batch_sizes']),
+        'log': lambda: bench_prediction_log(workdir),
+        'instrumentation': bench_instrumentation,
+    }
+    for n_rows in profile['train_sizes']:
+        groups[f'train[{n_rows}]'] = lambda n_rows=n_rows: bench_training(n_rows, workdir)
+    if args.only is not None:
+        groups = {name: run for name, run in groups.items() if name.startswith(args.only)}
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)['metrics']
+
+    results, group_of = {}, {}
+    for name, run in groups.items():
+        print(f"✓ Menjalankan {name}...")
+        for metric, seconds in run().items():
+            results[metric] = seconds
+            group_of[metric] = name
+
+    # Metrik yang tampak regresi diukur ulang (hasil tercepat dipakai) untuk menyaring noise
+    for _ in range(args.confirm):
+        suspects = {group_of[m] for m, s in results.items()
+                    if m in baseline and is_regression(s, baseline[m], args.threshold, args.min_delta)}
+        if not suspects or args.update_baseline:
+            break
+        for name in groups:
+            if name in suspects:
+                print(f"✓ Mengukur ulang {name}...")
+                for metric, seconds in groups[name]().items():
+                    results[metric] = min(results[metric], seconds)
+    os.rmdir(workdir)
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'metrics': results}, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump({
+                'machine': {'platform': platform.platform(), 'python': platform.python_version(),
+                            'cpu_count': os.cpu_count()},
+                'metrics': {**baseline, **results},
+            }, file, indent=2, sort_keys=True)
+        print(f"\n✓ Baseline disimpan ke {os.path.relpath(args.baseline, ROOT)}")
+        return 0
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} metrik lebih lambat dari baseline "
+              f"(> {args.threshold * 100:.0f}% dan > {format_seconds(args.min_delta)}): "
+              f"{', '.join(regressions)}")
+        return 1
+    print(f"\n✓ Tidak ada regresi di atas {args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Grafik plotly untuk tab Beranda dan Prediksi (dipakai app.py dan benchmark)."""
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+PALETTE = ['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6']
+
+# Fitur rating pada bar chart input (urutan sama dengan label)
+RATING_FEATURES = ['kualitas_materi', 'kemudahan_penggunaan',
+                   'stabilitas_aplikasi', 'interaksi_pengajar']
+RATING_LABELS = ['Kualitas Materi', 'Kemudahan Penggunaan',
+                 'Stabilitas Aplikasi', 'Interaksi Pengajar']
+
+
+def create_gauge_chart(probability, title="Tingkat Kepercayaan"):
+    """Membuat gauge chart untuk menampilkan probabilitas"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=probability * 100,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': title, 'font': {'size': 24}},
+        delta={'reference': 50, 'increasing': {'color': "green"}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'color': "darkblue"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 33], 'color': '#ffebee'},
+                {'range': [33, 66], 'color': '#fff9c4'},
+                {'range': [66, 100], 'color': '#e8f5e9'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 50
+            }
+        }
+    ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+
+    return fig
+
+
+def create_feature_comparison(data):
+    """Membuat bar chart untuk perbandingan fitur input"""
+    values = [data[f] for f in RATING_FEATURES]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=RATING_LABELS,
+            y=values,
+            marker_color=PALETTE,
+            text=values,
+            textposition='auto',
+        )
+    ])
+
+    fig.update_layout(
+        title="Penilaian Platform (Skala 1-5)",
+        xaxis_title="Kategori Penilaian",
+        yaxis_title="Rating",
+        yaxis=dict(range=[0, 5.5]),
+        height=350,
+        showlegend=False,
+        font=dict(family="Inter, sans-serif")
+    )
+
+    return fig
+
+
+def create_trend_chart(months, satisfied, unsatisfied):
+    """Line chart tren persentase puas/tidak puas per bulan (Beranda)"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months, y=satisfied,
+        mode='lines+markers',
+        name='Puas',
+        line=dict(color='#2c3e50', width=3),
+        marker=dict(size=8)
+    ))
+    fig.add_trace(go.Scatter(
+        x=months, y=unsatisfied,
+        mode='lines+markers',
+        name='Tidak Puas',
+        line=dict(color='#95a5a6', width=3),
+        marker=dict(size=8)
+    ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=20),
+        hovermode='x unified',
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        yaxis=dict(title="Persentase", range=[0, 100])
+    )
+
+    return fig
+
+
+def create_ratings_chart(categories, ratings, text):
+    """Bar chart rata-rata penilaian platform (Beranda)"""
+    fig = go.Figure(go.Bar(
+        x=categories,
+        y=ratings,
+        marker_color=PALETTE,
+        text=text,
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=20),
+        yaxis=dict(range=[0, 5], title="Rating Rata-rata"),
+        showlegend=False
+    )
+
+    return fig
+
+
+def create_distribution_pie(labels, counts, title):
+    """Donut chart distribusi pengguna (usia, frekuensi login) di Beranda"""
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=counts,
+        hole=.4,
+        marker_colors=PALETTE
+    )])
+
+    fig.update_layout(
+        title=title,
+        height=300,
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=True
+    )
+
+    return fig
+
+
+def create_whatif_chart(titles, curves, points, cols=4):
+    """Panel kurva what-if: probabilitas puas (%) per fitur, titik = input saat ini
+
+    curves dan points berisi (x, y) per fitur dengan urutan sama seperti titles.
+    """
+    rows = -(-len(titles) // cols)
+    fig = make_subplots(rows=rows, cols=cols, subplot_titles=titles,
+                        horizontal_spacing=0.06, vertical_spacing=0.18)
+    for i, ((x, y), (px, py)) in enumerate(zip(curves, points)):
+        row, col = i // cols + 1, i % cols + 1
+        fig.add_trace(go.Scatter(
+            x=x, y=y,
+            mode='lines',
+            line=dict(color=PALETTE[0], width=2),
+            hovertemplate='%{x}: %{y:.1f}%<extra></extra>'
+        ), row=row, col=col)
+        fig.add_trace(go.Scatter(
+            x=px, y=py,
+            mode='markers',
+            marker=dict(color=PALETTE[3], size=10, line=dict(color=PALETTE[0], width=2)),
+            hovertemplate='Saat ini: %{y:.1f}%<extra></extra>'
+        ), row=row, col=col)
+
+    fig.update_yaxes(range=[0, 100])
+    fig.update_layout(
+        height=220 * rows + 60,
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=False,
+        font=dict(family="Inter, sans-serif")
+    )
+
+    return fig
+
+
+def create_drift_chart(bins, reference, live):
+    """Bar chart distribusi satu fitur: referensi training vs data live (persentase)"""
+    fig = go.Figure()
+    for name, values, color in [('Referensi', reference, PALETTE[3]), ('Live', live, PALETTE[0])]:
+        total = sum(values) or 1
+        fig.add_trace(go.Bar(
+            x=bins, y=[value / total * 100 for value in values],
+            name=name,
+            marker_color=color,
+            hovertemplate='%{x}: %{y:.1f}%<extra></extra>'
+        ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=20),
+        barmode='group',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        xaxis=dict(type='category'),
+        yaxis=dict(title="Persentase")
+    )
+
+    return fig
@@ -0,0 +1,347 @@
+"""Tahap pembersihan data training: validasi kolom dan rentang nilai, lalu
+deduplikasi berbasis hash, per chunk.
+
+Setiap baris di-hash menjadi satu nilai 64-bit (semua kolom kecuali id) dan
+disimpan di RowHashSet, tabel open addressing di atas satu array uint64
+(sekitar 16-32 byte per baris unik, bukan baris lengkap). Baris yang hash-nya
+sudah pernah dilihat dibuang sebagai duplikat (kemunculan pertama dipertahankan,
+seperti drop_duplicates). Baris yang gagal validasi ditolak beserta alasannya
+dan tidak ikut dihitung untuk deduplikasi.
+
+Karena hanya set hash yang bertahan antar chunk, file yang jauh lebih besar
+dari RAM dapat dibersihkan dengan memori sebanding jumlah baris unik.
+
+Contoh:
+    python data_cleaning.py mentah.csv -o bersih.csv --rejected ditolak.csv
+    python data_cleaning.py riwayat_survei.parquet -o bersih.parquet
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from artifacts import ID_COLUMN, TARGET, expected_cols, numeric_cols
+
+REQUIRED_COLUMNS = expected_cols + [TARGET]
+
+# Rentang valid setiap fitur (sama dengan rentang input di dashboard)
+VALID_RANGES = {
+    'usia': (18, 50),
+    'durasi_penggunaan': (0.0, 8.0),
+    'frekuensi_login': (1, 7),
+    'kualitas_materi': (1, 5),
+    'kemudahan_penggunaan': (1, 5),
+    'stabilitas_aplikasi': (1, 5),
+    'interaksi_pengajar': (1, 5),
+}
+INTEGER_COLS = ['usia', 'frekuensi_login', 'kualitas_materi', 'kemudahan_penggunaan',
+                'stabilitas_aplikasi', 'interaksi_pengajar']
+NUMERIC_COLS = list(VALID_RANGES) + [TARGET]
+VALID_GENDERS = ('L', 'P')
+VALID_TARGETS = (0, 1)
+
+
+DEFAULT_CHUNKSIZE = 100_000
+
+_PRIME = np.uint64(0x100000001B3)
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def check_columns(columns):
+    """ValueError jika kolom fitur atau target tidak ada"""
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {missing}")
+
+
+def numeric_values(values):
+    """Kolom sebagai array float64; sel yang bukan angka (mis. teks) menjadi NaN"""
+    if values.dtype.kind not in 'biuf':
+        values = pd.to_numeric(values, errors='coerce')
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def as_numeric(df):
+    """Kolom angka yang terbaca sebagai teks (ada sel bukan angka) dijadikan numerik
+
+    Sel yang bukan angka menjadi NaN; baris tersebut sudah ditolak oleh validate.
+    """
+    for col in NUMERIC_COLS:
+        if col in df.columns and df[col].dtype.kind not in 'biuf':
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def validate(chunk):
+    """(mask baris valid, alasan penolakan per baris); alasan pertama yang gagal dipakai"""
+    valid = np.ones(len(chunk), dtype=bool)
+    reasons = np.full(len(chunk), None, dtype=object)
+
+    def reject(bad, reason):
+        bad = bad & valid
+        reasons[bad] = reason
+        valid[bad] = False
+
+    for col in REQUIRED_COLUMNS:
+        if col not in numeric_cols:
+            reject(chunk[col].isnull().to_numpy(), f"{col} kosong")
+
+    gender = chunk['jenis_kelamin']
+    reject((~gender.isin(VALID_GENDERS) & gender.notnull()).to_numpy(), "jenis_kelamin tidak dikenal")
+    target = numeric_values(chunk[TARGET])
+    reject(~np.isin(target, VALID_TARGETS) & chunk[TARGET].notnull().to_numpy(), f"{TARGET} bukan 0/1")
+
+    for col, (low, high) in VALID_RANGES.items():
+        values = numeric_values(chunk[col])
+        reject(np.isnan(values) & chunk[col].notnull().to_numpy(), f"{col} bukan angka")
+        reject((values < low) | (values > high), f"{col} di luar rentang {low}-{high}")
+        if col in INTEGER_COLS:
+            reject(np.abs(np.fmod(values, 1)) > 0, f"{col} bukan bilangan bulat")
+    return valid, reasons
+
+
+def column_hash(values):
+    """Hash 64-bit per nilai; angka dibandingkan sebagai float64 (tidak bergantung dtype chunk)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Hash kategori (sedikit) lalu ambil per kode, tanpa mengubah kolom menjadi object
+        hashes = pd.util.hash_array(values.cat.categories.astype(str).to_numpy(dtype=object))
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, hashes.take(codes), _NULL_HASH)
+    if values.dtype.kind in 'biuf':
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0  # -0.0 -> 0.0
+        return np.where(np.isnan(numbers), _NULL_HASH, pd.util.hash_array(numbers))
+    return np.where(values.isnull().to_numpy(), _NULL_HASH,
+                    pd.util.hash_array(values.astype(str).to_numpy(dtype=object)))
+
+
+def row_hashes(df):
+    """Hash 64-bit setiap baris dari semua kolom df (urutan kolom berpengaruh)"""
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        hashes = (hashes ^ column_hash(df[col])) * _PRIME
+    # Finalizer splitmix64 agar bit rendah (indeks slot) tersebar rata
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+    return hashes
+
+
+class RowHashSet:
+    """Set hash 64-bit: open addressing (linear probing) di atas satu array uint64
+
+    Slot bernilai 0 berarti kosong, jadi hash 0 disimpan sebagai 1. Tabel
+    digandakan setiap kali terisi lebih dari max_load.
+    """
+
+    def __init__(self, capacity=1 << 16, max_load=0.5):
+        self.table = np.zeros(capacity, dtype=np.uint64)
+        self.max_load = max_load
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes
+
+    def add(self, hashes):
+        """Menambahkan hash; mengembalikan mask baris yang belum pernah dilihat
+
+        Untuk hash yang muncul beberapa kali dalam satu panggilan, hanya
+        kemunculan pertamanya yang dianggap baru.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        hashes = np.where(hashes == 0, np.uint64(1), hashes)
+        # Kemunculan pertama dalam batch lewat hashtable pandas (O(n), tanpa sort)
+        first = np.flatnonzero(~pd.Series(hashes).duplicated().to_numpy())
+        while self.size + len(first) > self.max_load * len(self.table):
+            self._grow()
+        new = np.zeros(len(hashes), dtype=bool)
+        new[first[self._insert(hashes[first])]] = True
+        return new
+
+    def _insert(self, keys):
+        """Menyisipkan key unik secara vektor; True untuk key yang belum ada di tabel"""
+        table = self.table
+        mask = np.uint64(len(table) - 1)
+        slots = (keys & mask).astype(np.intp)
+        inserted = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while pending.size:
+            slot, key = slots[pending], keys[pending]
+            current = table[slot]
+            done = current == key
+            empty = np.flatnonzero(current == 0)
+            # Beberapa key dapat mengincar slot kosong yang sama: tulisan terakhir menang
+            table[slot[empty]] = key[empty]
+            won = empty[table[slot[empty]] == key[empty]]
+            done[won] = True
+            inserted[pending[won]] = True
+            pending = pending[~done]
+            slots[pending] = (slots[pending] + 1) & (len(table) - 1)
+        self.size += int(inserted.sum())
+        return inserted
+
+    def _grow(self):
+        keys = self.table[self.table != 0]
+        self.table = np.zeros(len(self.table) * 2, dtype=np.uint64)
+        self.size = 0
+        self._insert(keys)
+
+
+class DataCleaner:
+    """Membersihkan chunk berurutan: validasi, lalu buang duplikat antar seluruh chunk"""
+
+    def __init__(self, dedupe=True):
+        self.dedupe = dedupe
+        self.seen = RowHashSet()
+        self.rows = 0
+        self.kept = 0
+        self.duplicates = 0
+        self.reasons = Counter()
+        self.seconds = 0.0
+
+    def clean(self, chunk):
+        """(baris bersih tanpa kolom id, baris ditolak dengan kolom 'baris' dan 'alasan')
+
+        'baris' adalah nomor baris data di sumber (mulai 1, tanpa header).
+        """
+        start = time.perf_counter()
+        check_columns(chunk.columns)
+        row_number = np.arange(self.rows + 1, self.rows + len(chunk) + 1)
+        self.rows += len(chunk)
+
+        valid, reasons = validate(chunk)
+        data = as_numeric(chunk.drop(columns=[ID_COLUMN], errors='ignore'))
+        if self.dedupe:
+            duplicate = np.zeros(len(chunk), dtype=bool)
+            valid_index = np.flatnonzero(valid)
+            duplicate[valid_index] = ~self.seen.add(row_hashes(data.iloc[valid_index]))
+            reasons[duplicate] = "duplikat"
+            valid &= ~duplicate
+            self.duplicates += int(duplicate.sum())
+
+        keep = np.flatnonzero(valid)
+        self.kept += len(keep)
+        rejected = chunk.iloc[np.flatnonzero(~valid)].copy()
+        if len(rejected):
+            rejected.insert(0, 'baris', row_number[~valid])
+            rejected['alasan'] = reasons[~valid]
+            self.reasons.update(rejected['alasan'])
+        clean = data.iloc[keep] if len(keep) < len(data) else data
+        self.seconds += time.perf_counter() - start
+        return clean, rejected
+
+    def report(self):
+        """Ringkasan: jumlah baris, dipertahankan, duplikat, tidak valid per alasan, throughput"""
+        return {
+            'rows': self.rows,
+            'kept': self.kept,
+            'duplicates': self.duplicates,
+            'invalid': self.rows - self.kept - self.duplicates,
+            'reasons': {reason: n for reason, n in self.reasons.most_common() if reason != "duplikat"},
+            'unique_hashes': len(self.seen),
+            'hash_set_mb': self.seen.nbytes / 1024 ** 2,
+            'seconds': self.seconds,
+            'rows_per_sec': self.rows / self.seconds if self.seconds > 0 else float('inf'),
+        }
+
+
+def clean_file(source, destination, rejected_path=None, chunksize=DEFAULT_CHUNKSIZE,
+               progress=None):
+    """Membersihkan file CSV/Parquet per chunk ke destination; mengembalikan report()
+
+    destination ditulis sebagai Parquet jika berakhiran .parquet, selain itu
+    CSV. Baris yang ditolak ditulis ke rejected_path (CSV) jika diberikan.
+    Durasi dan throughput mencakup pembacaan dan penulisan file.
+    """
+    from streaming_training import iter_frames
+
+    to_parquet = destination.endswith('.parquet')
+    if to_parquet:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    cleaner = DataCleaner()
+    start = time.perf_counter()
+    writer = None
+    wrote_clean = wrote_rejected = False
+    try:
+        for chunk in iter_frames(source, chunksize):
+            clean, rejected = cleaner.clean(chunk)
+            if to_parquet:
+                table = pa.Table.from_pandas(clean, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(destination, table.schema)
+                # Kolom int yang berisi kosong di chunk ini terbaca float; samakan dengan chunk pertama
+                writer.write_table(table.cast(writer.schema))
+            else:
+                clean.to_csv(destination, mode='a' if wrote_clean else 'w', header=not wrote_clean,
+                             index=False)
+            wrote_clean = True
+            if rejected_path is not None and (len(rejected) or not wrote_rejected):
+                rejected.to_csv(rejected_path, mode='a' if wrote_rejected else 'w',
+                                header=not wrote_rejected, index=False)
+                wrote_rejected = True
+            if progress is not None:
+                progress(cleaner.rows)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    report = cleaner.report()
+    report['seconds'] = time.perf_counter() - start
+    report['rows_per_sec'] = report['rows'] / report['seconds'] if report['seconds'] > 0 else float('inf')
+    return report
+
+
+def print_report(report, indent='   '):
+    """Mencetak ringkasan pembersihan dengan format yang sama seperti train_model.py"""
+    print(f"{indent}✓ {report['kept']} dari {report['rows']} baris lolos validasi dan deduplikasi")
+    if report['duplicates']:
+        print(f"{indent}✓ {report['duplicates']} baris duplikat dihapus "
+              f"(set hash {report['hash_set_mb']:.1f} MB)")
+    if report['invalid']:
+        print(f"{indent}✓ {report['invalid']} baris tidak valid ditolak:")
+        for reason, n in report['reasons'].items():
+            print(f"{indent}  • {reason}: {n}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Validasi rentang dan deduplikasi dataset training per chunk"
+    )
+    parser.add_argument('input', help="File CSV atau Parquet dengan kolom dataset")
+    parser.add_argument('-o', '--output', default='dataset_bersih.csv', help="File hasil (.csv atau .parquet)")
+    parser.add_argument('--rejected', default=None,
+                        help="File CSV untuk baris yang ditolak beserta alasannya")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Jumlah baris per chunk")
+    args = parser.parse_args(argv)
+
+    print(f"Membersihkan {args.input} (chunk {args.chunksize} baris)...")
+    try:
+        report = clean_file(args.input, args.output, args.rejected, chunksize=args.chunksize)
+    except FileNotFoundError:
+        print(f"✗ Error: File {args.input} tidak ditemukan!")
+        return 1
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+    print_report(report, indent='')
+    print(f"✓ {report['rows']} baris dalam {report['seconds']:.2f} detik "
+          f"({report['rows_per_sec']:,.0f} rows/sec)")
+    print(f"✓ Hasil disimpan ke {args.output}")
+    if args.rejected:
+        print(f"✓ Baris ditolak disimpan ke {args.rejected}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,394 @@
+"""Pemantauan drift fitur input dan kelas prediksi dengan histogram streaming.
+
+Semua fitur bernilai diskrit dengan rentang kecil, sehingga setiap fitur di
+expected_cols cukup dicatat sebagai histogram berukuran tetap di atas grid
+slider (lihat prediction_cube.GRID_AXES), ditambah satu bin di bawah grid dan
+satu bin di atas grid/kosong. Nilai di antara titik grid masuk ke titik
+terdekat. Kelas prediksi setiap model dicatat sebagai histogram dua bin.
+
+Jalur prediksi hanya mencatat: satu baris ditambahkan ke daftar tunggu (satu
+append) yang di-bin secara vektor setiap PENDING_ROWS baris, batch langsung
+di-bin dengan satu np.bincount per blok. PSI dan KL dihitung dari counter berjalan saat
+laporan diminta, dengan biaya sebanding jumlah bin, bukan jumlah baris yang
+sudah diproses. Referensi ditulis train_model.py ke drift_reference.json dari
+data training dan prediksi model pada data tersebut.
+
+Ekspor:
+    metrics/drift.prom   format teks Prometheus (PSI, KL, jumlah baris)
+    metrics/drift.json   laporan lengkap termasuk histogram
+
+Set ELEARNING_DRIFT=0 untuk menonaktifkan pencatatan.
+
+Contoh:
+    python drift_monitor.py build                      # referensi dari dataset dan model yang ada
+    python batch_predict.py data_baru.csv --drift      # drift file CSV terhadap referensi
+"""
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from artifacts import MODEL_FILES, expected_cols
+from instrumentation import METRICS_DIR, PREFIX
+from prediction_cube import GRID_AXES, grid_values
+
+REFERENCE_FILE = 'drift_reference.json'
+CLASS_LABELS = ['Tidak Puas', 'Puas']
+
+EPSILON = 1e-4          # batas bawah proporsi bin agar log tetap terdefinisi
+MIN_ROWS = 100          # di bawah ini laporan ditandai 'data kurang'
+PSI_WARNING = 0.1       # PSI < 0.1 stabil, 0.1-0.25 bergeser, >= 0.25 drift
+PSI_ALERT = 0.25
+
+# Bin global = rint(nilai * _SCALE + _SHIFT), dibatasi ke [_LOW, _HIGH] per fitur.
+# Setiap fitur memakai jumlah nilai grid + 2 bin (di bawah grid, di atas grid/kosong).
+_LOW, _HIGH, _SCALE, _SHIFT = [], [], [], []
+for _col in expected_cols:
+    _start, _step, _count = GRID_AXES[_col]
+    _offset = _HIGH[-1] + 1 if _HIGH else 0
+    _LOW.append(_offset)
+    _HIGH.append(_offset + _count + 1)
+    _SCALE.append(1.0 / _step)
+    _SHIFT.append(_offset + 1 - _start / _step)
+TOTAL_BINS = _HIGH[-1] + 1
+_RANGES = [(low, high + 1) for low, high in zip(_LOW, _HIGH)]
+_LOW, _HIGH, _SCALE, _SHIFT = (np.array(values, dtype=np.float64)
+                               for values in (_LOW, _HIGH, _SCALE, _SHIFT))
+
+CHUNK_ROWS = 1 << 15    # batch diproses per blok agar array sementara tetap di cache
+PENDING_ROWS = 1024     # baris tunggal ditampung lalu di-bin bersama
+
+
+def drift_enabled():
+    return os.environ.get('ELEARNING_DRIFT', '1') != '0'
+
+
+def bin_labels(col):
+    """Label setiap bin satu fitur: di bawah grid, nilai grid, di atas grid/kosong"""
+    return ['< min'] + [f'{value:g}' for value in grid_values(col)] + ['> max / kosong']
+
+
+def histogram(X):
+    """Counter semua fitur (TOTAL_BINS,) untuk matriks input mentah (n, 8)"""
+    X = np.asarray(X, dtype=np.float64)
+    counts = np.zeros(TOTAL_BINS, dtype=np.int64)
+    for start in range(0, len(X), CHUNK_ROWS):
+        position = X[start:start + CHUNK_ROWS] * _SCALE
+        position += _SHIFT
+        np.rint(position, out=position)
+        # fmin mengubah NaN menjadi batas atas: nilai kosong masuk bin terakhir
+        np.fmin(position, _HIGH, out=position)
+        np.fmax(position, _LOW, out=position)
+        counts += np.bincount(position.astype(np.intp).ravel(), minlength=TOTAL_BINS)
+    return counts
+
+
+def class_histogram(prediction):
+    """Counter kelas prediksi [tidak puas, puas]"""
+    return np.bincount(np.asarray(prediction, dtype=np.intp), minlength=2)[:2]
+
+
+def divergence(live, reference, epsilon=EPSILON):
+    """(PSI, KL(live || referensi)) dari dua counter bin yang sama"""
+    p = np.maximum(live / max(live.sum(), 1), epsilon)
+    q = np.maximum(reference / max(reference.sum(), 1), epsilon)
+    log_ratio = np.log(p / q)
+    return float(np.sum((p - q) * log_ratio)), float(np.sum(p * log_ratio))
+
+
+def drift_status(psi, rows):
+    if rows < MIN_ROWS:
+        return 'data kurang'
+    if psi >= PSI_ALERT:
+        return 'drift'
+    if psi >= PSI_WARNING:
+        return 'bergeser'
+    return 'stabil'
+
+
+def write_reference(path, X, predictions):
+    """Menulis snapshot referensi (atomik) dari data training dan prediksi setiap model
+
+    predictions: dict nama model -> kelas prediksi (0/1) untuk baris X.
+    """
+    return write_reference_counts(
+        path, histogram(X), {name: class_histogram(prediction)
+                             for name, prediction in predictions.items()}, len(X))
+
+
+def write_reference_counts(path, counts, prediction_counts, rows):
+    """Seperti write_reference, dari counter yang sudah diakumulasi per chunk
+
+    counts: hasil histogram() yang dijumlahkan; prediction_counts: dict nama
+    model -> hasil class_histogram() yang dijumlahkan.
+    """
+    reference = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'rows': int(rows),
+        'features': {col: {'axis': list(GRID_AXES[col]),
+                           'counts': np.asarray(counts[low:high]).tolist()}
+                     for col, (low, high) in zip(expected_cols, _RANGES)},
+        'predictions': {name: np.asarray(prediction).tolist()
+                        for name, prediction in prediction_counts.items()},
+    }
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as file:
+        json.dump(reference, file, indent=2)
+    os.replace(tmp_path, path)
+    return reference
+
+
+def load_reference(path=REFERENCE_FILE):
+    """Snapshot referensi, atau None jika belum ada atau grid-nya berbeda"""
+    try:
+        with open(path) as file:
+            reference = json.load(file)
+    except FileNotFoundError:
+        return None
+    for col in expected_cols:
+        if reference['features'].get(col, {}).get('axis') != list(GRID_AXES[col]):
+            return None
+    return reference
+
+
+class DriftMonitor:
+    """Histogram live setiap fitur dan kelas prediksi per model (thread-safe)"""
+
+    def __init__(self, reference=None, enabled=True):
+        self.enabled = enabled
+        self.reference = reference
+        self.started_at = datetime.now()
+        self.rows = 0
+        self._counts = np.zeros(TOTAL_BINS, dtype=np.int64)
+        self._pending = []
+        self._predictions = {}
+        self._lock = threading.Lock()
+        self._reference_mtime = None
+        self._next_export = 0.0
+
+    @classmethod
+    def load(cls, path=REFERENCE_FILE):
+        monitor = cls(load_reference(path), enabled=drift_enabled())
+        monitor._reference_mtime = _mtime(path)
+        return monitor
+
+    def refresh(self, path=REFERENCE_FILE):
+        """Memuat ulang referensi setelah training ulang; counter live direset"""
+        mtime = _mtime(path)
+        if mtime == self._reference_mtime:
+            return False
+        reference = load_reference(path)
+        with self._lock:
+            self.reference = reference
+            self._reference_mtime = mtime
+            self._reset()
+        return True
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self.rows = 0
+        self._counts = np.zeros(TOTAL_BINS, dtype=np.int64)
+        self._pending = []
+        self._predictions = {}
+        self.started_at = datetime.now()
+
+    def observe_one(self, x, model_name=None, prediction=None):
+        """Mencatat satu baris input mentah (list float urutan expected_cols)
+
+        Baris hanya ditampung; bin-nya dihitung bersama baris lain oleh histogram().
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._pending.append(x)
+            self.rows += 1
+            if model_name is not None:
+                classes = self._predictions.get(model_name)
+                if classes is None:
+                    classes = self._predictions[model_name] = [0, 0]
+                classes[int(prediction)] += 1
+            if len(self._pending) >= PENDING_ROWS:
+                self._flush_pending()
+
+    def _flush_pending(self):
+        if self._pending:
+            self._counts += histogram(self._pending)
+            self._pending = []
+
+    def observe(self, X, predictions=None):
+        """Mencatat matriks input mentah (n, 8) dan kelas prediksi {model: array}"""
+        if not self.enabled or len(X) == 0:
+            return
+        counts = histogram(X)
+        classes = {name: class_histogram(prediction) for name, prediction in (predictions or {}).items()}
+        with self._lock:
+            self._counts += counts
+            self.rows += len(X)
+            for name, hist in classes.items():
+                current = self._predictions.setdefault(name, [0, 0])
+                current[0] += int(hist[0])
+                current[1] += int(hist[1])
+
+    def merge(self, other):
+        """Menambahkan semua baris yang dicatat monitor lain (mis. satu file unggahan)"""
+        if not self.enabled:
+            return
+        rows, counts, predictions = other.snapshot()
+        with self._lock:
+            self._counts += counts
+            self.rows += rows
+            for name, (negative, positive) in predictions.items():
+                current = self._predictions.setdefault(name, [0, 0])
+                current[0] += negative
+                current[1] += positive
+
+    def snapshot(self):
+        """Salinan konsisten (jumlah baris, counter fitur, counter kelas per model)"""
+        with self._lock:
+            self._flush_pending()
+            return self.rows, self._counts.copy(), {name: list(c) for name, c in self._predictions.items()}
+
+    def report(self):
+        """Laporan drift (dict siap JSON): PSI, KL, status, dan histogram setiap fitur/model"""
+        rows, counts, predictions = self.snapshot()
+        reference = self.reference
+        report = {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'rows': rows,
+            'reference_created_at': reference['created_at'] if reference else None,
+            'reference_rows': reference['rows'] if reference else 0,
+            'features': {},
+            'predictions': {},
+        }
+        for col, (low, high) in zip(expected_cols, _RANGES):
+            live = counts[low:high]
+            entry = {'bins': bin_labels(col), 'live': live.tolist()}
+            if reference is not None:
+                expected = np.asarray(reference['features'][col]['counts'])
+                entry['reference'] = expected.tolist()
+                entry['psi'], entry['kl'] = divergence(live, expected)
+                entry['status'] = drift_status(entry['psi'], rows)
+            report['features'][col] = entry
+        for name, live in sorted(predictions.items()):
+            entry = {'bins': CLASS_LABELS, 'live': live, 'rows': sum(live)}
+            expected = (reference or {}).get('predictions', {}).get(name)
+            if expected is not None:
+                entry['reference'] = expected
+                entry['psi'], entry['kl'] = divergence(np.asarray(live), np.asarray(expected))
+                entry['status'] = drift_status(entry['psi'], entry['rows'])
+            report['predictions'][name] = entry
+
+        scores = [entry['psi'] for group in ('features', 'predictions')
+                  for entry in report[group].values() if 'psi' in entry]
+        report['max_psi'] = max(scores) if scores else None
+        report['status'] = (drift_status(report['max_psi'], rows) if scores
+                            else 'tanpa referensi')
+        return report
+
+    def to_prometheus(self, report=None):
+        """PSI, KL, dan jumlah baris dalam format teks Prometheus"""
+        report = report or self.report()
+        lines = [
+            f'# HELP {PREFIX}_drift_rows Jumlah baris yang dipantau',
+            f'# TYPE {PREFIX}_drift_rows gauge',
+            f'{PREFIX}_drift_rows {report["rows"]}',
+        ]
+        for metric, help_text in [('psi', 'Population stability index terhadap referensi'),
+                                  ('kl', 'Divergensi KL (live || referensi)')]:
+            lines.append(f'# HELP {PREFIX}_drift_{metric} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_drift_{metric} gauge')
+            for col, entry in report['features'].items():
+                if metric in entry:
+                    lines.append(f'{PREFIX}_drift_{metric}{{feature="{col}"}} {entry[metric]:.6f}')
+            for name, entry in report['predictions'].items():
+                if metric in entry:
+                    lines.append(f'{PREFIX}_drift_{metric}{{feature="prediksi",model="{name}"}} '
+                                 f'{entry[metric]:.6f}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, name='drift', directory=METRICS_DIR):
+        """Menulis file .prom dan laporan JSON secara atomik; mengembalikan path-nya"""
+        report = self.report()
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, f'{name}.prom')
+        json_path = os.path.join(directory, f'{name}.json')
+        for path, content in [(prom_path, self.to_prometheus(report)),
+                              (json_path, json.dumps(report, indent=2))]:
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w') as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        return prom_path, json_path
+
+    def export_if_due(self, name='drift', interval=15.0, directory=METRICS_DIR):
+        """Ekspor paling sering sekali per interval detik (untuk proses yang berjalan lama)"""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        if now < self._next_export:
+            return None
+        self._next_export = now + interval
+        return self.export(name, directory)
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def build_reference(data_path, path=REFERENCE_FILE):
+    """Referensi dari dataset training dan model yang sudah ada (tanpa training ulang)"""
+    from artifacts import load_artifacts
+    from inference_engine import build_engine
+    from training_stages import clean_dataset, encode_categorical, impute_missing, load_dataset, split_features
+
+    df, _ = clean_dataset(load_dataset(data_path))
+    df, _ = impute_missing(df)
+    df, _ = encode_categorical(df)
+    X = split_features(df)[0].to_numpy(dtype=np.float64)
+    predictions = {}
+    for name in sorted(MODEL_FILES.values()):
+        engine = build_engine(*load_artifacts(name))
+        predictions[name] = engine.predict_with_proba(X)[0]
+    return write_reference(path, X, predictions)
+
+
+def print_report(report):
+    print(f"Baris dipantau: {report['rows']:,} (referensi {report['reference_rows']:,} baris)")
+    for col, entry in list(report['features'].items()) + [
+            (f'prediksi {name}', entry) for name, entry in report['predictions'].items()]:
+        if 'psi' in entry:
+            print(f"  • {col:25s} PSI {entry['psi']:.4f}  KL {entry['kl']:.4f}  {entry['status']}")
+    print(f"Status: {report['status']}")
+
+
+def main(argv=None):
+    """Membangun referensi dari dataset dan model yang sudah ada"""
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else 'build'
+
+    if command == 'build':
+        data_path = argv[1] if len(argv) > 1 else 'dataset_kepuasan_pengguna_elearning.csv'
+        try:
+            reference = build_reference(data_path)
+        except FileNotFoundError as e:
+            print(f"✗ {e.filename} tidak ditemukan. Jalankan train_model.py terlebih dahulu.")
+            return 1
+        print(f"✓ {REFERENCE_FILE} dibuat dari {reference['rows']} baris")
+        return 0
+
+    print("Penggunaan: python drift_monitor.py build [dataset.csv]")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
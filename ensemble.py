@@ -0,0 +1,45 @@
+"""Scoring dengan semua model sekaligus dan ensemble soft voting berbobot.
+
+Input di-encode sekali menjadi matriks mentah (scaling sudah dilipat ke dalam
+setiap engine), lalu setiap engine menskor matriks yang sama. Ensemble adalah
+rata-rata berbobot probabilitas puas yang sudah dihitung, sehingga biaya satu
+batch = satu kali encode + jumlah biaya scoring setiap model.
+"""
+import numpy as np
+
+ENSEMBLE_NAME = 'ensemble'
+
+
+def normalize_weights(names, weights=None):
+    """Bobot untuk setiap nama model, dinormalisasi menjadi jumlah 1 (default sama rata)
+
+    Bobot untuk model yang tidak ada di names diabaikan; model tanpa bobot bernilai 0.
+    """
+    if weights is None:
+        weights = dict.fromkeys(names, 1.0)
+    values = np.array([float(weights.get(name, 0.0)) for name in names])
+    if np.any(values < 0) or values.sum() <= 0:
+        raise ValueError("Bobot ensemble harus non-negatif dan tidak semuanya nol")
+    return values / values.sum()
+
+
+def score_models(engines, X, weights=None):
+    """Probabilitas puas setiap engine untuk matriks mentah yang sama, plus ensemble
+
+    Mengembalikan dict nama -> array (n,); kunci 'ensemble' berisi soft voting
+    berbobot dari probabilitas yang sudah dihitung (tanpa scoring ulang).
+    """
+    X = np.asarray(X, dtype=np.float64)
+    names = list(engines)
+    scores = {name: engines[name].predict_proba_puas(X) for name in names}
+    scores[ENSEMBLE_NAME] = normalize_weights(names, weights) @ np.vstack([scores[n] for n in names])
+    return scores
+
+
+def compare_one(engines, data, weights=None):
+    """Perbandingan untuk satu input dict: list (nama, kelas, probabilitas puas)"""
+    first = next(iter(engines.values()))
+    scores = score_models(engines, [first.encode(data)], weights)
+    return [(name, first.classes[1] if p[0] > 0.5 else first.classes[0], float(p[0]))
+            for name, p in scores.items()]
+
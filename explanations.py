@@ -0,0 +1,127 @@
+"""Kontribusi per fitur terhadap skor model, dihitung vektor untuk satu atau banyak baris.
+
+- Logistic regression: kontribusi fitur j = coef_j * (x_j - mean_j) / scale_j,
+  yaitu koefisien dikali nilai hasil scaling. Nilai dasar adalah intercept,
+  dan nilai dasar + jumlah kontribusi sama persis dengan decision function
+  (log-odds kelas puas).
+- Decision tree: kontribusi jalur keputusan. Setiap split yang dilewati
+  menggeser probabilitas puas dari node induk ke node anak; pergeseran itu
+  dicatat untuk fitur yang dipakai split. Nilai dasar adalah probabilitas di
+  root, dan nilai dasar + jumlah kontribusi sama dengan probabilitas di daun.
+
+Seluruh batch dihitung dengan operasi array tanpa loop Python per baris.
+"""
+import time
+
+import numpy as np
+
+from artifacts import expected_cols
+from inference_engine import CompiledDecisionTree, FusedLogisticRegression
+from prediction_cube import CubeEngine
+
+FEATURE_LABELS = {
+    'usia': 'Usia',
+    'jenis_kelamin': 'Jenis Kelamin',
+    'durasi_penggunaan': 'Penggunaan Harian',
+    'frekuensi_login': 'Frekuensi Login',
+    'kualitas_materi': 'Kualitas Materi',
+    'kemudahan_penggunaan': 'Kemudahan Penggunaan',
+    'stabilitas_aplikasi': 'Stabilitas Aplikasi',
+    'interaksi_pengajar': 'Interaksi Pengajar',
+}
+
+
+def _base_engine(engine):
+    """Engine model di balik prediction cube (cube tidak menyimpan struktur model)"""
+    return engine.fallback if isinstance(engine, CubeEngine) else engine
+
+
+def contributions(engine, X, scaler=None):
+    """Kontribusi per fitur untuk matriks input mentah (n, 8)
+
+    Mengembalikan (base, kontribusi, satuan): base + kontribusi.sum(axis=1)
+    sama dengan skor model, dalam satuan 'log-odds' (logreg) atau
+    'probabilitas' (decision tree). scaler harus sama dengan saat engine dibuat.
+    """
+    engine = _base_engine(engine)
+    X = np.asarray(X, dtype=np.float64)
+
+    if isinstance(engine, FusedLogisticRegression):
+        # weights = coef / scale, sehingga weights * (x - mean) = coef * x_scaled
+        mean = np.zeros(X.shape[1]) if scaler is None else np.asarray(scaler.mean_, dtype=np.float64)
+        base = engine.bias + float(engine.weights @ mean)
+        return base, (X - mean) * engine.weights, 'log-odds'
+
+    if isinstance(engine, CompiledDecisionTree):
+        # Daun menunjuk ke dirinya sendiri, jadi langkah setelah daun menambah 0
+        value = engine.proba[:, 1]
+        rows = np.arange(X.shape[0])
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        result = np.zeros_like(X)
+        for _ in range(engine.max_depth):
+            feature = engine.feature[node]
+            go_left = X[rows, feature] <= engine.threshold[node]
+            child = np.where(go_left, engine.left[node], engine.right[node])
+            result[rows, feature] += value[child] - value[node]
+            node = child
+        return float(value[0]), result, 'probabilitas'
+
+    raise ValueError(f"Penjelasan belum didukung untuk {type(engine).__name__}")
+
+
+def explain_one(engine, data, scaler=None):
+    """Kontribusi untuk satu input dict, diurutkan dari pengaruh terbesar
+
+    Fitur yang tidak dilewati jalur decision tree (kontribusi 0) tidak dicantumkan.
+    """
+    x = engine.encode(data)
+    base, values, unit = contributions(engine, [x], scaler)
+    values = values[0]
+    order = np.argsort(-np.abs(values), kind='stable')
+    factors = [(expected_cols[j], data[expected_cols[j]], float(values[j]))
+               for j in order if values[j] != 0.0]
+    return {'base': base, 'score': base + float(values.sum()), 'unit': unit, 'factors': factors}
+
+
+def main(argv=None):
+    """Memeriksa bahwa nilai dasar + kontribusi sama dengan skor engine pada dataset"""
+    import argparse
+    import warnings
+
+    import pandas as pd
+
+    from artifacts import MODEL_FILES, load_artifacts
+    from batch_predict import fill_missing
+    from inference_engine import build_engine
+
+    warnings.filterwarnings('ignore')
+    parser = argparse.ArgumentParser(description="Verifikasi kontribusi fitur terhadap skor model")
+    parser.add_argument('csv', nargs='?', default='dataset_kepuasan_pengguna_elearning.csv')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.csv)
+    ok = True
+    for model_name in MODEL_FILES.values():
+        model, scaler, label_encoder = load_artifacts(model_name)
+        engine = build_engine(model, scaler, label_encoder)
+        X = engine.encode_frame(fill_missing(df[expected_cols].copy(), scaler))
+
+        start = time.perf_counter()
+        base, values, unit = contributions(engine, X, scaler)
+        seconds = time.perf_counter() - start
+
+        if unit == 'log-odds':
+            score = engine.decision_function(X)
+        else:
+            score = engine.predict_proba_puas(X)
+        match = np.allclose(base + values.sum(axis=1), score, rtol=1e-9, atol=1e-9)
+        ok = ok and match
+        print(f"{'✓' if match else '✗'} {model_name}: {len(df)} baris, base + kontribusi "
+              f"{'sama' if match else 'TIDAK sama'} dengan skor ({unit}), "
+              f"{len(df) / seconds:,.0f} rows/sec")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
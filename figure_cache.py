@@ -0,0 +1,93 @@
+"""Cache figure plotly per proses untuk dashboard.
+
+Membangun go.Figure memvalidasi setiap properti trace dan layout (beberapa
+milidetik per grafik), padahal pada setiap rerun Streamlit hanya nilai datanya
+yang berubah.
+
+- Figure statis (grafik Beranda) dibangun sekali per versi data lalu dipakai
+  ulang oleh semua sesi.
+- Figure berparameter (gauge, bar input, kurva what-if) di-clone dari template yang sudah
+  tervalidasi; hanya nilai data yang diganti dan figure baru dibuat tanpa
+  validasi ulang. Hasilnya identik dengan membangun dari awal.
+
+Figure yang dikembalikan tidak boleh diubah di tempat (dipakai bersama).
+Set ELEARNING_FIGURE_CACHE=0 untuk membangun setiap figure dari awal
+(pembanding benchmark).
+"""
+import os
+import threading
+
+import plotly.graph_objects as go
+
+from charts import (RATING_FEATURES, create_feature_comparison, create_gauge_chart,
+                    create_whatif_chart)
+
+ENABLED = os.environ.get('ELEARNING_FIGURE_CACHE', '1') != '0'
+
+_lock = threading.Lock()
+_static = {}      # nama -> (versi, figure)
+_templates = {}   # nama -> dict figure tervalidasi
+
+
+def static_figure(name, version, builder, *args):
+    """Figure statis yang dibangun sekali per versi data (hanya versi terakhir disimpan)"""
+    if not ENABLED:
+        return builder(*args)
+    cached = _static.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _lock:
+        cached = _static.get(name)
+        if cached is None or cached[0] != version:
+            cached = _static[name] = (version, builder(*args))
+    return cached[1]
+
+
+def _template(name, builder):
+    spec = _templates.get(name)
+    if spec is None:
+        with _lock:
+            spec = _templates.get(name)
+            if spec is None:
+                spec = _templates[name] = builder().to_dict()
+    return spec
+
+
+def _clone(spec, trace_updates):
+    """Figure baru dari template dengan properti trace yang diganti (tanpa validasi ulang)"""
+    data = [{**trace, **update} for trace, update in zip(spec['data'], trace_updates)]
+    return go.Figure({'data': data, 'layout': spec['layout']}, _validate=False)
+
+
+def gauge_chart(probability, title="Tingkat Kepercayaan"):
+    """Sama dengan charts.create_gauge_chart, di-clone dari template"""
+    if not ENABLED:
+        return create_gauge_chart(probability, title)
+    spec = _template('gauge', lambda: create_gauge_chart(0.5))
+    trace = spec['data'][0]
+    return _clone(spec, [{'value': probability * 100,
+                          'title': {**trace['title'], 'text': title}}])
+
+
+def feature_comparison(data):
+    """Sama dengan charts.create_feature_comparison, di-clone dari template"""
+    if not ENABLED:
+        return create_feature_comparison(data)
+    spec = _template('feature_comparison',
+                     lambda: create_feature_comparison(dict.fromkeys(RATING_FEATURES, 0)))
+    values = [data[f] for f in RATING_FEATURES]
+    # Validator plotly menyimpan text bar sebagai string
+    return _clone(spec, [{'y': values, 'text': [str(v) for v in values]}])
+
+
+def whatif_chart(titles, curves, points):
+    """Sama dengan charts.create_whatif_chart, di-clone dari template per judul panel"""
+    if not ENABLED:
+        return create_whatif_chart(titles, curves, points)
+    spec = _template(('whatif', tuple(titles)),
+                     lambda: create_whatif_chart(titles, curves, points))
+    updates = []
+    for (x, y), (px, py) in zip(curves, points):
+        updates.append({'x': x, 'y': y})
+        updates.append({'x': px, 'y': py})
+    return _clone(spec, updates)
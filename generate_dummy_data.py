@@ -0,0 +1,172 @@
+"""Generator dataset dummy dengan skema dataset_kepuasan_pengguna_elearning.csv.
+
+Distribusi marginal mengikuti dataset asli: usia 18-34, jenis kelamin L/P
+seimbang, durasi 0.3-6.0 jam, login 1-7 kali, rating 1-5 (seragam), sekitar
+6% baris dengan missing value bersamaan di durasi_penggunaan, kualitas_materi,
+dan stabilitas_aplikasi, serta sekitar 1% baris duplikat (termasuk id).
+Label kepuasan adalah skor linear dari rating dan frekuensi login dengan
+ambang yang memberi kelas kurang lebih seimbang, seperti di data asli.
+
+Data dibuat per chunk secara tervektorisasi (NumPy) dan langsung ditulis ke
+disk, sehingga memori puncak ditentukan oleh --chunksize, bukan --rows.
+Setiap chunk memakai generator acak sendiri yang diturunkan dari (seed,
+nomor chunk): seed dan chunksize yang sama selalu menghasilkan file yang sama.
+
+Contoh:
+    python generate_dummy_data.py
+    python generate_dummy_data.py --rows 100000000 --output riwayat_survei.parquet
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_OUTPUT = 'dataset_kepuasan_pengguna_elearning.csv'
+
+COLUMNS = ['id_responden', 'usia', 'jenis_kelamin', 'durasi_penggunaan', 'frekuensi_login',
+           'kualitas_materi', 'kemudahan_penggunaan', 'stabilitas_aplikasi',
+           'interaksi_pengajar', 'kepuasan_pengguna']
+
+# Kolom yang missing value-nya muncul bersamaan pada baris yang sama
+MISSING_COLS = ['durasi_penggunaan', 'kualitas_materi', 'stabilitas_aplikasi']
+MISSING_RATE = 0.06
+DUPLICATE_RATE = 0.01
+
+# Bobot skor kepuasan (hasil fit pada dataset asli, dinormalisasi ke kualitas_materi)
+LABEL_WEIGHTS = {
+    'kualitas_materi': 1.0,
+    'kemudahan_penggunaan': 0.82,
+    'stabilitas_aplikasi': 0.66,
+    'interaksi_pengajar': 0.48,
+    'frekuensi_login': 0.34,
+}
+LABEL_THRESHOLD = 10.35
+
+
+def format_ids(first_id, n_rows, width):
+    """Id 'R' + nomor berlebar tetap (R0001, ...) tanpa loop Python per baris"""
+    numbers = np.arange(first_id, first_id + n_rows, dtype=np.int64)
+    chars = np.empty((n_rows, width + 1), dtype=np.uint8)
+    chars[:, 0] = ord('R')
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    chars[:, 1:] = numbers[:, None] // powers % 10 + ord('0')
+    return chars.view(f'S{width + 1}').ravel().astype(f'U{width + 1}')
+
+
+def generate_chunk(n_rows, first_id, id_width, rng, label_noise=0.0):
+    """Satu chunk data dummy (DataFrame) dengan id mulai dari first_id"""
+    n_duplicates = int(round(n_rows * DUPLICATE_RATE))
+    n_unique = n_rows - n_duplicates
+
+    ratings = {col: rng.integers(1, 6, n_unique, dtype=np.int8)
+               for col in ['kualitas_materi', 'kemudahan_penggunaan',
+                           'stabilitas_aplikasi', 'interaksi_pengajar']}
+    login = rng.integers(1, 8, n_unique, dtype=np.int8)
+
+    score = login * LABEL_WEIGHTS['frekuensi_login']
+    for col, values in ratings.items():
+        score += values * LABEL_WEIGHTS[col]
+    if label_noise > 0:
+        score += rng.normal(0, label_noise, n_unique)
+
+    df = pd.DataFrame({
+        'id_responden': format_ids(first_id, n_unique, id_width),
+        'usia': rng.integers(18, 35, n_unique, dtype=np.int8),
+        'jenis_kelamin': pd.Categorical.from_codes(rng.integers(0, 2, n_unique), ['L', 'P']),
+        'durasi_penggunaan': rng.integers(3, 61, n_unique) / 10,
+        'frekuensi_login': login,
+        'kualitas_materi': ratings['kualitas_materi'].astype(np.float64),
+        'kemudahan_penggunaan': ratings['kemudahan_penggunaan'],
+        'stabilitas_aplikasi': ratings['stabilitas_aplikasi'].astype(np.float64),
+        'interaksi_pengajar': ratings['interaksi_pengajar'],
+        'kepuasan_pengguna': (score > LABEL_THRESHOLD).astype(np.int8),
+    }, columns=COLUMNS)
+
+    # Label dihitung dari nilai lengkap; missing value baru dimasukkan setelahnya
+    missing = rng.random(n_unique) < MISSING_RATE
+    df.loc[missing, MISSING_COLS] = np.nan
+
+    # Duplikat persis (termasuk id) disalin dari baris di chunk yang sama
+    if n_duplicates > 0:
+        source = rng.integers(0, n_unique, n_duplicates)
+        df = pd.concat([df, df.iloc[source]], ignore_index=True)
+    return df, n_unique
+
+
+def write_dataset(path, n_rows, chunksize=500_000, seed=42, label_noise=0.0, fmt=None):
+    """Menulis n_rows baris dummy ke CSV atau Parquet per chunk; mengembalikan ukuran file (byte)"""
+    fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+    writer = None
+    if fmt == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    # Lebar id mengikuti jumlah baris (minimal 4 digit seperti R0001)
+    id_width = max(4, len(str(n_rows)))
+    tmp_path = f'{path}.tmp'
+    next_id = 1
+    written = 0
+    try:
+        for chunk_index, start in enumerate(range(0, n_rows, chunksize)):
+            rng = np.random.default_rng([seed, chunk_index])
+            df, n_unique = generate_chunk(min(chunksize, n_rows - start), next_id,
+                                          id_width, rng, label_noise)
+            next_id += n_unique
+            if fmt == 'parquet':
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table)
+            else:
+                df.to_csv(tmp_path, mode='w' if chunk_index == 0 else 'a',
+                          header=chunk_index == 0, index=False)
+            written += len(df)
+            if n_rows > chunksize:
+                print(f"  {written:,}/{n_rows:,} baris", end='\r', flush=True)
+        if n_rows > chunksize:
+            print()
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate dataset dummy kepuasan pengguna e-learning")
+    parser.add_argument('--rows', type=int, default=505,
+                        help="Jumlah baris termasuk duplikat (default: 505, seukuran dataset asli)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help="File output .csv atau .parquet")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=None,
+                        help="Format output (default: dari ekstensi file)")
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--label-noise', type=float, default=0.0,
+                        help="Std noise Gaussian pada skor label (0 = terpisah linear seperti data asli)")
+    args = parser.parse_args()
+
+    if args.rows <= 0 or args.chunksize <= 0:
+        print("✗ --rows dan --chunksize harus lebih dari 0")
+        return 1
+
+    print(f"Generate {args.rows:,} baris -> {args.output} (seed {args.seed}, chunk {args.chunksize:,})")
+    start = time.perf_counter()
+    try:
+        size = write_dataset(args.output, args.rows, args.chunksize, args.seed,
+                             args.label_noise, args.format)
+    except ImportError:
+        print("✗ Output Parquet membutuhkan pyarrow (pip install pyarrow)")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ {args.rows:,} baris ditulis dalam {elapsed:.2f} detik "
+          f"({args.rows / elapsed:,.0f} baris/detik, {size / 1024 ** 2:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Engine inferensi berbasis NumPy tanpa dispatch pandas/sklearn per prediksi.
+
+Scaler, label encoder, dan model dilipat menjadi array yang dihitung sekali saat
+load, sehingga satu prediksi hanya berupa beberapa operasi aritmetika.
+"""
+import math
+
+import numpy as np
+
+from artifacts import expected_cols
+
+
+def gender_mapping(label_encoder=None):
+    """Mapping jenis_kelamin -> kode integer sesuai LabelEncoder saat training"""
+    if label_encoder is None:
+        return {'L': 0, 'P': 1}
+    return {label: code for code, label in enumerate(label_encoder.classes_)}
+
+
+def _sigmoid(z):
+    """Sigmoid yang stabil untuk satu nilai float"""
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+class InferenceEngine:
+    """Basis engine: input mentah (jenis_kelamin sudah di-encode) -> probabilitas"""
+
+    def __init__(self, genders, classes=(0, 1)):
+        self.genders = dict(genders)
+        self.classes = np.asarray(classes)
+
+    def encode(self, data):
+        """Mengubah dict input menjadi list float dalam urutan expected_cols"""
+        try:
+            gender = self.genders[data['jenis_kelamin']]
+        except KeyError:
+            raise ValueError(f"Nilai jenis_kelamin tidak dikenal: {data['jenis_kelamin']!r}")
+        return [float(gender) if col == 'jenis_kelamin' else float(data[col])
+                for col in expected_cols]
+
+    def encode_frame(self, df):
+        """Mengubah DataFrame mentah menjadi matriks float64 (n, 8)"""
+        X = np.empty((len(df), len(expected_cols)), dtype=np.float64)
+        for j, col in enumerate(expected_cols):
+            if col == 'jenis_kelamin':
+                codes = df[col].map(self.genders)
+                if codes.isnull().any():
+                    labels = sorted(df[col][codes.isnull()].astype(str).unique())
+                    raise ValueError(f"Nilai jenis_kelamin tidak dikenal: {labels}")
+                X[:, j] = codes.to_numpy(dtype=np.float64)
+            else:
+                X[:, j] = df[col].to_numpy(dtype=np.float64)
+        return X
+
+    def predict_proba(self, X):
+        """Probabilitas [tidak puas, puas] untuk matriks input mentah"""
+        p = self.predict_proba_puas(np.asarray(X, dtype=np.float64))
+        return np.column_stack([1.0 - p, p])
+
+    def predict(self, X):
+        """Kelas prediksi untuk matriks input mentah"""
+        return self.predict_with_proba(X)[0]
+
+    def predict_with_proba(self, X):
+        """Kelas dan probabilitas dalam satu kali scoring"""
+        probability = self.predict_proba(X)
+        return self.classes.take(probability.argmax(axis=1)), probability
+
+
+class FusedLogisticRegression(InferenceEngine):
+    """StandardScaler + LogisticRegression dilipat menjadi satu transformasi affine
+
+    z = sum(coef * (x - mean) / scale) + intercept = x . weights + bias
+    """
+
+    def __init__(self, weights, bias, genders, classes=(0, 1)):
+        super().__init__(genders, classes)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self._weights_list = self.weights.tolist()
+
+    @classmethod
+    def from_sklearn(cls, model, scaler=None, label_encoder=None):
+        """Membangun engine dari objek sklearn hasil train_model.py"""
+        coef = np.asarray(model.coef_, dtype=np.float64)
+        if coef.shape[0] != 1 or len(model.classes_) != 2:
+            raise ValueError("Hanya model klasifikasi biner yang didukung")
+        coef = coef[0]
+        intercept = float(np.ravel(model.intercept_)[0])
+
+        if scaler is not None:
+            weights = coef / scaler.scale_
+            bias = intercept - float(np.dot(weights, scaler.mean_))
+        else:
+            weights, bias = coef, intercept
+
+        return cls(weights, bias, gender_mapping(label_encoder), model.classes_)
+
+    def decision_function(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.weights + self.bias
+
+    def predict_proba_puas(self, X):
+        z = self.decision_function(X)
+        # sigmoid stabil: exp(-log(1 + exp(-z)))
+        return np.exp(-np.logaddexp(0.0, -z))
+
+    def predict_one(self, data):
+        """Satu prediksi: (kelas, [prob tidak puas, prob puas])"""
+        x = self.encode(data)
+        z = self.bias
+        for w, v in zip(self._weights_list, x):
+            z += w * v
+        p = _sigmoid(z)
+        prediction = self.classes[1] if z > 0 else self.classes[0]
+        return prediction, np.array([1.0 - p, p])
+
+
+class CompiledDecisionTree(InferenceEngine):
+    """DecisionTreeClassifier yang diratakan menjadi array kontigu
+
+    Threshold dikembalikan ke satuan fitur mentah (threshold * scale + mean),
+    sehingga scaling tidak perlu dijalankan sama sekali. Daun dibuat menunjuk
+    ke dirinya sendiri agar traversal satu batch cukup max_depth langkah.
+    """
+
+    def __init__(self, feature, threshold, left, right, proba, max_depth, genders, classes=(0, 1)):
+        super().__init__(genders, classes)
+        self.feature = np.ascontiguousarray(feature, dtype=np.intp)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self.left = np.ascontiguousarray(left, dtype=np.intp)
+        self.right = np.ascontiguousarray(right, dtype=np.intp)
+        self.proba = np.ascontiguousarray(proba, dtype=np.float64)
+        self.max_depth = int(max_depth)
+        self._nodes = list(zip(self.feature.tolist(), self.threshold.tolist(),
+                               self.left.tolist(), self.right.tolist()))
+
+    @classmethod
+    def from_sklearn(cls, model, scaler=None, label_encoder=None):
+        """Membangun engine dari DecisionTreeClassifier hasil train_model.py"""
+        tree = model.tree_
+        if tree.n_outputs != 1 or len(model.classes_) != 2:
+            raise ValueError("Hanya model klasifikasi biner yang didukung")
+
+        n_nodes = tree.node_count
+        nodes = np.arange(n_nodes)
+        is_leaf = tree.children_left == -1
+
+        feature = np.where(is_leaf, 0, tree.feature)
+        threshold = tree.threshold.astype(np.float64)
+        if scaler is not None:
+            threshold = threshold * scaler.scale_[feature] + scaler.mean_[feature]
+        threshold = np.where(is_leaf, np.inf, threshold)
+        left = np.where(is_leaf, nodes, tree.children_left)
+        right = np.where(is_leaf, nodes, tree.children_right)
+
+        # Normalisasi sama seperti DecisionTreeClassifier.predict_proba
+        value = tree.value[:, 0, :].astype(np.float64)
+        normalizer = value.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba = value / normalizer
+
+        return cls(feature, threshold, left, right, proba, tree.max_depth,
+                   gender_mapping(label_encoder), model.classes_)
+
+    def apply(self, X):
+        """Indeks daun untuk setiap baris, ditelusuri bersamaan untuk seluruh batch"""
+        X = np.asarray(X, dtype=np.float64)
+        rows = np.arange(X.shape[0])
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def predict_proba(self, X):
+        return self.proba[self.apply(X)]
+
+    def predict_proba_puas(self, X):
+        return self.proba[self.apply(X), 1]
+
+    def predict_one(self, data):
+        """Satu prediksi: (kelas, [prob tidak puas, prob puas])"""
+        x = self.encode(data)
+        node = 0
+        for _ in range(self.max_depth):
+            feature, threshold, left, right = self._nodes[node]
+            node = left if x[feature] <= threshold else right
+        probability = self.proba[node]
+        return self.classes[probability.argmax()], probability.copy()
+
+
+def build_engine(model, scaler=None, label_encoder=None):
+    """Membuat engine yang sesuai untuk model, atau None jika belum didukung"""
+    if isinstance(model, InferenceEngine):
+        return model
+    if hasattr(model, 'coef_'):
+        return FusedLogisticRegression.from_sklearn(model, scaler, label_encoder)
+    if hasattr(model, 'tree_'):
+        return CompiledDecisionTree.from_sklearn(model, scaler, label_encoder)
+    return None
+
+
+def sklearn_predict_proba(model, X_scaled):
+    """Probabilitas dari model sklearn dengan definisi yang sama seperti engine
+
+    Untuk logistic regression biner probabilitas puas selalu
+    sigmoid(decision_function). predict_proba sklearn tidak dipakai karena
+    hasilnya bergantung pada versi: pickle dari sklearn yang lebih baru dibaca
+    sebagai multinomial sehingga menghasilkan sigmoid(2z).
+    """
+    if hasattr(model, 'coef_') and len(model.classes_) == 2:
+        z = np.asarray(model.decision_function(X_scaled), dtype=np.float64)
+        p = np.exp(-np.logaddexp(0.0, -z))
+        return np.column_stack([1.0 - p, p])
+    return model.predict_proba(X_scaled)
+
+
+def verify_against_sklearn(engine, model, X_raw, X_scaled):
+    """Membandingkan engine dengan model sklearn pada data yang sama
+
+    Decision tree harus identik bit-per-bit (kelas dan probabilitas); untuk
+    logistic regression dibandingkan kelas, decision function, dan probabilitas
+    (sklearn_predict_proba, jalur fallback dashboard dan batch).
+    """
+    prediction, probability = engine.predict_with_proba(X_raw)
+    same_class = np.array_equal(prediction, model.predict(X_scaled))
+
+    if isinstance(engine, CompiledDecisionTree):
+        return same_class and np.array_equal(probability, model.predict_proba(X_scaled))
+
+    return (same_class
+            and np.allclose(engine.decision_function(X_raw), model.decision_function(X_scaled),
+                            rtol=1e-9, atol=1e-9)
+            and np.allclose(probability, sklearn_predict_proba(model, X_scaled),
+                            rtol=1e-9, atol=1e-12))
+
+
+def main(argv=None):
+    import argparse
+    import warnings
+
+    import pandas as pd
+
+    from artifacts import MODEL_FILES, load_artifacts
+    from batch_predict import fill_missing, preprocess_batch
+
+    warnings.filterwarnings('ignore')
+    parser = argparse.ArgumentParser(description="Verifikasi engine NumPy terhadap sklearn")
+    parser.add_argument('csv', nargs='?', default='dataset_kepuasan_pengguna_elearning.csv')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.csv)
+    ok = True
+    for model_name in MODEL_FILES.values():
+        model, scaler, label_encoder = load_artifacts(model_name)
+        engine = build_engine(model, scaler, label_encoder)
+        X_raw = engine.encode_frame(fill_missing(df[expected_cols].copy(), scaler))
+        X_scaled = preprocess_batch(df, scaler, label_encoder).to_numpy()
+
+        match = verify_against_sklearn(engine, model, X_raw, X_scaled)
+        ok = ok and match
+        print(f"{'✓' if match else '✗'} {model_name}: {len(df)} baris "
+              f"{'cocok' if match else 'TIDAK cocok'} dengan sklearn")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
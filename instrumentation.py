@@ -0,0 +1,187 @@
+"""Instrumentasi ringan untuk training dan serving: span waktu, memori puncak,
+dan ekspor metrik.
+
+Aktif jika environment variable ELEARNING_METRICS=1 (atau enable() dipanggil).
+Saat nonaktif, span() mengembalikan context manager kosong yang sama setiap
+kali dan observe() langsung kembali, sehingga instrumentasi dapat dibiarkan
+terpasang di production.
+
+Ekspor:
+    metrics/<nama>.prom          format teks Prometheus (textfile collector)
+    metrics/<nama>_summary.json  ringkasan run (per span: jumlah, total, rata-rata, maks)
+
+Contoh:
+    with span('train.load'):
+        df = load_dataset(path)
+    export(name='train')
+"""
+import bisect
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from datetime import datetime
+
+METRICS_DIR = os.environ.get('ELEARNING_METRICS_DIR', 'metrics')
+PREFIX = 'elearning'
+
+# Batas bucket histogram (detik), dari latensi satu prediksi sampai tahap training
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+           1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def peak_rss_mb():
+    """Memori puncak proses (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+class _NullSpan:
+    """Span kosong yang dipakai saat instrumentasi nonaktif"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """Kumpulan histogram durasi per nama span (thread-safe)"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._stats = {}
+        self._rss_after = {}
+        self._lock = threading.Lock()
+        self._next_export = 0.0
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, name):
+        """Context manager yang mencatat durasi blok dengan nama span ini"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def observe(self, name, seconds):
+        """Mencatat satu durasi (detik)"""
+        if not self.enabled:
+            return
+        bucket = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                # [jumlah, total, maks, hitungan per bucket (tidak kumulatif)]
+                stat = self._stats[name] = [0, 0.0, 0.0, [0] * len(BUCKETS)]
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+            if bucket < len(BUCKETS):
+                stat[3][bucket] += 1
+            self._rss_after[name] = peak_rss_mb()
+
+    def summary(self):
+        """Ringkasan run dalam bentuk dict (untuk JSON)"""
+        with self._lock:
+            spans = {
+                name: {
+                    'count': count,
+                    'total_seconds': total,
+                    'mean_seconds': total / count,
+                    'max_seconds': maximum,
+                    'peak_rss_mb_after': self._rss_after[name],
+                }
+                for name, (count, total, maximum, _) in self._stats.items()
+            }
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'uptime_seconds': time.perf_counter() - self._start,
+            'peak_rss_mb': peak_rss_mb(),
+            'spans': spans,
+        }
+
+    def to_prometheus(self):
+        """Semua metrik dalam format teks Prometheus"""
+        lines = [
+            f'# HELP {PREFIX}_span_seconds Durasi span instrumentasi',
+            f'# TYPE {PREFIX}_span_seconds histogram',
+        ]
+        with self._lock:
+            stats = {name: (count, total, maximum, list(buckets))
+                     for name, (count, total, maximum, buckets) in self._stats.items()}
+        for name in sorted(stats):
+            count, total, _, buckets = stats[name]
+            cumulative = 0
+            for bound, n in zip(BUCKETS, buckets):
+                cumulative += n
+                lines.append(f'{PREFIX}_span_seconds_bucket{{span="{name}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{PREFIX}_span_seconds_bucket{{span="{name}",le="+Inf"}} {count}')
+            lines.append(f'{PREFIX}_span_seconds_sum{{span="{name}"}} {total:.6f}')
+            lines.append(f'{PREFIX}_span_seconds_count{{span="{name}"}} {count}')
+
+        lines.append(f'# HELP {PREFIX}_span_max_seconds Durasi terlama per span')
+        lines.append(f'# TYPE {PREFIX}_span_max_seconds gauge')
+        for name in sorted(stats):
+            lines.append(f'{PREFIX}_span_max_seconds{{span="{name}"}} {stats[name][2]:.6f}')
+
+        lines.append(f'# HELP {PREFIX}_peak_rss_bytes Memori puncak proses')
+        lines.append(f'# TYPE {PREFIX}_peak_rss_bytes gauge')
+        lines.append(f'{PREFIX}_peak_rss_bytes {int(peak_rss_mb() * 1024 * 1024)}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, name, directory=METRICS_DIR):
+        """Menulis file .prom dan ringkasan JSON secara atomik; mengembalikan path-nya"""
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, f'{name}.prom')
+        json_path = os.path.join(directory, f'{name}_summary.json')
+        for path, content in [(prom_path, self.to_prometheus()),
+                              (json_path, json.dumps(self.summary(), indent=2))]:
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w') as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        return prom_path, json_path
+
+    def export_if_due(self, name, interval=15.0, directory=METRICS_DIR):
+        """Ekspor paling sering sekali per interval detik (untuk proses yang berjalan lama)"""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        if now < self._next_export:
+            return None
+        self._next_export = now + interval
+        return self.export(name, directory)
+
+
+# Registry bersama untuk satu proses
+registry = Metrics(enabled=os.environ.get('ELEARNING_METRICS') == '1')
+span = registry.span
+observe = registry.observe
+export = registry.export
@@ -0,0 +1,220 @@
+"""Bundle model berversi: satu file berisi scaler, encoder, logreg, dan decision tree.
+
+Format file:
+    8 byte   magic b'ELBUNDL1'
+    8 byte   panjang header (uint64 little-endian)
+    header   JSON: manifest + tabel array (dtype, shape, offset)
+    data     array mentah, masing-masing rata 64 byte
+
+Bundle dibaca dengan mmap dan np.frombuffer (zero-copy) tanpa mengimpor
+sklearn, dan karena semua artefak berada dalam satu file yang ditulis secara
+atomik, artefak dari run training yang berbeda tidak mungkin tercampur.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from artifacts import MODEL_FILES, expected_cols, load_artifacts
+from inference_engine import CompiledDecisionTree, FusedLogisticRegression
+
+BUNDLE_FILE = 'model_bundle.bin'
+DATASET_FILE = 'dataset_kepuasan_pengguna_elearning.csv'
+MAGIC = b'ELBUNDL1'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+HOLDOUT_ROWS = 1000
+
+
+def file_sha256(path, block_size=1 << 20):
+    """Hash SHA-256 isi file (dibaca per blok)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_bundle(path, scaler, label_encoder, logreg, dt, data_hash=None, metrics=None,
+                 holdout=None):
+    """Menulis semua artefak hasil training ke satu file bundle (atomik)
+
+    holdout (X mentah ter-encode, y) dari test split disimpan maksimal
+    HOLDOUT_ROWS baris untuk validasi saat model dimuat ulang.
+    """
+    # Threshold tree disimpan dalam satuan fitur mentah
+    tree = CompiledDecisionTree.from_sklearn(dt, scaler, label_encoder)
+    arrays = {
+        'scaler_mean': np.asarray(scaler.mean_, dtype=np.float64),
+        'scaler_scale': np.asarray(scaler.scale_, dtype=np.float64),
+        'logreg_coef': np.asarray(logreg.coef_, dtype=np.float64).ravel(),
+        'logreg_intercept': np.asarray(logreg.intercept_, dtype=np.float64).ravel(),
+        'tree_feature': tree.feature.astype(np.int64),
+        'tree_threshold': tree.threshold,
+        'tree_left': tree.left.astype(np.int64),
+        'tree_right': tree.right.astype(np.int64),
+        'tree_proba': tree.proba,
+    }
+    if holdout is not None:
+        X, y = holdout
+        arrays['holdout_X'] = np.asarray(X, dtype=np.float64)[:HOLDOUT_ROWS]
+        arrays['holdout_y'] = np.asarray(y, dtype=np.int64)[:HOLDOUT_ROWS]
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'features': expected_cols,
+        'encoder_classes': [str(c) for c in label_encoder.classes_],
+        'classes': {'logreg_model': np.asarray(logreg.classes_).tolist(),
+                    'dt_model': np.asarray(dt.classes_).tolist()},
+        'tree_max_depth': tree.max_depth,
+        'logreg_type': type(logreg).__name__,
+        'training_data_sha256': data_hash,
+        'medians': getattr(scaler, 'medians_', None),
+        'metrics': metrics or {},
+    }
+
+    # Offset dihitung relatif terhadap awal bagian data
+    table, offset = {}, 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        table[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += array.nbytes
+
+    header = json.dumps({'manifest': manifest, 'arrays': table}).encode()
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(struct.pack('<Q', len(header)))
+        file.write(header)
+        for name, array in arrays.items():
+            file.seek(data_start + table[name]['offset'])
+            file.write(np.ascontiguousarray(array).tobytes())
+    os.replace(tmp_path, path)
+    return manifest
+
+
+class BundleScaler:
+    """Pengganti StandardScaler (mean_, scale_, transform) tanpa sklearn
+
+    medians_ adalah median imputasi training, jika bundle menyimpannya.
+    """
+
+    def __init__(self, mean, scale, medians=None):
+        self.mean_ = mean
+        self.scale_ = scale
+        if medians is not None:
+            self.medians_ = medians
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+class BundleLabelEncoder:
+    """Pengganti LabelEncoder (classes_, transform) tanpa sklearn"""
+
+    def __init__(self, classes):
+        self.classes_ = np.asarray(classes, dtype=object)
+        self._codes = {label: code for code, label in enumerate(classes)}
+
+    def transform(self, y):
+        try:
+            return np.array([self._codes[label] for label in y], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError(f"y contains previously unseen labels: {e}")
+
+
+class ModelBundle:
+    """Bundle yang sudah dibuka: manifest, preprocessors, dan engine NumPy"""
+
+    def __init__(self, manifest, arrays, buffer=None):
+        self.manifest = manifest
+        self.arrays = arrays
+        self._buffer = buffer
+
+        self.scaler = BundleScaler(arrays['scaler_mean'], arrays['scaler_scale'],
+                                   manifest.get('medians'))
+        self.label_encoder = BundleLabelEncoder(manifest['encoder_classes'])
+        self.holdout = ((arrays['holdout_X'], arrays['holdout_y'])
+                        if 'holdout_X' in arrays else None)
+        genders = {label: code for code, label in enumerate(manifest['encoder_classes'])}
+
+        coef = arrays['logreg_coef']
+        weights = coef / self.scaler.scale_
+        bias = float(arrays['logreg_intercept'][0]) - float(np.dot(weights, self.scaler.mean_))
+        self.engines = {
+            'logreg_model': FusedLogisticRegression(
+                weights, bias, genders, manifest['classes']['logreg_model']),
+            'dt_model': CompiledDecisionTree(
+                arrays['tree_feature'], arrays['tree_threshold'], arrays['tree_left'],
+                arrays['tree_right'], arrays['tree_proba'], manifest['tree_max_depth'],
+                genders, manifest['classes']['dt_model']),
+        }
+
+    @classmethod
+    def load(cls, path=BUNDLE_FILE):
+        """Membuka bundle dengan mmap; array langsung menunjuk ke halaman file"""
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} bukan file bundle model yang valid")
+        (header_length,) = struct.unpack_from('<Q', buffer, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(buffer[header_start:header_start + header_length])
+        manifest = header['manifest']
+
+        if manifest['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"Versi bundle {manifest['format_version']} tidak didukung")
+        if manifest['features'] != expected_cols:
+            raise ValueError("Urutan fitur di bundle berbeda dengan expected_cols")
+
+        data_start = _align(header_start + header_length)
+        arrays = {}
+        for name, spec in header['arrays'].items():
+            dtype = np.dtype(spec['dtype'])
+            count = int(np.prod(spec['shape'])) if spec['shape'] else 1
+            array = np.frombuffer(buffer, dtype=dtype, count=count,
+                                  offset=data_start + spec['offset'])
+            arrays[name] = array.reshape(spec['shape'])
+        return cls(manifest, arrays, buffer)
+
+
+def main(argv=None):
+    """Membuat bundle dari file pickle yang sudah ada, atau menampilkan manifest"""
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else 'build'
+
+    if command == 'show':
+        print(json.dumps(ModelBundle.load(BUNDLE_FILE).manifest, indent=2))
+        return 0
+    if command != 'build':
+        print("Penggunaan: python model_bundle.py [build|show]")
+        return 1
+
+    try:
+        logreg, scaler, label_encoder = load_artifacts(MODEL_FILES['Logistic Regression'])
+        dt, _, _ = load_artifacts(MODEL_FILES['Decision Tree'])
+    except FileNotFoundError as e:
+        print(f"✗ {e.filename} tidak ditemukan. Jalankan train_model.py terlebih dahulu.")
+        return 1
+
+    data_hash = file_sha256(DATASET_FILE) if os.path.exists(DATASET_FILE) else None
+    write_bundle(BUNDLE_FILE, scaler, label_encoder, logreg, dt, data_hash=data_hash)
+    print(f"✓ {BUNDLE_FILE} dibuat ({os.path.getsize(BUNDLE_FILE)} byte)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
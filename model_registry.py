@@ -0,0 +1,217 @@
+"""Registry model dashboard dengan hot-reload setelah training ulang.
+
+Artefak yang sedang dipakai disimpan sebagai satu ModelSet yang tidak pernah
+diubah: model, scaler, encoder, engine, dan fingerprint selalu berasal dari
+pemuatan yang sama. Thread watcher memeriksa waktu modifikasi dan ukuran file
+artefak; setelah berubah dan stabil selama satu interval (train_model.py
+menulis beberapa file berurutan), set baru dimuat di latar, divalidasi pada
+sampel hold-out, lalu dipasang dengan satu assignment referensi. Prediksi yang
+sedang berjalan tetap memakai set yang diambilnya di awal. Set yang gagal
+validasi ditolak dan set lama tetap dipakai sampai file berubah lagi.
+
+Set ELEARNING_HOT_RELOAD=0 untuk menonaktifkan watcher.
+"""
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from artifacts import MODEL_FILES, TARGET, artifact_fingerprint, expected_cols, load_runtime_artifacts
+from inference_engine import build_engine
+from model_bundle import DATASET_FILE, HOLDOUT_ROWS
+from prediction_cache import ARTIFACT_PATHS, artifact_signature
+from prediction_cube import MANIFEST_FILE, PredictionCube, with_cube
+
+# Cube yang dibangun ulang juga memicu reload agar lookup-nya ikut dipakai
+WATCHED_PATHS = ARTIFACT_PATHS + [MANIFEST_FILE]
+
+MIN_ACCURACY = 0.6          # akurasi minimum setiap model pada sampel validasi
+MAX_ACCURACY_DROP = 0.05    # penurunan akurasi maksimum dibanding set aktif
+
+
+def hot_reload_enabled():
+    return os.environ.get('ELEARNING_HOT_RELOAD', '1') != '0'
+
+
+class ModelSet:
+    """Satu set artefak yang dimuat bersamaan (tidak diubah setelah dibuat)"""
+
+    def __init__(self, artifacts, signature=None, fingerprint=None, cube=None):
+        self.models = dict(artifacts['models'])
+        self.scaler = artifacts['scaler']
+        self.label_encoder = artifacts['label_encoder']
+        self.holdout = artifacts.get('holdout')
+        self.signature = signature
+        self.fingerprint = fingerprint
+        self.engines = {name: with_cube(build_engine(model, self.scaler, self.label_encoder),
+                                        name, cube)
+                        for name, model in self.models.items() if model is not None}
+        self.loaded_at = datetime.now()
+        self.report = None
+
+
+def load_model_set(paths=WATCHED_PATHS):
+    """Memuat artefak dari disk beserta cube dan fingerprint-nya"""
+    signature = artifact_signature(paths)
+    try:
+        fingerprint = artifact_fingerprint()
+    except FileNotFoundError:
+        fingerprint = None
+    return ModelSet(load_runtime_artifacts(), signature, fingerprint, PredictionCube.load())
+
+
+def validation_sample(model_set, path=DATASET_FILE, n_rows=HOLDOUT_ROWS):
+    """(X mentah, y) untuk validasi, atau None jika tidak tersedia
+
+    Memakai hold-out dari test split yang disimpan di bundle. Untuk artefak
+    pickle tanpa bundle dipakai sampel berjarak rata dari dataset training
+    (hanya pemeriksaan kewajaran, bukan data yang belum pernah dilihat model).
+    """
+    if model_set.holdout is not None:
+        return model_set.holdout
+    if not os.path.exists(path) or not model_set.engines:
+        return None
+    import pandas as pd
+    df = pd.read_csv(path).dropna(subset=expected_cols + [TARGET])
+    df = df.iloc[::max(len(df) // n_rows, 1)].iloc[:n_rows]
+    engine = next(iter(model_set.engines.values()))
+    return engine.encode_frame(df), df[TARGET].to_numpy()
+
+
+def evaluate(model_set, X, y):
+    """Akurasi setiap model pada sampel; ValueError jika model hilang atau skornya tidak valid"""
+    accuracy = {}
+    for name in MODEL_FILES.values():
+        engine = model_set.engines.get(name)
+        if engine is None:
+            raise ValueError(f"Model {name} tidak tersedia")
+        prediction, probability = engine.predict_with_proba(X)
+        if not np.all((probability >= 0.0) & (probability <= 1.0)):
+            raise ValueError(f"Probabilitas {name} di luar rentang [0, 1]")
+        accuracy[name] = float(np.mean(prediction == y))
+    return accuracy
+
+
+def validate(candidate, current=None, min_accuracy=MIN_ACCURACY, max_drop=MAX_ACCURACY_DROP):
+    """Memeriksa set kandidat sebelum dipasang; ValueError jika ditolak
+
+    Mengembalikan laporan berisi jumlah baris sampel dan akurasi setiap model
+    (set kandidat dan set aktif pada sampel yang sama).
+    """
+    sample = validation_sample(candidate)
+    if sample is None:
+        raise ValueError("Tidak ada sampel validasi (bundle tanpa hold-out dan dataset tidak ditemukan)")
+    X, y = sample
+    accuracy = evaluate(candidate, X, y)
+    for name, value in accuracy.items():
+        if value < min_accuracy:
+            raise ValueError(f"Akurasi {name} {value:.1%} di bawah batas {min_accuracy:.0%}")
+
+    previous = {}
+    if current is not None:
+        try:
+            previous = evaluate(current, X, y)
+        except ValueError:
+            previous = {}
+    for name, value in previous.items():
+        if accuracy[name] < value - max_drop:
+            raise ValueError(f"Akurasi {name} turun dari {value:.1%} menjadi {accuracy[name]:.1%}")
+    return {'rows': len(y), 'accuracy': accuracy, 'previous_accuracy': previous}
+
+
+class ModelRegistry:
+    """Menyimpan ModelSet aktif dan menggantinya secara atomik saat artefak berubah"""
+
+    def __init__(self, initial=None, loader=load_model_set, interval=2.0, paths=WATCHED_PATHS):
+        self.loader = loader
+        self.interval = interval
+        self.paths = list(paths)
+        self.reloads = 0
+        self.rejected = 0
+        self.last_error = None
+        self._current = initial if initial is not None else loader()
+        self._rejected_signature = None
+        self._reload_lock = threading.Lock()
+        self._thread = None
+
+    def current(self):
+        """Set aktif; ambil sekali per prediksi lalu pakai seluruh isinya"""
+        return self._current
+
+    def reload(self):
+        """Memuat set baru, memvalidasinya, lalu memasangnya; ValueError jika ditolak"""
+        with self._reload_lock:
+            signature = artifact_signature(self.paths)
+            try:
+                candidate = self.loader()
+                if artifact_signature(self.paths) != signature:
+                    # Masih ditulis; watcher akan mencoba lagi setelah file stabil
+                    raise ValueError("File artefak berubah selama dimuat")
+                candidate.report = validate(candidate, self._current)
+            except Exception as e:
+                self.rejected += 1
+                self.last_error = str(e)
+                self._rejected_signature = signature
+                raise ValueError(f"Set model baru ditolak: {e}") from e
+            self._current = candidate
+            self.reloads += 1
+            self.last_error = None
+            return candidate
+
+    def check(self, pending=None):
+        """Satu putaran watcher; mengembalikan signature yang sedang ditunggu stabil"""
+        signature = artifact_signature(self.paths)
+        if signature in (self._current.signature, self._rejected_signature):
+            return None
+        if signature != pending:
+            return signature
+        try:
+            self.reload()
+        except ValueError:
+            pass  # last_error dicatat, set lama tetap dipakai
+        return None
+
+    def _watch(self):
+        pending = None
+        while True:
+            time.sleep(self.interval)
+            pending = self.check(pending)
+
+    def watch(self):
+        """Memulai thread watcher sekali (tidak melakukan apa pun jika dinonaktifkan)"""
+        if hot_reload_enabled() and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name='model-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stats(self):
+        """Ringkasan status reload untuk ditampilkan di dashboard"""
+        current = self._current
+        return {
+            'loaded_at': current.loaded_at,
+            'reloads': self.reloads,
+            'rejected': self.rejected,
+            'last_error': self.last_error,
+            'accuracy': (current.report or {}).get('accuracy'),
+        }
+
+
+def main():
+    """Memvalidasi artefak di disk dengan aturan yang sama seperti hot-reload"""
+    try:
+        model_set = load_model_set()
+        report = validate(model_set)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ Artefak tidak lolos validasi: {e}")
+        return 1
+    print(f"✓ Artefak valid pada {report['rows']} baris sampel")
+    for name, value in report['accuracy'].items():
+        print(f"  • {name}: akurasi {value:.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
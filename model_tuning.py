@@ -0,0 +1,146 @@
+"""Hyperparameter tuning paralel dengan stratified k-fold cross-validation.
+
+Fold (termasuk StandardScaler per fold) dihitung sekali di proses utama lalu
+dikirim satu kali ke setiap worker lewat initializer ProcessPoolExecutor,
+sehingga kandidat tidak menghitung ulang preprocessing.
+"""
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+DEFAULT_GRID = {
+    'logreg': {
+        'C': [0.01, 0.1, 1.0, 10.0, 100.0],
+        'penalty': ['l1', 'l2'],
+    },
+    'dt': {
+        'max_depth': [3, 4, 5, 6, 8, None],
+        'min_samples_leaf': [1, 5, 10, 20, 50],
+        'criterion': ['gini', 'entropy'],
+    },
+}
+
+# Parameter tetap untuk setiap jenis model
+BASE_PARAMS = {
+    'logreg': {'max_iter': 1000, 'random_state': 42, 'solver': 'liblinear'},
+    'dt': {'random_state': 42},
+}
+
+ESTIMATORS = {
+    'logreg': LogisticRegression,
+    'dt': DecisionTreeClassifier,
+}
+
+_folds = None
+
+
+def load_grid(path=None):
+    """Grid default, atau grid dari file JSON dengan struktur yang sama"""
+    if path is None:
+        return DEFAULT_GRID
+    with open(path) as file:
+        return json.load(file)
+
+
+def expand_grid(grid):
+    """Semua kombinasi parameter untuk satu model"""
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def make_folds(X, y, n_splits=5, random_state=42):
+    """Fold stratified yang sudah di-scale (scaler di-fit pada bagian train setiap fold)"""
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    folds = []
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for train_idx, val_idx in splitter.split(X, y):
+        scaler = StandardScaler().fit(X[train_idx])
+        folds.append((scaler.transform(X[train_idx]), y[train_idx],
+                      scaler.transform(X[val_idx]), y[val_idx]))
+    return folds
+
+
+def _init_worker(folds):
+    global _folds
+    _folds = folds
+
+
+def evaluate_candidate(kind, params, folds=None):
+    """Rata-rata dan standar deviasi akurasi satu kandidat di semua fold"""
+    folds = _folds if folds is None else folds
+    scores = []
+    for X_train, y_train, X_val, y_val in folds:
+        model = ESTIMATORS[kind](**BASE_PARAMS[kind], **params)
+        model.fit(X_train, y_train)
+        scores.append(accuracy_score(y_val, model.predict(X_val)))
+    return kind, params, float(np.mean(scores)), float(np.std(scores))
+
+
+def run_search(candidates, folds, n_jobs=None):
+    """Mengevaluasi semua kandidat; n_jobs=1 berarti serial di proses ini"""
+    if n_jobs == 1:
+        return [evaluate_candidate(kind, params, folds) for kind, params in candidates]
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                             initargs=(folds,)) as executor:
+        # Kandidat dikirim berkelompok untuk menekan overhead IPC
+        chunksize = max(1, len(candidates) // (4 * (n_jobs or os.cpu_count() or 1)))
+        kinds, params = zip(*candidates)
+        return list(executor.map(evaluate_candidate, kinds, params, chunksize=chunksize))
+
+
+def tune_models(X, y, grid=None, n_splits=5, n_jobs=None, compare_serial=True):
+    """Mencari parameter terbaik untuk logreg dan decision tree
+
+    Mengembalikan dict {'logreg': params, 'dt': params, 'results': [...], 'timing': {...}}.
+    """
+    grid = grid or DEFAULT_GRID
+    n_jobs = n_jobs or os.cpu_count() or 1
+    candidates = [(kind, params) for kind in ESTIMATORS for params in expand_grid(grid.get(kind, {}))]
+
+    start = time.perf_counter()
+    folds = make_folds(X, y, n_splits)
+    fold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = run_search(candidates, folds, n_jobs)
+    parallel_seconds = time.perf_counter() - start
+
+    serial_seconds = None
+    if compare_serial:
+        start = time.perf_counter()
+        run_search(candidates, folds, n_jobs=1)
+        serial_seconds = time.perf_counter() - start
+
+    best = {}
+    for kind in ESTIMATORS:
+        scored = [r for r in results if r[0] == kind]
+        if scored:
+            # Urutan grid dipertahankan saat skor sama (kandidat pertama menang)
+            best[kind] = max(scored, key=lambda r: r[2])
+
+    return {
+        'logreg': best['logreg'][1] if 'logreg' in best else {},
+        'dt': best['dt'][1] if 'dt' in best else {},
+        'best': best,
+        'results': results,
+        'timing': {
+            'candidates': len(candidates),
+            'folds': n_splits,
+            'n_jobs': n_jobs,
+            'fold_seconds': fold_seconds,
+            'parallel_seconds': parallel_seconds,
+            'serial_seconds': serial_seconds,
+            'speedup': serial_seconds / parallel_seconds if serial_seconds else None,
+        },
+    }
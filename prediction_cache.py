@@ -0,0 +1,102 @@
+"""Cache prediksi LRU yang dipakai bersama oleh semua sesi dalam satu proses.
+
+Kunci cache terdiri dari fingerprint artefak yang sedang dimuat, nama model,
+dan tuple fitur yang sudah dinormalisasi. Seluruh isi cache dibuang otomatis
+ketika file pickle di disk berubah (misalnya setelah train_model.py dijalankan).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from artifacts import LABEL_ENCODER_FILE, MODEL_FILES, SCALER_FILE, expected_cols
+from model_bundle import BUNDLE_FILE
+
+ARTIFACT_PATHS = [f'{name}.pkl' for name in sorted(MODEL_FILES.values())] + \
+                 [SCALER_FILE, LABEL_ENCODER_FILE, BUNDLE_FILE]
+
+
+def normalize_input(data):
+    """Tuple fitur dalam urutan expected_cols; angka disamakan menjadi float"""
+    return tuple(str(data[col]) if col == 'jenis_kelamin' else float(data[col])
+                 for col in expected_cols)
+
+
+def artifact_signature(paths=ARTIFACT_PATHS):
+    """Waktu modifikasi dan ukuran file artefak (murah dibanding hashing isi file)"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class PredictionCache:
+    """LRU thread-safe dengan penghitung hit/miss dan invalidasi berbasis file artefak"""
+
+    def __init__(self, maxsize=10_000, check_interval=1.0, paths=ARTIFACT_PATHS):
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self.paths = list(paths)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._signature = artifact_signature(self.paths)
+        self._next_check = time.monotonic() + check_interval
+
+    def _check_artifacts(self):
+        """Membuang seluruh cache jika file artefak berubah sejak pemeriksaan terakhir"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        signature = artifact_signature(self.paths)
+        if signature != self._signature:
+            self._signature = signature
+            self._entries.clear()
+            self.invalidations += 1
+
+    def get_or_compute(self, fingerprint, model_name, data, compute):
+        """Mengembalikan (kelas, probabilitas) dari cache atau menghitungnya dengan compute()"""
+        key = (fingerprint, model_name, normalize_input(data))
+        with self._lock:
+            self._check_artifacts()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], np.array(entry[1])
+
+        prediction, probability = compute()
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (prediction, tuple(float(p) for p in probability))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return prediction, np.asarray(probability)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        """Ringkasan hit/miss untuk ditampilkan atau diekspor"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'invalidations': self.invalidations,
+        }
@@ -0,0 +1,211 @@
+"""Cube prediksi yang dihitung di muka untuk seluruh kombinasi slider dashboard.
+
+Semua input di tab Prediksi bersifat diskrit, sehingga probabilitas kedua model
+dapat dievaluasi sekali setelah train_model.py dan disimpan sebagai file .npy
+float16 yang dibuka dengan memory-map. Prediksi kemudian cukup berupa lookup
+indeks; input di luar grid (misalnya dari file batch) tetap memakai inferensi
+langsung.
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from artifacts import MODEL_FILES, artifact_fingerprint, expected_cols, load_artifacts
+from inference_engine import InferenceEngine, build_engine
+
+CUBE_FILE = 'prediction_cube.npy'
+MANIFEST_FILE = 'prediction_cube.json'
+
+# (start, step, jumlah nilai) untuk setiap fitur, urutan sesuai expected_cols
+GRID_AXES = {
+    'usia': (18, 1, 33),
+    'jenis_kelamin': (0, 1, 2),
+    'durasi_penggunaan': (0.0, 0.5, 17),
+    'frekuensi_login': (1, 1, 7),
+    'kualitas_materi': (1, 1, 5),
+    'kemudahan_penggunaan': (1, 1, 5),
+    'stabilitas_aplikasi': (1, 1, 5),
+    'interaksi_pengajar': (1, 1, 5),
+}
+
+GRID_SHAPE = tuple(GRID_AXES[col][2] for col in expected_cols)
+
+_HALF = np.float16(0.5)
+_ABOVE_HALF = np.nextafter(_HALF, np.float16(1.0))
+
+
+def grid_values(col):
+    """Semua nilai grid untuk satu fitur"""
+    start, step, count = GRID_AXES[col]
+    return start + step * np.arange(count, dtype=np.float64)
+
+
+def grid_rows(first_index):
+    """Matriks input mentah untuk satu irisan grid pada sumbu pertama (usia)"""
+    axes = [grid_values(col) for col in expected_cols[1:]]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    X = np.empty((mesh[0].size, len(expected_cols)), dtype=np.float64)
+    X[:, 0] = grid_values(expected_cols[0])[first_index]
+    for j, values in enumerate(mesh, start=1):
+        X[:, j] = values.ravel()
+    return X
+
+
+def quantize(probability, positive):
+    """Ubah ke float16 dengan menjaga kelas: p > 0.5 tepat untuk kelas positif"""
+    p16 = probability.astype(np.float16)
+    p16[positive & (p16 <= _HALF)] = _ABOVE_HALF
+    p16[~positive & (p16 > _HALF)] = _HALF
+    return p16
+
+
+def build_cube(cube_path=CUBE_FILE, manifest_path=MANIFEST_FILE):
+    """Mengevaluasi semua model di seluruh grid dan menyimpan cube ke disk
+
+    Cube dan manifest ditulis ke file .tmp lalu dipasang dengan os.replace:
+    proses yang masih memetakan cube lama tetap membaca isi lama sampai
+    memuat ulang, bukan file yang sedang ditulis.
+    """
+    model_names = sorted(MODEL_FILES.values())
+    tmp_cube = f'{cube_path}.tmp'
+    try:
+        cube = np.lib.format.open_memmap(tmp_cube, mode='w+', dtype=np.float16,
+                                         shape=(len(model_names),) + GRID_SHAPE)
+        for m, model_name in enumerate(model_names):
+            engine = build_engine(*load_artifacts(model_name))
+            for i in range(GRID_SHAPE[0]):
+                prediction, probability = engine.predict_with_proba(grid_rows(i))
+                positive = prediction == engine.classes[1]
+                cube[m, i] = quantize(probability[:, 1], positive).reshape(GRID_SHAPE[1:])
+        cube.flush()
+        del cube
+        os.replace(tmp_cube, cube_path)
+    finally:
+        if os.path.exists(tmp_cube):
+            os.remove(tmp_cube)
+
+    manifest = {
+        'models': model_names,
+        'features': expected_cols,
+        'axes': {col: list(GRID_AXES[col]) for col in expected_cols},
+        'fingerprint': artifact_fingerprint(model_names),
+    }
+    tmp_manifest = f'{manifest_path}.tmp'
+    with open(tmp_manifest, 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(tmp_manifest, manifest_path)
+
+
+class PredictionCube:
+    """Lookup probabilitas dari cube yang di-memory-map"""
+
+    def __init__(self, cube, models):
+        self.cube = cube
+        self.models = list(models)
+        self._starts = np.array([GRID_AXES[col][0] for col in expected_cols], dtype=np.float64)
+        self._steps = np.array([GRID_AXES[col][1] for col in expected_cols], dtype=np.float64)
+        self._counts = np.array(GRID_SHAPE)
+        self._axes = [GRID_AXES[col] for col in expected_cols]
+        self._slices = {name: cube[m] for m, name in enumerate(self.models)}
+
+    @classmethod
+    def load(cls, cube_path=CUBE_FILE, manifest_path=MANIFEST_FILE):
+        """Membuka cube; None jika belum dibangun atau sudah basi setelah training ulang"""
+        if not (os.path.exists(cube_path) and os.path.exists(manifest_path)):
+            return None
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        try:
+            fingerprint = artifact_fingerprint(manifest['models'])
+        except FileNotFoundError:
+            return None
+        if manifest['fingerprint'] != fingerprint or manifest['features'] != expected_cols:
+            return None
+
+        cube = np.load(cube_path, mmap_mode='r')
+        if cube.shape[1:] != GRID_SHAPE:
+            return None
+        return cls(cube, manifest['models'])
+
+    def grid_index(self, X):
+        """Indeks grid untuk setiap baris mentah dan mask baris yang berada di grid"""
+        X = np.asarray(X, dtype=np.float64)
+        position = (X - self._starts) / self._steps
+        index = np.rint(position)
+        on_grid = np.all((index == position) & (index >= 0) & (index < self._counts), axis=1)
+        index = np.where(on_grid[:, np.newaxis], index, 0).astype(np.intp)
+        return index, on_grid
+
+    def lookup(self, model_name, X):
+        """Probabilitas puas dari cube (NaN untuk baris di luar grid) dan mask on-grid"""
+        index, on_grid = self.grid_index(X)
+        flat = np.ravel_multi_index(tuple(index.T), GRID_SHAPE)
+        values = self._slices[model_name].reshape(-1)[flat].astype(np.float64)
+        values[~on_grid] = np.nan
+        return values, on_grid
+
+    def lookup_one(self, model_name, x):
+        """Probabilitas puas untuk satu baris mentah, None jika di luar grid"""
+        index = []
+        for value, (start, step, count) in zip(x, self._axes):
+            position = (value - start) / step
+            i = int(round(position))
+            if i != position or not 0 <= i < count:
+                return None
+            index.append(i)
+        return float(self._slices[model_name][tuple(index)])
+
+
+class CubeEngine(InferenceEngine):
+    """Engine yang menjawab dari cube dan kembali ke inferensi langsung di luar grid"""
+
+    def __init__(self, cube, model_name, fallback):
+        super().__init__(fallback.genders, fallback.classes)
+        self.cube = cube
+        self.model_name = model_name
+        self.fallback = fallback
+
+    def predict_proba_puas(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        probability, on_grid = self.cube.lookup(self.model_name, X)
+        if not on_grid.all():
+            probability[~on_grid] = self.fallback.predict_proba_puas(X[~on_grid])
+        return probability
+
+    def predict_one(self, data):
+        """Satu prediksi: (kelas, [prob tidak puas, prob puas])"""
+        p = self.cube.lookup_one(self.model_name, self.encode(data))
+        if p is None:
+            return self.fallback.predict_one(data)
+        return self.classes[1 if p > 0.5 else 0], np.array([1.0 - p, p])
+
+
+def with_cube(engine, model_name, cube):
+    """Membungkus engine dengan cube jika cube tersedia dan memuat model tersebut"""
+    if engine is None or cube is None or model_name not in cube.models:
+        return engine
+    return CubeEngine(cube, model_name, engine)
+
+
+def main():
+    print("Membangun prediction cube...")
+    start = time.perf_counter()
+    try:
+        build_cube()
+    except FileNotFoundError as e:
+        print(f"✗ Error: {e.filename} tidak ditemukan. Jalankan train_model.py terlebih dahulu.")
+        return 1
+    seconds = time.perf_counter() - start
+
+    cells = int(np.prod(GRID_SHAPE))
+    size_mb = os.path.getsize(CUBE_FILE) / 1024 ** 2
+    print(f"✓ {cells:,} kombinasi x {len(MODEL_FILES)} model dievaluasi dalam {seconds:.2f} detik")
+    print(f"✓ {CUBE_FILE} ({size_mb:.1f} MB) dan {MANIFEST_FILE} disimpan")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
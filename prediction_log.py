@@ -0,0 +1,323 @@
+"""Log prediksi append-only dengan record biner berukuran tetap.
+
+Setiap prediksi di dashboard disimpan sebagai satu record RECORD_DTYPE
+(waktu, delapan fitur mentah ter-encode, model, kelas, probabilitas puas) ke
+file segmen di folder prediction_log/. Jalur UI hanya menambahkan tuple ke
+antrean; thread flusher di latar menyalinnya ke segmen yang dipetakan dengan
+mmap, lalu memperbarui jumlah record di header. Segmen baru dibuat setelah
+segmen aktif penuh, dan segmen yang ditutup dipangkas ke ukuran isinya.
+
+Format segmen:
+    8 byte      magic b'ELPLOG01'
+    8 byte      jumlah record yang sudah lengkap (uint64 little-endian)
+    4 byte      panjang metadata (uint32 little-endian)
+    metadata    JSON: versi, field, kapasitas, mapping model dan jenis_kelamin
+    data        record mulai offset HEADER_SIZE
+
+Pembaca membuka segmen dengan mmap dan np.frombuffer sehingga record langsung
+menjadi structured array tanpa salinan. Hanya record sampai jumlah di header
+yang dibaca, jadi segmen yang sedang ditulis tetap dapat dibaca.
+
+Set ELEARNING_PREDICTION_LOG=0 untuk menonaktifkan log, dan
+ELEARNING_PREDICTION_LOG_DIR untuk mengubah folder.
+
+Contoh:
+    python prediction_log.py show
+    python prediction_log.py export log_prediksi.csv
+"""
+import atexit
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from artifacts import expected_cols
+from inference_engine import gender_mapping
+
+LOG_DIR = os.environ.get('ELEARNING_PREDICTION_LOG_DIR', 'prediction_log')
+MAGIC = b'ELPLOG01'
+FORMAT_VERSION = 1
+HEADER_SIZE = 4096
+SEGMENT_RECORDS = 65536         # 88 byte per record -> segmen ~5.8 MB
+MAX_PENDING = 100_000           # record di antrean; lebih dari ini dibuang dan dihitung
+
+# 88 byte, setiap field rata sesuai ukurannya
+RECORD_DTYPE = np.dtype(
+    [('timestamp', '<f8')]
+    + [(col, '<f8') for col in expected_cols]
+    + [('model_id', '<u4'), ('prediksi', '<u4'), ('prob_puas', '<f8')]
+)
+
+# Id tetap per model (0 = tidak dikenal); disimpan juga di metadata segmen
+MODEL_IDS = {'logreg_model': 1, 'dt_model': 2}
+
+
+def prediction_log_enabled():
+    return os.environ.get('ELEARNING_PREDICTION_LOG', '1') != '0'
+
+
+class _Segment:
+    """Satu file segmen yang sedang ditulis (dipetakan penuh sebesar kapasitasnya)"""
+
+    def __init__(self, path, capacity, meta):
+        self.path = path
+        self.capacity = capacity
+        header = json.dumps(meta).encode()
+        if len(MAGIC) + 12 + len(header) > HEADER_SIZE:
+            raise ValueError("Metadata segmen melebihi HEADER_SIZE")
+
+        # 'x': gagal jika file sudah ada, sehingga dua proses tidak pernah menimpa segmen yang sama
+        self.file = open(path, 'x+b')
+        self.file.truncate(HEADER_SIZE + capacity * RECORD_DTYPE.itemsize)
+        self.buffer = mmap.mmap(self.file.fileno(), 0)
+        self.buffer[:len(MAGIC)] = MAGIC
+        struct.pack_into('<QI', self.buffer, len(MAGIC), 0, len(header))
+        self.buffer[len(MAGIC) + 12:len(MAGIC) + 12 + len(header)] = header
+        self.records = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=self.buffer,
+                                  offset=HEADER_SIZE)
+        self.count = 0
+
+    def append(self, records):
+        """Menyalin record sebanyak sisa kapasitas; mengembalikan jumlah yang ditulis"""
+        n = min(len(records), self.capacity - self.count)
+        self.records[self.count:self.count + n] = records[:n]
+        self.count += n
+        # Jumlah diperbarui setelah data ditulis: pembaca tidak pernah melihat record setengah jadi
+        struct.pack_into('<Q', self.buffer, len(MAGIC), self.count)
+        return n
+
+    def full(self):
+        return self.count >= self.capacity
+
+    def close(self):
+        """Flush ke disk lalu pangkas file ke ukuran record yang terisi"""
+        self.buffer.flush()
+        del self.records
+        self.buffer.close()
+        self.file.truncate(HEADER_SIZE + self.count * RECORD_DTYPE.itemsize)
+        self.file.close()
+
+
+def list_segments(directory=LOG_DIR):
+    """Path semua segmen, urut dari yang terlama"""
+    return sorted(glob.glob(os.path.join(directory, 'segment_*.plog')))
+
+
+class PredictionLog:
+    """Penulis log prediksi: log() tidak pernah menunggu disk (thread-safe)"""
+
+    def __init__(self, directory=LOG_DIR, segment_records=SEGMENT_RECORDS, flush_interval=0.5,
+                 genders=None, enabled=True, max_pending=MAX_PENDING):
+        self.directory = directory
+        self.segment_records = segment_records
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.enabled = enabled
+        self.genders = genders or gender_mapping()
+        self.written = 0
+        self.dropped = 0
+        self._queue = deque()
+        self._segment = None
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def open(cls, directory=LOG_DIR, **kwargs):
+        """Log dengan thread flusher yang sudah berjalan (nonaktif jika ELEARNING_PREDICTION_LOG=0)"""
+        log = cls(directory, enabled=prediction_log_enabled(), **kwargs)
+        return log.start() if log.enabled else log
+
+    def log(self, x, model_name, prediction, probability):
+        """Mencatat satu prediksi (x: list float urutan expected_cols, sudah di-encode)"""
+        if not self.enabled:
+            return
+        if len(self._queue) >= self.max_pending:
+            self.dropped += 1
+            return
+        # deque.append atomik; semua konversi dilakukan oleh flusher
+        self._queue.append((time.time(), x, MODEL_IDS.get(model_name, 0), prediction, probability))
+
+    def pending(self):
+        return len(self._queue)
+
+    def _meta(self):
+        return {
+            'format_version': FORMAT_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'record_size': RECORD_DTYPE.itemsize,
+            'fields': RECORD_DTYPE.names,
+            'capacity': self.segment_records,
+            'models': {str(i): name for name, i in MODEL_IDS.items()},
+            'jenis_kelamin': sorted(self.genders, key=self.genders.get),
+        }
+
+    def _next_segment(self):
+        """Membuat segmen baru dengan indeks berikutnya yang belum dipakai
+
+        Beberapa proses dashboard dapat berbagi folder log; jika proses lain
+        lebih dulu membuat indeks yang sama, indeks berikutnya dicoba.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        existing = list_segments(self.directory)
+        index = int(os.path.basename(existing[-1])[8:-5]) + 1 if existing else 1
+        while True:
+            path = os.path.join(self.directory, f'segment_{index:06d}.plog')
+            try:
+                return _Segment(path, self.segment_records, self._meta())
+            except FileExistsError:
+                index += 1
+
+    def flush(self):
+        """Memindahkan semua record di antrean ke segmen; mengembalikan jumlahnya"""
+        with self._flush_lock:
+            # Hanya isi antrean saat ini, agar flush tetap selesai meskipun log() terus dipanggil
+            queue = self._queue
+            rows = [queue.popleft() for _ in range(len(queue))]
+            if not rows:
+                return 0
+
+            start = 0
+            try:
+                records = np.empty(len(rows), dtype=RECORD_DTYPE)
+                timestamps, features, model_ids, predictions, probabilities = zip(*rows)
+                records['timestamp'] = timestamps
+                features = np.array(features, dtype=np.float64)
+                for j, col in enumerate(expected_cols):
+                    records[col] = features[:, j]
+                records['model_id'] = model_ids
+                records['prediksi'] = predictions
+                records['prob_puas'] = probabilities
+
+                while start < len(records):
+                    if self._segment is None or self._segment.full():
+                        if self._segment is not None:
+                            self._segment.close()
+                            self._segment = None
+                        self._segment = self._next_segment()
+                    start += self._segment.append(records[start:])
+            except BaseException:
+                # Record yang belum tertulis sudah keluar dari antrean: dihitung dibuang
+                self.dropped += len(rows) - start
+                self.written += start
+                raise
+            self.written += len(rows)
+            return len(rows)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as e:
+                # Disk penuh/tidak dapat ditulis: record dibuang, UI tetap berjalan
+                print(f"✗ Log prediksi gagal ditulis: {e}", file=sys.stderr)
+            except Exception:
+                # Kesalahan lain juga tidak boleh menghentikan thread flusher
+                print("✗ Log prediksi gagal ditulis:", file=sys.stderr)
+                traceback.print_exc()
+
+    def start(self):
+        """Memulai thread flusher sekali; sisa antrean ditulis saat proses keluar"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='prediction-log', daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        return self
+
+    def close(self):
+        """Menghentikan flusher, menulis sisa antrean, dan menutup segmen aktif"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        with self._flush_lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def stats(self):
+        return {'written': self.written, 'pending': len(self._queue), 'dropped': self.dropped}
+
+
+def read_segment(path):
+    """(metadata, structured array RECORD_DTYPE) satu segmen tanpa menyalin data"""
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} bukan segmen log prediksi yang valid")
+    count, meta_length = struct.unpack_from('<QI', buffer, len(MAGIC))
+    meta = json.loads(buffer[len(MAGIC) + 12:len(MAGIC) + 12 + meta_length])
+    if meta['format_version'] != FORMAT_VERSION or meta['record_size'] != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Versi segmen {path} tidak didukung")
+    # Segmen yang masih ditulis lebih besar dari isinya; file terpangkas tidak pernah lebih kecil
+    count = min(count, (len(buffer) - HEADER_SIZE) // RECORD_DTYPE.itemsize)
+    return meta, np.frombuffer(buffer, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+
+def to_frame(meta, records):
+    """DataFrame dengan kolom expected_cols (jenis_kelamin kembali ke label) untuk analitik/training"""
+    import pandas as pd
+    df = pd.DataFrame({col: records[col] for col in expected_cols})
+    df['jenis_kelamin'] = np.asarray(meta['jenis_kelamin'], dtype=object).take(
+        records['jenis_kelamin'].astype(np.intp))
+    models = {int(i): name for i, name in meta['models'].items()}
+    df.insert(0, 'waktu', pd.to_datetime(records['timestamp'], unit='s'))
+    df['model'] = [models.get(int(i), 'unknown') for i in records['model_id']]
+    df['prediksi'] = records['prediksi'].astype(np.int64)
+    df['prob_puas'] = records['prob_puas']
+    return df
+
+
+def load_log(directory=LOG_DIR):
+    """Seluruh log sebagai satu DataFrame (disalin; untuk ukuran besar baca per segmen)"""
+    import pandas as pd
+    frames = [to_frame(*read_segment(path)) for path in list_segments(directory)]
+    if not frames:
+        return to_frame({'jenis_kelamin': [], 'models': {}}, np.empty(0, dtype=RECORD_DTYPE))
+    return pd.concat(frames, ignore_index=True)
+
+
+def main(argv=None):
+    """Ringkasan log atau ekspor ke CSV/Parquet"""
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else 'show'
+
+    if command == 'show':
+        segments = list_segments()
+        if not segments:
+            print(f"✗ Belum ada segmen di {LOG_DIR}/")
+            return 1
+        total = 0
+        for path in segments:
+            meta, records = read_segment(path)
+            total += len(records)
+            detail = ', '.join(f"{meta['models'].get(str(i), 'unknown')}: {n}"
+                               for i, n in enumerate(np.bincount(records['model_id'])) if n)
+            print(f"  • {os.path.basename(path)}: {len(records)} record ({detail or '-'})")
+        print(f"✓ {total} prediksi dalam {len(segments)} segmen")
+        return 0
+
+    if command == 'export' and len(argv) > 1:
+        df = load_log()
+        if argv[1].endswith('.parquet'):
+            df.to_parquet(argv[1], index=False)
+        else:
+            df.to_csv(argv[1], index=False)
+        print(f"✓ {len(df)} prediksi diekspor ke {argv[1]}")
+        return 0
+
+    print("Penggunaan: python prediction_log.py [show | export file.csv|file.parquet]")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""Layanan HTTP prediksi berbasis asyncio (tanpa Streamlit).
+
+Endpoint:
+    GET  /health   -> status dan model yang dimuat
+    GET  /metrics  -> metrik format Prometheus (isi jika ELEARNING_METRICS=1)
+    POST /predict  -> satu objek input, daftar objek, atau {"model": ..., "instances": [...]}
+
+Request yang datang bersamaan digabung menjadi micro-batch dalam jendela waktu
+tertentu, sehingga model dijalankan sekali per batch, bukan sekali per request.
+
+Contoh:
+    python prediction_service.py --port 8000 --window-ms 2
+    curl -X POST localhost:8000/predict -d '{"usia": 25, "jenis_kelamin": "L", ...}'
+"""
+import argparse
+import asyncio
+import json
+import sys
+import traceback
+import time
+
+import numpy as np
+
+from artifacts import MODEL_FILES, load_artifacts
+from inference_engine import build_engine
+from instrumentation import registry, span
+from prediction_cube import PredictionCube, with_cube
+
+DEFAULT_MODEL = 'logreg_model'
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class BadRequest(Exception):
+    """Input request tidak valid (dikembalikan sebagai HTTP 400)"""
+
+
+def load_engines(use_cube=True):
+    """Memuat engine untuk semua model dari artefak yang sama dengan dashboard"""
+    cube = PredictionCube.load() if use_cube else None
+    engines = {}
+    for model_name in MODEL_FILES.values():
+        engine = build_engine(*load_artifacts(model_name))
+        engines[model_name] = with_cube(engine, model_name, cube)
+    return engines
+
+
+class MicroBatcher:
+    """Mengumpulkan baris dari banyak request lalu menjalankan model sekali per batch"""
+
+    def __init__(self, engine, window=0.002, max_batch=4096):
+        self.engine = engine
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self._pending = []
+        self._pending_rows = 0
+        self._flush_handle = None
+
+    def submit(self, rows):
+        """Menjadwalkan baris mentah (list of list float) dan mengembalikan future hasil"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((rows, future))
+        self._pending_rows += len(rows)
+
+        if self._pending_rows >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending, self._pending_rows = self._pending, [], 0
+        if not pending:
+            return
+
+        X = np.array([row for rows, _ in pending for row in rows], dtype=np.float64)
+        try:
+            with span('service.batch'):
+                prediction, probability = self.engine.predict_with_proba(X)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(X)
+        start = 0
+        for rows, future in pending:
+            end = start + len(rows)
+            if not future.done():
+                future.set_result((prediction[start:end], probability[start:end]))
+            start = end
+
+
+class PredictionService:
+    """Router HTTP minimal di atas asyncio streams"""
+
+    def __init__(self, engines, window=0.002, max_batch=4096):
+        self.engines = engines
+        self.batchers = {name: MicroBatcher(engine, window, max_batch)
+                         for name, engine in engines.items()}
+        self.requests = 0
+
+    def parse_payload(self, payload):
+        """Memisahkan nama model dan daftar input dari body JSON"""
+        single = False
+        model_name = DEFAULT_MODEL
+        if isinstance(payload, dict) and 'instances' in payload:
+            model_name = payload.get('model', DEFAULT_MODEL)
+            instances = payload['instances']
+        elif isinstance(payload, dict):
+            model_name = payload.get('model', DEFAULT_MODEL)
+            instances, single = [payload], True
+        else:
+            instances = payload
+
+        if not isinstance(model_name, str):
+            raise BadRequest(f"Nama model harus berupa string: {model_name!r}")
+        # Nama model boleh berupa nama file atau label di dashboard
+        model_name = MODEL_FILES.get(model_name, model_name)
+        if model_name not in self.batchers:
+            raise BadRequest(f"Model tidak dikenal: {model_name!r}")
+        if not isinstance(instances, list) or not instances:
+            raise BadRequest("Body harus berisi satu objek input atau daftar input")
+        return model_name, instances, single
+
+    async def predict(self, payload):
+        model_name, instances, single = self.parse_payload(payload)
+        engine = self.engines[model_name]
+        try:
+            rows = [engine.encode(instance) for instance in instances]
+        except (KeyError, TypeError, ValueError) as e:
+            raise BadRequest(f"Input tidak valid: {e}")
+        if not np.isfinite(rows).all():
+            raise BadRequest("Input tidak valid: nilai fitur harus berhingga (bukan NaN/Infinity)")
+
+        prediction, probability = await self.batchers[model_name].submit(rows)
+        results = [
+            {'prediksi': int(p), 'prob_tidak_puas': float(prob[0]), 'prob_puas': float(prob[1])}
+            for p, prob in zip(prediction, probability)
+        ]
+        if single:
+            return {'model': model_name, **results[0]}
+        return {'model': model_name, 'predictions': results}
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'models': sorted(self.engines),
+            'requests': self.requests,
+            'batches': {name: b.batches for name, b in self.batchers.items()},
+            'rows': {name: b.rows for name, b in self.batchers.items()},
+        }
+
+    async def handle(self, method, path, body):
+        """Mengembalikan (status, objek JSON) untuk satu request"""
+        if path == '/health':
+            return 200, self.health()
+        if path == '/metrics':
+            return 200, registry.to_prometheus()
+        if path != '/predict':
+            return 404, {'error': f"Path tidak ditemukan: {path}"}
+        if method != 'POST':
+            return 405, {'error': "Gunakan POST untuk /predict"}
+        try:
+            payload = json.loads(body or b'null')
+            return 200, await self.predict(payload)
+        except json.JSONDecodeError as e:
+            return 400, {'error': f"JSON tidak valid: {e}"}
+        except BadRequest as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            return 500, {'error': f"Kesalahan internal: {type(e).__name__}"}
+
+    async def serve_connection(self, reader, writer):
+        """Melayani satu koneksi HTTP/1.1 (mendukung keep-alive)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.respond(writer, 400, {'error': "Content-Length tidak valid"},
+                                       keep_alive=False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {'error': "Body terlalu besar"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.requests += 1
+                with span('service.request'):
+                    status, result = await self.handle(method.upper(), target.split('?')[0], body)
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                await self.respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer, status, result, keep_alive=True):
+        if isinstance(result, str):
+            body, content_type = result.encode(), 'text/plain; version=0.0.4'
+        else:
+            body, content_type = json.dumps(result).encode(), 'application/json'
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def run_server(host, port, window, max_batch, use_cube=True):
+    start = time.perf_counter()
+    service = PredictionService(load_engines(use_cube), window, max_batch)
+    server = await asyncio.start_server(service.serve_connection, host, port)
+    print(f"✓ Model dimuat dalam {(time.perf_counter() - start) * 1000:.0f} ms: "
+          f"{', '.join(sorted(service.engines))}")
+    print(f"✓ Layanan prediksi berjalan di http://{host}:{port} "
+          f"(jendela batch {window * 1000:g} ms, maks {max_batch} baris)")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP prediksi kepuasan e-learning")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=2.0,
+                        help="Jendela waktu pengumpulan micro-batch (milidetik)")
+    parser.add_argument('--max-batch', type=int, default=4096,
+                        help="Jumlah baris maksimum per micro-batch")
+    parser.add_argument('--no-cube', action='store_true',
+                        help="Abaikan prediction cube, selalu gunakan inferensi langsung")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(run_server(args.host, args.port, args.window_ms / 1000.0,
+                               args.max_batch, use_cube=not args.no_cube))
+    except FileNotFoundError as e:
+        print(f"✗ Error: {e.filename} tidak ditemukan. Jalankan train_model.py terlebih dahulu.")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -61,6 +61,7 @@ case $choice in
         echo "Training models..."
         python3 train_model.py
         echo "✓ Models trained!"
+        python3 prediction_cube.py
         ;;
     4)
         echo ""
@@ -93,6 +94,7 @@ case $choice in
         echo "Step 3: Training models..."
         python3 train_model.py
         echo "✓ Models trained!"
+        python3 prediction_cube.py
         echo ""
         
         echo "Step 4: Starting dashboard..."
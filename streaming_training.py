@@ -0,0 +1,328 @@
+"""Mode training streaming (out-of-core) untuk train_model.py.
+
+Dataset dibaca per chunk sehingga memori puncak tidak bertambah seiring ukuran
+file. Median imputasi dihitung dengan quantile sketch berukuran tetap, scaler
+dengan partial_fit, dan model linear dengan SGDClassifier(loss='log_loss') yang
+dilatih bertahap. Decision tree dilatih pada reservoir sample berukuran tetap.
+Deduplikasi (set hash) hanya berjalan pada pass pertama; pass berikutnya memakai
+KeepMask berisi 1 bit per baris sumber.
+Artefak yang dihasilkan memakai nama file dan format yang sama dengan mode biasa.
+"""
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from artifacts import (ID_COLUMN, LABEL_ENCODER_FILE, SCALER_FILE, TARGET, expected_cols,
+                       numeric_cols)
+from data_cleaning import DataCleaner, as_numeric, print_report
+from drift_monitor import (REFERENCE_FILE, TOTAL_BINS, class_histogram, histogram,
+                           write_reference_counts)
+from instrumentation import peak_rss_mb, span
+from model_bundle import BUNDLE_FILE, HOLDOUT_ROWS, file_sha256, write_bundle
+from training_stages import CATEGORY_DTYPES, downcast
+
+# Setiap baris ke-5 (berdasarkan nomor baris) dipakai sebagai data test
+TEST_EVERY = 5
+
+
+class QuantileSketch:
+    """Sketch kuantil berukuran tetap berbasis pasangan (nilai, jumlah)
+
+    Selama jumlah nilai unik tidak melebihi max_bins hasilnya eksak (termasuk
+    median genap seperti pandas). Jika melebihi, centroid bertetangga digabung
+    sehingga memori tetap O(max_bins).
+    """
+
+    def __init__(self, max_bins=2048):
+        self.max_bins = max_bins
+        self.values = np.empty(0, dtype=np.float64)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def update(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        if x.size == 0:
+            return
+        values, counts = np.unique(x, return_counts=True)
+        values = np.concatenate([self.values, values])
+        counts = np.concatenate([self.counts, counts])
+        order = np.argsort(values, kind='mergesort')
+        values, counts = values[order], counts[order]
+
+        # Gabungkan nilai yang sama
+        unique, inverse = np.unique(values, return_inverse=True)
+        self.values = unique
+        self.counts = np.bincount(inverse, weights=counts).astype(np.int64)
+
+        while self.values.size > self.max_bins:
+            self._compress()
+
+    def _compress(self):
+        """Menggabungkan pasangan centroid bertetangga (rata-rata berbobot)"""
+        n = self.values.size - self.values.size % 2
+        weights = self.counts[:n].reshape(-1, 2)
+        merged_counts = weights.sum(axis=1)
+        merged_values = (self.values[:n].reshape(-1, 2) * weights).sum(axis=1) / merged_counts
+        self.values = np.concatenate([merged_values, self.values[n:]])
+        self.counts = np.concatenate([merged_counts, self.counts[n:]])
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def _value_at_rank(self, rank):
+        return self.values[np.searchsorted(np.cumsum(self.counts), rank, side='right')]
+
+    def quantile(self, q):
+        """Kuantil dengan interpolasi linear antar rank (setara pandas untuk data eksak)"""
+        if self.count == 0:
+            return float('nan')
+        position = q * (self.count - 1)
+        lower, upper = int(np.floor(position)), int(np.ceil(position))
+        low_value, high_value = self._value_at_rank(lower), self._value_at_rank(upper)
+        return float(low_value + (high_value - low_value) * (position - lower))
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+class Reservoir:
+    """Reservoir sample berukuran tetap (algoritma R, diproses per chunk)"""
+
+    def __init__(self, size, n_features, random_state=42):
+        self.size = size
+        self.X = np.empty((size, n_features), dtype=np.float64)
+        self.y = np.empty(size, dtype=np.int64)
+        self.seen = 0
+        self.rng = np.random.default_rng(random_state)
+
+    def update(self, X, y):
+        n = len(X)
+        index = self.seen + np.arange(n)
+        slots = np.where(index < self.size, index, self.rng.integers(0, index + 1))
+        keep = slots < self.size
+        self.X[slots[keep]] = X[keep]
+        self.y[slots[keep]] = y[keep]
+        self.seen += n
+
+    def sample(self):
+        n = min(self.seen, self.size)
+        return self.X[:n], self.y[:n]
+
+
+def iter_frames(path, chunksize):
+    """Chunk DataFrame dari CSV atau Parquet (per batch, tanpa memuat seluruh file)"""
+    if path.endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        # Kolom numerik tidak dipaksa float32 agar sel bukan angka sampai ke validasi;
+        # tipe ringkas diterapkan per chunk oleh downcast
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=CATEGORY_DTYPES)
+
+
+class KeepMask:
+    """Keputusan pembersihan per baris sumber, 1 bit per baris (np.packbits)
+
+    Diisi sekali pada pass 1; pass berikutnya memakai ulang mask ini sehingga
+    set hash deduplikasi tidak dibangun ulang di setiap pass. Ukurannya sekitar
+    125 KB per 1 juta baris sumber.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def append(self, keep):
+        self.chunks.append((len(keep), np.packbits(keep)))
+
+    def get(self, index):
+        n, bits = self.chunks[index]
+        return np.unpackbits(bits, count=n).astype(bool)
+
+    @property
+    def nbytes(self):
+        return sum(bits.nbytes for _, bits in self.chunks)
+
+
+def read_chunks(path, chunksize, mask, cleaner=None):
+    """Membaca dataset per chunk yang sudah dibersihkan (tipe ringkas) beserta mask test
+
+    Split train/test memakai nomor baris di file sumber, jadi tidak bergeser
+    oleh baris yang ditolak. Jika cleaner diberikan (pass 1), setiap chunk
+    dibersihkan dan baris yang dipertahankan dicatat di mask; pass berikutnya
+    hanya menerapkan mask tersebut tanpa validasi dan hashing ulang.
+    """
+    start = 0
+    for index, chunk in enumerate(iter_frames(path, chunksize)):
+        is_test = np.arange(start, start + len(chunk)) % TEST_EVERY == 0
+        start += len(chunk)
+        if cleaner is not None:
+            clean, _ = cleaner.clean(chunk)
+            keep = np.zeros(len(chunk), dtype=bool)
+            keep[chunk.index.get_indexer(clean.index)] = True
+            mask.append(keep)
+        else:
+            keep = mask.get(index)
+            clean = as_numeric(chunk.drop(columns=[ID_COLUMN], errors='ignore'))
+            if not keep.all():
+                clean = clean[keep]
+        yield downcast(clean), is_test[keep]
+
+
+def train_streaming(data_path, chunksize=100_000, epochs=5, reservoir_size=200_000):
+    """Melatih model dan menyimpan artefak tanpa memuat seluruh dataset ke memori"""
+    start_time = time.perf_counter()
+    print("=" * 60)
+    print("TRAINING MODEL PREDIKSI KEPUASAN E-LEARNING (STREAMING)")
+    print("=" * 60)
+
+    # 1. Statistik dan median (pass 1)
+    print(f"\n1. Pass 1: statistik dataset (chunk {chunksize} baris)...")
+    sketches = {col: QuantileSketch() for col in numeric_cols}
+    missing = dict.fromkeys(numeric_cols, 0)
+    genders = set()
+    n_rows = n_test = n_positive = 0
+    cleaner = DataCleaner()
+    mask = KeepMask()
+    with span('train_streaming.pass1'):
+        for chunk, is_test in read_chunks(data_path, chunksize, mask, cleaner):
+            n_rows += len(chunk)
+            n_test += int(is_test.sum())
+            n_positive += int((chunk[TARGET] == 1).sum())
+            genders.update(chunk['jenis_kelamin'].dropna().unique())
+            for col in numeric_cols:
+                missing[col] += int(chunk[col].isnull().sum())
+                sketches[col].update(chunk[col].to_numpy())
+
+    print_report(cleaner.report())
+    print(f"   ✓ Keep mask untuk pass berikutnya: {mask.nbytes / 1024:.1f} KB")
+    # Set hash tidak diperlukan lagi; pass berikutnya cukup memakai mask
+    del cleaner
+    print(f"   ✓ Dataset: {n_rows} rows")
+    medians = {col: sketches[col].median() for col in numeric_cols}
+    for col in numeric_cols:
+        if missing[col] > 0:
+            print(f"   ✓ Missing values di '{col}': {missing[col]} "
+                  f"({missing[col]/n_rows*100:.1f}%) -> median sketch: {medians[col]:.2f}")
+    print(f"   ✓ Distribusi target: Puas {n_positive/n_rows*100:.1f}%, "
+          f"Tidak Puas {(n_rows-n_positive)/n_rows*100:.1f}%")
+
+    label_encoder = LabelEncoder().fit(sorted(genders))
+    gender_codes = {label: code for code, label in enumerate(label_encoder.classes_)}
+    print(f"   ✓ Jenis kelamin encoded: {gender_codes}")
+
+    def prepare(chunk):
+        """Imputasi median dan encoding untuk satu chunk"""
+        chunk = chunk.fillna(medians)
+        X = chunk[expected_cols].copy()
+        X['jenis_kelamin'] = X['jenis_kelamin'].map(gender_codes).astype(np.int8)
+        return X, chunk[TARGET].to_numpy()
+
+    # 2. Scaler partial_fit + reservoir untuk decision tree (pass 2)
+    print("\n2. Pass 2: fitting scaler (partial_fit)...")
+    scaler = StandardScaler()
+    reservoir = Reservoir(reservoir_size, len(expected_cols))
+    # Histogram referensi drift dari fitur setelah imputasi (seperti mode biasa)
+    feature_counts = np.zeros(TOTAL_BINS, dtype=np.int64)
+    with span('train_streaming.pass2_scale'):
+        for chunk, is_test in read_chunks(data_path, chunksize, mask):
+            X, y = prepare(chunk)
+            feature_counts += histogram(X.to_numpy(dtype=np.float64))
+            # Chunk tanpa baris training (hanya baris test, atau semua duplikat) dilewati
+            train = ~is_test
+            if not train.any():
+                continue
+            scaler.partial_fit(X[train])
+            reservoir.update(X.to_numpy()[train], y[train])
+    print(f"   ✓ Training set: {n_rows - n_test} samples, testing set: {n_test} samples")
+    print(f"   ✓ Scaler mean: {np.round(scaler.mean_, 3).tolist()}")
+    # Median imputasi ikut disimpan agar prediksi batch mengisi nilai kosong dengan nilai yang sama
+    scaler.medians_ = {col: float(value) for col, value in medians.items()}
+
+    # 3. SGD logistic regression (pass 3 dst.)
+    print(f"\n3. Training logistic regression (SGD, {epochs} epoch)...")
+    logreg = SGDClassifier(loss='log_loss', random_state=42)
+    classes = np.array([0, 1])
+    with span('train_streaming.fit_sgd'):
+        for epoch in range(epochs):
+            for chunk, is_test in read_chunks(data_path, chunksize, mask):
+                train = ~is_test
+                if not train.any():
+                    continue
+                X, y = prepare(chunk[train])
+                logreg.partial_fit(scaler.transform(X), y, classes=classes)
+            print(f"   ✓ Epoch {epoch + 1}/{epochs} selesai")
+
+    # 4. Decision tree pada reservoir sample
+    print(f"\n4. Training decision tree (reservoir {min(reservoir.seen, reservoir_size)} baris)...")
+    X_sample, y_sample = reservoir.sample()
+    with span('train_streaming.fit_dt'):
+        dt = DecisionTreeClassifier(max_depth=5, min_samples_leaf=10, random_state=42)
+        dt.fit(scaler.transform(pd.DataFrame(X_sample, columns=expected_cols)), y_sample)
+    print("   ✓ Model trained")
+
+    # 5. Evaluasi streaming pada data test
+    print("\n5. Evaluating on test rows...")
+    correct_logreg = correct_dt = 0
+    prediction_counts = {'logreg_model': np.zeros(2, dtype=np.int64),
+                         'dt_model': np.zeros(2, dtype=np.int64)}
+    # Sampel test terbatas untuk validasi hot-reload, sama seperti mode biasa
+    holdout_X, holdout_y, holdout_rows = [], [], 0
+    with span('train_streaming.evaluate'):
+        for chunk, is_test in read_chunks(data_path, chunksize, mask):
+            if not is_test.any():
+                continue
+            X, y = prepare(chunk[is_test])
+            X_scaled = scaler.transform(X)
+            pred_logreg, pred_dt = logreg.predict(X_scaled), dt.predict(X_scaled)
+            correct_logreg += int((pred_logreg == y).sum())
+            correct_dt += int((pred_dt == y).sum())
+            prediction_counts['logreg_model'] += class_histogram(pred_logreg)
+            prediction_counts['dt_model'] += class_histogram(pred_dt)
+            if holdout_rows < HOLDOUT_ROWS:
+                take = HOLDOUT_ROWS - holdout_rows
+                holdout_X.append(X.to_numpy(dtype=np.float64)[:take])
+                holdout_y.append(y[:take])
+                holdout_rows += len(holdout_y[-1])
+    acc_logreg = correct_logreg / n_test if n_test else float('nan')
+    acc_dt = correct_dt / n_test if n_test else float('nan')
+    print(f"   ✓ Logistic Regression (SGD) - Accuracy: {acc_logreg*100:.2f}%")
+    print(f"   ✓ Decision Tree             - Accuracy: {acc_dt*100:.2f}%")
+
+    # 6. Simpan artefak dengan nama yang sama seperti mode biasa
+    print("\n6. Saving models...")
+    with span('train_streaming.save'):
+        for path, obj in [('logreg_model.pkl', logreg), ('dt_model.pkl', dt),
+                          (SCALER_FILE, scaler), (LABEL_ENCODER_FILE, label_encoder)]:
+            with open(path, 'wb') as file:
+                pickle.dump(obj, file)
+            print(f"   ✓ {path} saved")
+
+        write_bundle(BUNDLE_FILE, scaler, label_encoder, logreg, dt,
+                     data_hash=file_sha256(data_path),
+                     metrics={'logreg_accuracy': acc_logreg, 'dt_accuracy': acc_dt,
+                              'train_samples': n_rows - n_test, 'test_samples': n_test},
+                     holdout=(np.concatenate(holdout_X), np.concatenate(holdout_y))
+                     if holdout_X else None)
+    print(f"   ✓ {BUNDLE_FILE} saved")
+
+    # Referensi drift: fitur semua baris, prediksi dari baris test
+    write_reference_counts(REFERENCE_FILE, feature_counts, prediction_counts, n_rows)
+    print(f"   ✓ {REFERENCE_FILE} saved")
+
+    print("\n" + "=" * 60)
+    print("TRAINING SUMMARY (STREAMING)")
+    print("=" * 60)
+    print(f"Dataset: {n_rows} samples, chunk {chunksize} baris")
+    print(f"Waktu total: {time.perf_counter() - start_time:.1f} detik")
+    print(f"Memori puncak (RSS): {peak_rss_mb():.0f} MB")
+    print("✓ Jalankan dashboard dengan: streamlit run app.py")
+    print("=" * 60)
+
+    return {'rows': n_rows, 'acc_logreg': acc_logreg, 'acc_dt': acc_dt}
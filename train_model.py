@@ -1,14 +1,61 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import pickle
+import argparse
+import sys
+import time
+from data_cleaning import print_report
+from drift_monitor import REFERENCE_FILE, write_reference
+from instrumentation import observe, peak_rss_mb, registry, span
+from model_bundle import BUNDLE_FILE, file_sha256, write_bundle
+from training_stages import (DEFAULT_DT_PARAMS, DEFAULT_LOGREG_PARAMS, clean_dataset,
+                             encode_categorical, fit_decision_tree, fit_logreg, impute_missing,
+                             load_dataset, scale_features, split_features, split_train_test)
 import warnings
 warnings.filterwarnings('ignore')
 
+parser = argparse.ArgumentParser(description="Training model prediksi kepuasan e-learning")
+parser.add_argument('--data', default='dataset_kepuasan_pengguna_elearning.csv',
+                    help="Path file dataset (.csv, .parquet, atau .feather/.arrow)")
+parser.add_argument('--streaming', action='store_true',
+                    help="Training out-of-core per chunk untuk dataset yang tidak muat di memori")
+parser.add_argument('--chunksize', type=int, default=100_000,
+                    help="Jumlah baris per chunk (mode streaming)")
+parser.add_argument('--epochs', type=int, default=5,
+                    help="Jumlah epoch SGD (mode streaming)")
+parser.add_argument('--tune', action='store_true',
+                    help="Cari hyperparameter terbaik dengan stratified k-fold CV (paralel)")
+parser.add_argument('--tune-grid', default=None,
+                    help="File JSON berisi grid parameter (default: grid bawaan)")
+parser.add_argument('--cv', type=int, default=5,
+                    help="Jumlah fold untuk tuning")
+parser.add_argument('--n-jobs', type=int, default=None,
+                    help="Jumlah proses worker untuk tuning (default: semua core)")
+parser.add_argument('--skip-serial', action='store_true',
+                    help="Lewati pengukuran serial saat tuning (tanpa laporan speedup)")
+parser.add_argument('--metrics', action='store_true',
+                    help="Catat durasi dan memori setiap tahap ke folder metrics/ "
+                         "(juga aktif jika ELEARNING_METRICS=1)")
+args = parser.parse_args()
+
+if args.metrics:
+    registry.enable()
+
+if args.streaming:
+    from streaming_training import train_streaming
+    try:
+        with span('train.total'):
+            train_streaming(args.data, chunksize=args.chunksize, epochs=args.epochs)
+    except FileNotFoundError:
+        print(f"   ✗ Error: File {args.data} tidak ditemukan!")
+        sys.exit(1)
+    if registry.enabled:
+        print(f"✓ Metrik disimpan: {', '.join(registry.export('train_streaming'))}")
+    sys.exit(0)
+
+train_start = time.perf_counter()
+
 print("="*60)
 print("TRAINING MODEL PREDIKSI KEPUASAN E-LEARNING")
 print("="*60)
@@ -16,20 +63,23 @@ print("="*60)
 # 1. Load Dataset
 print("\n1. Loading dataset...")
 try:
-    df = pd.read_csv('dataset_kepuasan_pengguna_elearning.csv')
-    print(f"   ✓ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+    with span('train.load'):
+        df = load_dataset(args.data)
+    print(f"   ✓ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns "
+          f"({df.memory_usage(deep=True).sum() / 1024 ** 2:.2f} MB di memori)")
 except FileNotFoundError:
-    print("   ✗ Error: File dataset_kepuasan_pengguna_elearning.csv tidak ditemukan!")
+    print(f"   ✗ Error: File {args.data} tidak ditemukan!")
     print("   Silakan letakkan file dataset di direktori yang sama dengan script ini.")
     exit(1)
 
 # 2. Data Preprocessing
 print("\n2. Data Preprocessing...")
 
-# Hapus kolom ID
-if 'id_responden' in df.columns:
-    df = df.drop(columns=['id_responden'])
-    print("   ✓ Kolom 'id_responden' dihapus")
+# Validasi rentang, buang kolom ID, dan hapus duplikasi (sebelum imputasi,
+# sehingga median dihitung dari data yang sudah bersih)
+with span('train.clean'):
+    df, cleaning = clean_dataset(df)
+print_report(cleaning)
 
 # Cek missing values
 print(f"   - Missing values sebelum handling:")
@@ -38,37 +88,24 @@ for col in missing_before[missing_before > 0].index:
     print(f"     • {col}: {missing_before[col]} ({missing_before[col]/len(df)*100:.1f}%)")
 
 # Handle missing values dengan median untuk kolom numerik
-numeric_cols = ['durasi_penggunaan', 'kualitas_materi', 'stabilitas_aplikasi']
-for col in numeric_cols:
-    if df[col].isnull().sum() > 0:
-        median_val = df[col].median()
-        df[col].fillna(median_val, inplace=True)
+with span('train.impute'):
+    df, medians = impute_missing(df)
+for col, median_val in medians.items():
+    if missing_before[col] > 0:
         print(f"   ✓ Missing values di '{col}' diisi dengan median: {median_val:.2f}")
 
-# Hapus duplikasi
-duplicates = df.duplicated().sum()
-if duplicates > 0:
-    df = df.drop_duplicates()
-    print(f"   ✓ {duplicates} baris duplikat dihapus")
-
 print(f"   ✓ Dataset final: {df.shape[0]} rows, {df.shape[1]} columns")
 
 # 3. Encode Categorical Variables
 print("\n3. Encoding categorical variables...")
-label_encoder = LabelEncoder()
-df['jenis_kelamin'] = label_encoder.fit_transform(df['jenis_kelamin'])
+with span('train.encode'):
+    df, label_encoder = encode_categorical(df)
 print(f"   ✓ Jenis kelamin encoded: {dict(zip(label_encoder.classes_, label_encoder.transform(label_encoder.classes_)))}")
 
 # 4. Split Features and Target
 print("\n4. Splitting features and target...")
-X = df.drop(columns=['kepuasan_pengguna'])
-y = df['kepuasan_pengguna']
-
-# Pastikan urutan kolom konsisten
-expected_cols = ['usia', 'jenis_kelamin', 'durasi_penggunaan', 'frekuensi_login', 
-                 'kualitas_materi', 'kemudahan_penggunaan', 'stabilitas_aplikasi', 
-                 'interaksi_pengajar']
-X = X[expected_cols]
+# Urutan kolom konsisten dengan expected_cols
+X, y = split_features(df)
 
 print(f"   ✓ Features (X): {X.shape}")
 print(f"   ✓ Target (y): {y.shape}")
@@ -79,19 +116,43 @@ print(f"     • Puas (1): {(y==1).sum()} ({(y==1).sum()/len(y)*100:.1f}%)")
 
 # 5. Train-Test Split
 print("\n5. Splitting train-test data...")
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42, stratify=y
-)
+with span('train.split'):
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
 print(f"   ✓ Training set: {X_train.shape[0]} samples")
 print(f"   ✓ Testing set: {X_test.shape[0]} samples")
 
 # 6. Feature Scaling
 print("\n6. Feature scaling...")
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+with span('train.scale'):
+    scaler, X_train_scaled, X_test_scaled = scale_features(X_train, X_test)
+# Median imputasi ikut disimpan agar prediksi batch mengisi nilai kosong dengan nilai yang sama
+scaler.medians_ = medians
 print("   ✓ Features scaled menggunakan StandardScaler")
 
+# Parameter model (diganti hasil tuning jika --tune)
+logreg_params = DEFAULT_LOGREG_PARAMS
+dt_params = DEFAULT_DT_PARAMS
+
+if args.tune:
+    from model_tuning import BASE_PARAMS, load_grid, tune_models
+    print(f"\n6b. Hyperparameter tuning ({args.cv}-fold stratified CV)...")
+    with span('train.tune'):
+        tuning = tune_models(X_train, y_train, grid=load_grid(args.tune_grid), n_splits=args.cv,
+                             n_jobs=args.n_jobs, compare_serial=not args.skip_serial)
+    timing = tuning['timing']
+    print(f"   ✓ {timing['candidates']} kandidat x {timing['folds']} fold, "
+          f"{timing['n_jobs']} worker")
+    print(f"   ✓ Fold preprocessing (sekali): {timing['fold_seconds']:.2f} detik")
+    print(f"   ✓ Waktu paralel: {timing['parallel_seconds']:.2f} detik")
+    if timing['serial_seconds'] is not None:
+        print(f"   ✓ Waktu serial : {timing['serial_seconds']:.2f} detik "
+              f"(speedup {timing['speedup']:.1f}x)")
+    for kind, label in [('logreg', 'Logistic Regression'), ('dt', 'Decision Tree')]:
+        _, params, mean, std = tuning['best'][kind]
+        print(f"   ✓ {label}: {params} -> CV accuracy {mean*100:.2f}% (±{std*100:.2f})")
+    logreg_params = {**BASE_PARAMS['logreg'], **tuning['logreg']}
+    dt_params = {**BASE_PARAMS['dt'], **tuning['dt']}
+
 # 7. Training Models
 print("\n7. Training models...")
 print("   " + "="*55)
@@ -99,8 +160,8 @@ print("   " + "="*55)
 # 7a. Logistic Regression
 print("   A. LOGISTIC REGRESSION")
 print("   " + "-"*55)
-logreg = LogisticRegression(max_iter=1000, random_state=42)
-logreg.fit(X_train_scaled, y_train)
+with span('train.fit_logreg'):
+    logreg = fit_logreg(X_train_scaled, y_train, logreg_params)
 
 y_pred_logreg = logreg.predict(X_test_scaled)
 y_prob_logreg = logreg.predict_proba(X_test_scaled)
@@ -120,12 +181,8 @@ print(f"     • F1-Score (Puas): {report_logreg['Puas']['f1-score']:.3f}")
 # 7b. Decision Tree
 print("\n   B. DECISION TREE")
 print("   " + "-"*55)
-dt = DecisionTreeClassifier(
-    max_depth=5,
-    min_samples_leaf=10,
-    random_state=42
-)
-dt.fit(X_train_scaled, y_train)
+with span('train.fit_dt'):
+    dt = fit_decision_tree(X_train_scaled, y_train, dt_params)
 
 y_pred_dt = dt.predict(X_test_scaled)
 y_prob_dt = dt.predict_proba(X_test_scaled)
@@ -172,6 +229,7 @@ for idx, row in feature_importance.iterrows():
 
 # 10. Save Models
 print("\n10. Saving models...")
+save_start = time.perf_counter()
 try:
     # Save models
     with open('logreg_model.pkl', 'wb') as file:
@@ -191,10 +249,27 @@ try:
         pickle.dump(label_encoder, file)
     print("   ✓ label_encoder.pkl saved")
     
+    # Bundle tunggal (dibaca dashboard tanpa sklearn)
+    write_bundle(BUNDLE_FILE, scaler, label_encoder, logreg, dt,
+                 data_hash=file_sha256(args.data),
+                 metrics={'logreg_accuracy': acc_logreg, 'dt_accuracy': acc_dt,
+                          'train_samples': int(X_train.shape[0]),
+                          'test_samples': int(X_test.shape[0])},
+                 holdout=(X_test.to_numpy(), y_test.to_numpy()))
+    print(f"   ✓ {BUNDLE_FILE} saved")
+    
+    # Histogram referensi untuk pemantauan drift (fitur training + prediksi model)
+    X_scaled = scaler.transform(X)
+    write_reference(REFERENCE_FILE, X.to_numpy(),
+                    {'logreg_model': logreg.predict(X_scaled), 'dt_model': dt.predict(X_scaled)})
+    print(f"   ✓ {REFERENCE_FILE} saved")
+    
     print("\n   ✓ Semua model dan preprocessor berhasil disimpan!")
     
 except Exception as e:
     print(f"\n   ✗ Error saat menyimpan model: {str(e)}")
+observe('train.save', time.perf_counter() - save_start)
+observe('train.total', time.perf_counter() - train_start)
 
 # Summary
 print("\n" + "="*60)
@@ -211,6 +286,10 @@ if acc_logreg > acc_dt:
 else:
     print(f"\n✓ Decision Tree memiliki performa terbaik!")
 
+if registry.enabled:
+    print(f"\nMemori puncak (RSS): {peak_rss_mb():.0f} MB")
+    print(f"✓ Metrik disimpan: {', '.join(registry.export('train'))}")
+
 print("\n✓ Model siap digunakan untuk deployment!")
 print("✓ Jalankan dashboard dengan: streamlit run app.py")
 print("="*60)
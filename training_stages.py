@@ -0,0 +1,147 @@
+"""Tahapan training bernomor dari train_model.py sebagai fungsi terpisah.
+
+train_model.py memanggil fungsi-fungsi ini secara berurutan dan mencetak
+progres; benchmark memanggilnya langsung untuk mengukur setiap tahap.
+"""
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from artifacts import ID_COLUMN, TARGET, expected_cols, numeric_cols
+
+CATEGORICAL_COLS = ['jenis_kelamin']
+
+# Tipe yang dibaca langsung dari CSV (sisanya diturunkan oleh downcast)
+CATEGORY_DTYPES = dict.fromkeys(CATEGORICAL_COLS, 'category')
+CSV_DTYPES = {**dict.fromkeys(numeric_cols, 'float32'), **CATEGORY_DTYPES}
+
+DEFAULT_LOGREG_PARAMS = {'max_iter': 1000, 'random_state': 42}
+DEFAULT_DT_PARAMS = {'max_depth': 5, 'min_samples_leaf': 10, 'random_state': 42}
+
+
+def read_table(path, exclude=()):
+    """Membaca CSV, Parquet, atau Feather/Arrow (berdasarkan ekstensi file)
+
+    Kolom di exclude tidak pernah dimuat ke memori (kecuali Feather, yang
+    dibaca utuh lalu kolomnya dibuang).
+    """
+    if path.endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        columns = [col for col in pq.read_schema(path).names if col not in exclude]
+        return pd.read_parquet(path, columns=columns)
+    if path.endswith(('.feather', '.arrow')):
+        return pd.read_feather(path).drop(columns=list(exclude), errors='ignore')
+    try:
+        return pd.read_csv(path, dtype=CSV_DTYPES, usecols=lambda col: col not in exclude)
+    except ValueError:
+        # Ada sel bukan angka di kolom numerik: dibaca apa adanya, lalu ditolak
+        # beserta alasannya oleh tahap pembersihan
+        return pd.read_csv(path, dtype=CATEGORY_DTYPES, usecols=lambda col: col not in exclude)
+
+
+def downcast(df):
+    """Tipe kolom ringkas: bilangan bulat -> int8 (atau int terkecil yang muat),
+    float64 -> float32, jenis kelamin -> category (satu kali astype)"""
+    dtypes = {}
+    for col in df.columns:
+        values = df[col]
+        if col in CATEGORICAL_COLS:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                dtypes[col] = 'category'
+        elif values.dtype.kind in 'iu' and values.dtype.itemsize > 1 and len(values):
+            low, high = values.min(), values.max()
+            for dtype in (np.int8, np.int16, np.int32):
+                if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                    dtypes[col] = dtype
+                    break
+        elif values.dtype == np.float64:
+            dtypes[col] = np.float32
+    return df.astype(dtypes) if dtypes else df
+
+
+def load_dataset(path, compact=True):
+    """1. Membaca dataset (CSV/Parquet/Arrow)
+
+    Dengan compact=True kolom id tidak dimuat dan tipe kolom diturunkan;
+    compact=False adalah pembacaan CSV apa adanya (float64/int64/object).
+    """
+    if not compact:
+        return pd.read_csv(path)
+    return downcast(read_table(path, exclude=(ID_COLUMN,)))
+
+
+def clean_dataset(df):
+    """2a. Validasi rentang dan deduplikasi berbasis hash (DataCleaner); mengembalikan (df, report)
+
+    Kolom id dibuang; baris yang tidak valid dan duplikat tidak ikut diproses.
+    Berjalan sebelum imputasi (versi awal: imputasi lalu drop_duplicates), jadi
+    duplikat dibandingkan dengan nilai kosong apa adanya.
+    """
+    from data_cleaning import DataCleaner
+    cleaner = DataCleaner()
+    df, _ = cleaner.clean(df)
+    return df, cleaner.report()
+
+
+def impute_missing(df):
+    """2b. Mengisi missing value kolom numerik dengan median data bersih; mengembalikan (df, median)
+
+    Median semua kolom numerik dikembalikan (juga yang tidak kosong) karena
+    disimpan bersama scaler untuk mengisi nilai kosong saat prediksi batch.
+    """
+    medians = {}
+    for col in numeric_cols:
+        medians[col] = float(df[col].median())
+        if df[col].isnull().any():
+            df[col] = df[col].fillna(medians[col])
+    return df, medians
+
+
+def encode_categorical(df):
+    """3. Label encoding jenis kelamin; mengembalikan (df, label_encoder)"""
+    values = df['jenis_kelamin']
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        label_encoder = LabelEncoder()
+        df['jenis_kelamin'] = label_encoder.fit_transform(values)
+        return df, label_encoder
+
+    # Kolom category: encoder di-fit pada kategori, nilai diambil dari kode (tanpa np.unique per baris)
+    values = values.cat.remove_unused_categories()
+    codes = values.cat.codes.to_numpy()
+    if (codes < 0).any():
+        raise ValueError("Kolom 'jenis_kelamin' berisi missing value")
+    label_encoder = LabelEncoder().fit(values.cat.categories.to_numpy())
+    mapping = label_encoder.transform(values.cat.categories.to_numpy()).astype(np.int8)
+    df['jenis_kelamin'] = mapping[codes]
+    return df, label_encoder
+
+
+def split_features(df):
+    """4. Memisahkan fitur (urutan expected_cols) dan target"""
+    return df[expected_cols], df[TARGET]
+
+
+def split_train_test(X, y, test_size=0.2, random_state=42):
+    """5. Train-test split stratified"""
+    return train_test_split(X, y, test_size=test_size, random_state=random_state, stratify=y)
+
+
+def scale_features(X_train, X_test):
+    """6. StandardScaler di-fit pada data train"""
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    return scaler, X_train_scaled, X_test_scaled
+
+
+def fit_logreg(X_train_scaled, y_train, params=None):
+    """7a. Training Logistic Regression"""
+    return LogisticRegression(**(params or DEFAULT_LOGREG_PARAMS)).fit(X_train_scaled, y_train)
+
+
+def fit_decision_tree(X_train_scaled, y_train, params=None):
+    """7b. Training Decision Tree"""
+    return DecisionTreeClassifier(**(params or DEFAULT_DT_PARAMS)).fit(X_train_scaled, y_train)
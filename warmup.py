@@ -0,0 +1,61 @@
+"""Pemanasan proses dashboard di thread latar belakang.
+
+Modul engine inferensi dan artefak model dimuat sementara sisa halaman dirender
+dan pengguna masih melihat Beranda, sehingga klik Prediksi pertama tidak lagi
+menunggu import dan pembacaan file. Set ELEARNING_WARMUP=0 untuk
+menonaktifkan; artefak kemudian dimuat saat pertama kali dibutuhkan.
+"""
+import importlib
+import os
+import threading
+from concurrent.futures import Future
+
+# pandas sengaja tidak termasuk: plotly memeriksa sys.modules untuk pandas/numpy,
+# sehingga import setengah jadi dari thread lain dapat merusak render grafik.
+# Thread utama mengimpor pandas lebih dulu, baru kemudian warm-up dimulai.
+PREDICTION_MODULES = ['model_bundle', 'batch_predict', 'inference_engine', 'prediction_cube',
+                      'prediction_cache', 'model_registry']
+
+
+def warmup_enabled():
+    return os.environ.get('ELEARNING_WARMUP', '1') != '0'
+
+
+class Warmup:
+    """Menjalankan import + loader satu kali, di thread latar atau saat hasilnya diminta"""
+
+    def __init__(self, loader, modules=PREDICTION_MODULES):
+        self.loader = loader
+        self.modules = list(modules)
+        self._future = Future()
+        self._claimed = False
+        self._lock = threading.Lock()
+
+    def _claim(self):
+        with self._lock:
+            claimed, self._claimed = self._claimed, True
+        return not claimed
+
+    def _run(self):
+        self._future.set_running_or_notify_cancel()
+        try:
+            for module in self.modules:
+                importlib.import_module(module)
+            self._future.set_result(self.loader())
+        except BaseException as e:
+            self._future.set_exception(e)
+
+    def start(self):
+        """Memulai thread pemanasan (tidak melakukan apa pun jika dinonaktifkan)"""
+        if warmup_enabled() and self._claim():
+            threading.Thread(target=self._run, name='dashboard-warmup', daemon=True).start()
+        return self
+
+    def done(self):
+        return self._future.done()
+
+    def result(self):
+        """Hasil loader; menunggu thread latar atau menjalankan loader di thread ini"""
+        if self._claim():
+            self._run()
+        return self._future.result()
@@ -0,0 +1,44 @@
+"""Kurva what-if: probabilitas puas saat satu input digeser sepanjang slider,
+input lainnya tetap.
+
+Baris perturbasi untuk semua fitur (ditambah input asli) disusun menjadi satu
+matriks mentah dan diskor dengan satu panggilan engine, sehingga satu kurva
+lengkap untuk ketujuh slider hanya membutuhkan satu kali scoring. Engine yang
+dibungkus prediction cube menjawab seluruh matriks dengan lookup.
+"""
+import numpy as np
+
+from artifacts import expected_cols
+from prediction_cube import grid_values
+
+# Fitur slider di tab Prediksi (jenis_kelamin adalah pilihan, bukan kurva)
+WHATIF_FEATURES = [col for col in expected_cols if col != 'jenis_kelamin']
+
+
+def perturbation_matrix(x, features=WHATIF_FEATURES):
+    """Matriks input mentah: x dengan satu fitur diganti setiap nilai grid-nya
+
+    Baris terakhir adalah x sendiri. Mengembalikan (X, {fitur: slice baris}).
+    """
+    grids = [grid_values(col) for col in features]
+    X = np.tile(np.asarray(x, dtype=np.float64), (sum(map(len, grids)) + 1, 1))
+    slices, start = {}, 0
+    for col, grid in zip(features, grids):
+        rows = slice(start, start + len(grid))
+        X[rows, expected_cols.index(col)] = grid
+        slices[col] = rows
+        start = rows.stop
+    return X, slices
+
+
+def sensitivity_curves(engine, data, features=WHATIF_FEATURES):
+    """Kurva probabilitas puas per fitur untuk satu input dict (satu panggilan scoring)
+
+    Mengembalikan {'current': probabilitas input asli,
+    'curves': {fitur: (nilai grid, probabilitas puas)}}.
+    """
+    X, slices = perturbation_matrix(engine.encode(data), features)
+    probability = engine.predict_proba_puas(X)
+    curves = {col: (X[rows, expected_cols.index(col)], probability[rows])
+              for col, rows in slices.items()}
+    return {'current': float(probability[-1]), 'curves': curves}